@@ -0,0 +1,110 @@
+""" This module contains the autosaver for the Text-RPG game.
+The game takes a copy of its save data, which is cheap, and hands it to a background thread that does the slow part:
+adding the fields that changed since the last autosave to the autosave's save log (see saves.SaveLog).
+If several saves are asked for before the thread gets to them, only the newest is written, so the game loop never waits on the disk.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import atexit
+import threading
+from typing import Any
+
+import saves
+
+# ------------------ Autosaver ------------------ #
+
+AUTOSAVE_SLOT = "auto"
+
+
+class Autosaver:
+    """Writes saves on a background thread."""
+
+    def __init__(self, path: str | None = None, flush_on_exit: bool = True, directory: str = saves.SAVE_DIR):
+        """Initialises the autosaver. Its thread is started by the first save asked for,
+        so a game that is never saved, e.g. a player on the server who leaves from the main menu, never starts one.
+
+        Args:
+            path (str, optional): The file to save to. Defaults to the autosave slot in directory.
+            flush_on_exit (bool, optional): Writes any pending save when Python exits. Defaults to True.
+            directory (str, optional): The save folder of the game being saved, see GameData.save_dir. Defaults to saves.SAVE_DIR.
+        """
+        self.path = path or saves.save_path(AUTOSAVE_SLOT, directory)
+        self.saves_requested = 0
+        self.saves_written = 0
+        self.last_error: Exception | None = None
+
+        self.save_log = saves.SaveLog(self.path)
+
+        self._requested: dict[str, Any] | None = None  # The save data of the last request, None if it needs saving again.
+        self._pending: dict[str, Any] | None = None  # The save data waiting to be written.
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+
+        if flush_on_exit:
+            atexit.register(self.close)
+
+    def request(self, game_data) -> None:
+        """Asks for the game to be saved. This only copies the save data, the file is written later on the thread.
+
+        Args:
+            game_data (GameData): The game to save.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The autosaver has been closed.")
+
+            data = game_data.to_save()
+            if data == self._requested:
+                return  # Nothing has changed since the last autosave.
+            # Replaces anything that hasn't been written yet. The log works out what changed when it's written.
+            self._requested = self._pending = data
+            self.saves_requested += 1
+            if not self._thread.is_alive():
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until every requested save has been written.
+
+        Returns:
+            bool: False if the timeout ran out first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._writing, timeout
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Writes any pending save and stops the thread."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:  # Closed with nothing left to write.
+                    return
+                pending, self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                self.save_log.save(pending)
+                self.saves_written += 1
+            except Exception as error:  # The game carries on, the next autosave may well work.
+                self.last_error = error
+                with self._condition:
+                    self._requested = None  # This save wasn't written, so the next autosave is written even if nothing changed.
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
@@ -0,0 +1,220 @@
+""" This module contains benchmarks for the Text-RPG game, to check that changes made for speed actually help.
+Run it directly to print the results: python bench.py
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import copy
+import io
+import os
+import pickle
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Any
+
+import main_file
+import map
+import saves
+from topology import GridTopology
+from travel import TravelPlanner
+
+# ------------------ Helpers ------------------ #
+
+
+def measure(function: Callable[[], Any], number: int = 100_000) -> tuple[float, float]:
+    """Times a function and measures how much memory it allocates.
+
+    Args:
+        function (Callable[[], Any]): The function to measure.
+        number (int, optional): How many times to call it. Defaults to 100_000.
+
+    Returns:
+        tuple[float, float]: The time per call in microseconds, and the bytes allocated per call.
+    """
+    seconds = min(timeit.repeat(function, number=number, repeat=3))
+
+    tracemalloc.start()
+    results = [function() for _ in range(1000)]  # Kept alive so every allocation is counted.
+    _, allocated = tracemalloc.get_traced_memory()  # The peak, so temporary allocations count too.
+    tracemalloc.stop()
+    del results
+
+    return seconds / number * 1_000_000, allocated / 1000
+
+
+# ------------------ Enemy Spawning ------------------ #
+
+
+def bench_enemy_spawn(number: int = 100_000) -> dict[str, tuple[float, float]]:
+    """Compares copy.deepcopy, which battle() used to create enemies with, against Enemy.spawn()."""
+    prototype = main_file.enemy_data["House"]["Troll"]
+    return {
+        "deepcopy": measure(lambda: copy.deepcopy(prototype), number),
+        "spawn": measure(prototype.spawn, number),
+    }
+
+
+# ------------------ Saves ------------------ #
+
+
+# A save from before saves.py, when the game pickled its whole GameData, zone and all.
+LEGACY_SAVE = saves.save_path(1)
+
+
+def bench_saves(number: int = 10_000, legacy_save: str = LEGACY_SAVE) -> dict[str, tuple[float, float, int]]:
+    """Compares pickling the whole GameData, which the game used to save with, against the save format in saves.py.
+    Both save the same game, the one in an old pickled save.
+
+    Args:
+        number (int, optional): How many times to save and load in each format. Defaults to 10_000.
+        legacy_save (str, optional): The old pickled save. Defaults to LEGACY_SAVE.
+
+    Raises:
+        saves.SaveError: If legacy_save isn't an old pickled save, e.g. because it has been saved over in the game.
+
+    Returns:
+        dict[str, tuple[float, float, int]]: For each format, the microseconds to save, the microseconds to load,
+            and the size of the save in bytes.
+    """
+    with open(legacy_save, "rb") as file:
+        pickled = file.read()
+    if not pickled.startswith(b"\x80"):
+        raise saves.SaveError(f"{legacy_save} isn't an old pickled save, it may have been saved over.")
+
+    # The old GameData, as it was pickled, and the same game as it is played now.
+    def load_pickle() -> Any:
+        return saves._LegacyUnpickler(io.BytesIO(pickled)).load()
+
+    legacy_game_data = load_pickle()
+    game_data = main_file.GameData.from_save(saves.decode(pickled))
+    packed = saves.encode(game_data.to_save())
+
+    def time(function: Callable[[], Any]) -> float:
+        return min(timeit.repeat(function, number=number, repeat=3)) / number * 1_000_000
+
+    return {
+        "pickle": (time(lambda: pickle.dumps(legacy_game_data)), time(load_pickle), len(pickled)),
+        "saves": (
+            time(lambda: saves.encode(game_data.to_save())),
+            time(lambda: main_file.GameData.from_save(saves.decode(packed))),
+            len(packed),
+        ),
+    }
+
+
+# ------------------ Startup ------------------ #
+
+# The cold start to the main menu has to stay within this budget, and must not import any of these.
+STARTUP_BUDGET_MS = 150
+STARTUP_FORBIDDEN_IMPORTS = ("matplotlib", "networkx", "pytest")
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def bench_startup(runs: int = 5) -> dict[str, Any]:
+    """Measures importing main_file in a fresh Python, using -X importtime.
+
+    Args:
+        runs (int, optional): How many fresh Pythons to start, the fastest is used. Defaults to 5.
+
+    Returns:
+        dict[str, Any]: The import time of main_file and everything it imports in milliseconds ("total_ms"),
+            the ten slowest imports up to one level deep ("slowest", as (module, ms)) and every module imported ("modules").
+    """
+    best: dict[str, Any] | None = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import main_file"],
+            cwd=GAME_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Each line looks like "import time:  self [us] | cumulative | imported package", nested imports are indented.
+        imports = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            imports.append((name.rstrip(), int(cumulative) / 1000))
+
+        total = sum(ms for name, ms in imports if not name.startswith("  "))
+        if best is None or total < best["total_ms"]:
+            # Top level imports and the ones they import directly, e.g. main_file and map.
+            top_level = [(name.strip(), ms) for name, ms in imports if not name[3:].startswith(" ")]
+            best = {
+                "total_ms": total,
+                "slowest": sorted(top_level, key=lambda item: item[1], reverse=True)[:10],
+                "modules": {name.strip() for name, _ in imports},
+            }
+
+    return best
+
+
+def check_startup(budget_ms: float = STARTUP_BUDGET_MS) -> list[str]:
+    """Checks the cold start against its budget.
+
+    Returns:
+        list[str]: What went wrong, empty if the start up is within budget.
+    """
+    startup = bench_startup()
+    problems = []
+    if startup["total_ms"] > budget_ms:
+        problems.append(f"Start up took {startup['total_ms']:.1f} ms, over the budget of {budget_ms} ms.")
+    for module in startup["modules"]:
+        if module.split(".")[0] in STARTUP_FORBIDDEN_IMPORTS:
+            problems.append(f"{module} is imported at start up.")
+
+    return problems
+
+
+# ------------------ Travel ------------------ #
+
+
+def bench_travel(width: int = 1000, queries: int = 200, seed: int = 0) -> dict[str, float]:
+    """Times route queries between random zones of a width x width world.
+
+    Returns:
+        dict[str, float]: The mean milliseconds per query, and the mean length of the routes.
+    """
+    rng = random.Random(seed)
+    planner = TravelPlanner(GridTopology(width, width))
+    pairs = [(rng.randrange(width * width), rng.randrange(width * width)) for _ in range(queries)]
+
+    start = timeit.default_timer()
+    routes = [planner.route_ids(zone, goal) for zone, goal in pairs]
+    elapsed = timeit.default_timer() - start
+    return {
+        "route_ms": elapsed / len(pairs) * 1000,
+        "mean_moves": sum(len(route) for route in routes) / len(routes),
+    }
+
+
+# ------------------ __main__ ------------------ #
+
+
+def print_results(title: str, results: dict[str, tuple[float, float]]) -> None:
+    print(title)
+    for name, (microseconds, allocated) in results.items():
+        print(f"    {name:<12} {microseconds:>10.3f} us/call {allocated:>10.1f} bytes/call")
+
+
+if __name__ == "__main__":
+    print_results("Enemy spawning:", bench_enemy_spawn())
+    print("Saves:")
+    for name, (save_time, load_time, size) in bench_saves().items():
+        print(f"    {name:<12} save {save_time:>10.3f} us, load {load_time:>10.3f} us, {size:>8} bytes")
+    print("Travel on a 1000 x 1000 world:", {name: round(value, 3) for name, value in bench_travel().items()})
+    startup = bench_startup()
+    print(f"Start up: {startup['total_ms']:.1f} ms (budget {STARTUP_BUDGET_MS} ms)")
+    for module, ms in startup["slowest"]:
+        print(f"    {module:<30} {ms:>8.1f} ms")
+    for problem in check_startup():
+        print("    !", problem)
+    world = map.World()
+    world.map
+    print(f"Building the default world: {world.build_seconds * 1000:.1f} ms")
@@ -0,0 +1,99 @@
+""" This module contains the set up for the benchmark suite, and the check that fails benchmarks that have slowed down.
+The benchmarks use pytest-benchmark, which is in requirements.txt. Run them from the Game folder with: python -m pytest benchmarks
+Without it the run fails rather than skipping them, so a missing plugin can't look like a pass.
+Each benchmark's median is compared against its baseline in baselines.json, and the benchmark fails if it is more than
+REGRESSION_THRESHOLD slower. After a change that is meant to change the timings, or on a new machine, update the baselines
+with: python -m pytest benchmarks --update-baselines
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import json
+import os
+import sys
+
+import pytest
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = os.path.dirname(BENCHMARK_DIR)
+
+# The game's modules import each other by name, the same as when the game is run from the Game folder.
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+
+# ------------------ Settings ------------------ #
+
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baselines.json")
+
+# How much slower than its baseline a benchmark can get before it fails, e.g. 1.0 is twice as slow.
+# Timings of the same code vary by up to half again from one run to the next on a busy machine, so this only catches
+# real slow downs. On a quiet machine a lower limit can be given with --baseline-threshold.
+REGRESSION_THRESHOLD = 1.0
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("baselines")
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="Save every benchmark's median as its new baseline, instead of checking against the old one.",
+    )
+    group.addoption(
+        "--baseline-threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help=f"How much slower than its baseline a benchmark can get before it fails. Defaults to {REGRESSION_THRESHOLD}.",
+    )
+
+
+# ------------------ Baselines ------------------ #
+
+
+def load_baselines() -> dict[str, float]:
+    """Gets the median of each benchmark in seconds, by test name, e.g. {"test_enemy_selection": 1.2e-06}."""
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as file:
+        return json.load(file)
+
+
+def save_baselines(baselines: dict[str, float]) -> None:
+    with open(BASELINE_PATH, "w") as file:
+        json.dump(dict(sorted(baselines.items())), file, indent=4)
+        file.write("\n")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.pluginmanager.hasplugin("benchmark"):
+        raise pytest.UsageError("The benchmarks need pytest-benchmark, install it with: pip install -r requirements.txt")
+    config._baselines = load_baselines()
+    config._measured = {}
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    result = yield
+
+    benchmark = getattr(item, "funcargs", {}).get("benchmark")
+    if benchmark is None or benchmark.disabled or benchmark.stats is None:
+        return result
+
+    median = benchmark.stats.stats.median
+    item.config._measured[item.name] = median
+    baseline = item.config._baselines.get(item.name)
+    threshold = item.config.getoption("--baseline-threshold")
+    if not item.config.getoption("--update-baselines") and baseline is not None and median > baseline * (1 + threshold):
+        pytest.fail(
+            f"{item.name} has slowed down: its median is {median * 1e6:.1f} µs, "
+            f"{median / baseline - 1:.0%} slower than its baseline of {baseline * 1e6:.1f} µs "
+            f"(the limit is {threshold:.0%}).",
+            pytrace=False,
+        )
+    return result
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    if config.getoption("--update-baselines") and config._measured:
+        # Benchmarks that weren't run this time keep their old baselines.
+        save_baselines({**config._baselines, **config._measured})
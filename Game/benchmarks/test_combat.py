@@ -0,0 +1,58 @@
+""" This module contains the benchmarks for choosing enemies and fighting them. """
+
+# ------------------ Importing Modules ------------------ #
+
+import random
+
+import pytest
+
+import main_file
+import map
+import simulation
+from ports import ScriptedPort, using_port
+from rng import RandomStreams
+
+# ------------------ Fixtures ------------------ #
+
+
+def new_game_data():
+    # Home is in the House biome, the only one with enemies so far.
+    return main_file.GameData(
+        player=main_file.Warrior("Benchmark"),
+        zone=map.zone_data["A1"],
+        area=map.area_data["A1"]["Home"],
+        moveable_zones=["A2", "B1"],
+        game_is_running=True,
+        rng=RandomStreams(0),
+    )
+
+
+@pytest.fixture
+def game_data():
+    return new_game_data()
+
+
+# ------------------ Enemy Selection ------------------ #
+
+
+def test_enemy_selection(benchmark, game_data):
+    enemy = benchmark(main_file.enemy_selection, game_data)
+    assert enemy.name in main_file.enemy_data[game_data.area.biome]
+
+
+# ------------------ Battles ------------------ #
+
+
+def test_simulate_battle(benchmark):
+    # A whole fight worked out without any input or output, from the first attack to one side losing.
+    player = main_file.Warrior("Benchmark")
+    enemy = main_file.enemy_data["House"]["Troll"]
+    result = benchmark(simulation.simulate_battle, player, enemy, simulation.random_policy, random.Random(0))
+    assert result.outcome in (simulation.WIN, simulation.LOSS, simulation.TIMEOUT)
+
+
+def test_fight(benchmark):
+    # The game's own fight, played through a port that never pauses, attacking with the first move until it's over.
+    # Every round starts again from a new game with the same seed, so each one is the same fight.
+    with using_port(ScriptedPort(iter(lambda: "1", None), record=False)):
+        benchmark.pedantic(main_file.fight, setup=lambda: ((new_game_data(),), {}), rounds=200)
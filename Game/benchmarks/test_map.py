@@ -0,0 +1,58 @@
+""" This module contains the benchmarks for building the map and moving around it. """
+
+# ------------------ Importing Modules ------------------ #
+
+import pytest
+
+import map
+from topology import GridTopology
+from travel import TravelPlanner
+
+# A route query on a large world is made while the player waits, so the first one has to take under a millisecond.
+ROUTE_TIME_LIMIT = 0.001
+
+# ------------------ Map ------------------ #
+
+
+@pytest.mark.parametrize("size", [5, 100])
+def test_walk_map(benchmark, size):
+    # Builds the map, then gets the neighbours of every zone by name, the same way the game does when the player moves.
+    # The 5 by 5 map is the game's own, with its zone names. The larger one is a generated world, named A1, A2, ...
+    zone_names = map.zone_names if size == 5 else None
+
+    def walk_map():
+        zone_map = map.Map(size, size, zone_names).zone_map
+        return sum(len(list(zone_map.neighbors(zone))) for zone in zone_map.nodes)
+
+    assert benchmark(walk_map) == 2 * (2 * size * (size - 1))
+
+
+# ------------------ Moving ------------------ #
+
+
+def test_get_moveable_zones(benchmark):
+    zone = map.zone_data["C3"]
+    assert sorted(benchmark(zone.get_moveable_zones)) == ["B3", "C2", "C4", "D3"]
+
+
+def test_get_moveable_areas(benchmark):
+    area = map.area_data["A1"]["Home"]
+    assert benchmark(area.get_moveable_areas)
+
+
+# ------------------ Travel ------------------ #
+
+
+def test_first_route(benchmark):
+    # The longest route on a 1000 x 1000 world, from corner to corner, asked of a new planner each time,
+    # so nothing has been built for it yet.
+    topology = GridTopology(1000, 1000)
+    goal = len(topology) - 1
+
+    route = benchmark.pedantic(
+        lambda planner: planner.route_ids(0, goal),
+        setup=lambda: ((TravelPlanner(topology),), {}),
+        rounds=200,
+    )
+    assert len(route) == 1998
+    assert benchmark.stats.stats.median < ROUTE_TIME_LIMIT
@@ -0,0 +1,53 @@
+""" This module contains the benchmarks for saving and loading games. """
+
+# ------------------ Importing Modules ------------------ #
+
+import pytest
+
+import main_file
+import map
+import saves
+
+# ------------------ Saves ------------------ #
+
+
+@pytest.fixture
+def game_data():
+    return main_file.GameData(
+        player=main_file.Warrior("Benchmark"),
+        zone=map.zone_data["B2"],
+        area=map.area_data["B2"][map.zone_data["B2"].areas[0][0]],
+        moveable_zones=["A2", "B1", "B3", "C2"],
+        game_is_running=True,
+    )
+
+
+def test_save_round_trip(benchmark, game_data, tmp_path):
+    # What exporting and then importing a save does, without the menus: written safely to a file and read back.
+    path = str(tmp_path / "save1.txt")
+
+    def round_trip():
+        saves.save(path, game_data.to_save())
+        return main_file.GameData.from_save(saves.load(path))
+
+    loaded = benchmark(round_trip)
+    assert loaded.to_save() == game_data.to_save()
+
+
+def test_encode_round_trip(benchmark, game_data):
+    # The same without the file, which is most of the time above on a fast disk.
+    loaded = benchmark(lambda: main_file.GameData.from_save(saves.decode(saves.encode(game_data.to_save()))))
+    assert loaded.to_save() == game_data.to_save()
+
+
+def test_save_changes(benchmark, game_data, tmp_path):
+    # Saving after one change to the player, which only adds that change to the end of the save log.
+    path = str(tmp_path / "save1.txt")
+    game_data.save(path)
+
+    def save_change():
+        game_data.player.gold += 1
+        game_data.save(path)
+
+    benchmark(save_change)
+    assert saves.load(path) == game_data.to_save()
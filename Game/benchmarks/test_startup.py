@@ -0,0 +1,24 @@
+""" This module contains the benchmark for starting the game. """
+
+# ------------------ Importing Modules ------------------ #
+
+import subprocess
+import sys
+
+import bench
+from conftest import GAME_DIR
+
+# ------------------ Startup ------------------ #
+
+
+def test_cold_import(benchmark):
+    # Imports main_file in a new Python every round, so nothing is already imported. This includes starting Python itself.
+    def cold_import():
+        subprocess.run([sys.executable, "-c", "import main_file"], cwd=GAME_DIR, check=True)
+
+    benchmark.pedantic(cold_import, rounds=10, warmup_rounds=1)
+
+
+def test_startup_budget():
+    # The start up stays within its budget, and modules only some features need, like numpy, aren't imported at start up.
+    assert bench.check_startup() == []
@@ -0,0 +1,194 @@
+""" This module loads the game's content (zones, areas and enemies) from the JSON files in the Data folder.
+The files are checked when they are loaded, and the result is cached in a binary file named after a hash of their contents.
+While the files haven't changed, starting the game only reads the cache, skipping parsing and checking altogether.
+Editing the files changes the hash, so the next start rebuilds the cache on its own.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import hashlib
+import json
+import os
+import pickle
+from typing import Any
+
+import saves
+
+# ------------------ Files ------------------ #
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Data")
+CONTENT_FILES = ("zones.json", "enemies.json")
+
+# Bump this when the compiled layout changes, so old caches aren't used.
+CACHE_VERSION = 1
+
+
+class ContentError(Exception):
+    """Raised when a content file is missing something or has the wrong type of value."""
+
+
+# ------------------ Validation ------------------ #
+
+
+def _check(condition: bool, file: str, where: str, problem: str) -> None:
+    if not condition:
+        raise ContentError(f"{file}: {where}: {problem}")
+
+
+def _check_fields(item: Any, fields: dict[str, type], file: str, where: str) -> None:
+    _check(isinstance(item, dict), file, where, "expected an object")
+    for field, field_type in fields.items():
+        _check(field in item, file, where, f"missing {field!r}")
+        value = item[field]
+        # bool is a subclass of int, but true/false is never a valid stat.
+        _check(
+            isinstance(value, field_type) and not (field_type is int and isinstance(value, bool)),
+            file,
+            f"{where}.{field}",
+            f"expected {field_type.__name__}, got {type(value).__name__}",
+        )
+
+
+ZONE_FIELDS = {"name": str, "description": str, "areas": list}
+AREA_FIELDS = {"name": str, "description": str, "biome": str, "difficulty": int}
+ENEMY_FIELDS = {"name": str, "difficulty": int, "health": int, "attack": int, "defense": int, "magic": int, "biome": str}
+
+
+def compile_zones(data: Any, file: str = "zones.json") -> tuple[tuple, ...]:
+    """Checks the zones file and compiles it into tuples.
+
+    Returns:
+        tuple[tuple, ...]: (name, description, areas) for each zone,
+            where areas is (name, description, biome, difficulty) for each area.
+    """
+    _check(isinstance(data, dict) and isinstance(data.get("zones"), list), file, "zones", "expected a list")
+    zones = []
+    zone_names = set()
+    for i, zone in enumerate(data["zones"]):
+        where = f"zones[{i}]"
+        _check_fields(zone, ZONE_FIELDS, file, where)
+        _check(zone["name"] not in zone_names, file, where, f"zone {zone['name']!r} is defined twice")
+        zone_names.add(zone["name"])
+        _check(len(zone["areas"]) > 0, file, where, "a zone needs at least one area")
+
+        areas = []
+        area_names = set()
+        for j, area in enumerate(zone["areas"]):
+            area_where = f"{where}.areas[{j}]"
+            _check_fields(area, AREA_FIELDS, file, area_where)
+            _check(area["name"] not in area_names, file, area_where, f"area {area['name']!r} is defined twice")
+            _check(0 <= area["difficulty"] <= 100, file, f"{area_where}.difficulty", "must be between 0 and 100")
+            area_names.add(area["name"])
+            areas.append((area["name"], area["description"], area["biome"], area["difficulty"]))
+
+        zones.append((zone["name"], zone["description"], tuple(areas)))
+
+    return tuple(zones)
+
+
+def compile_enemies(data: Any, file: str = "enemies.json") -> dict[str, tuple[tuple, ...]]:
+    """Checks the enemies file and compiles it.
+
+    Returns:
+        dict[str, tuple[tuple, ...]]: For each biome, (name, difficulty, health, attack, defense, magic, biome)
+            for each enemy, in the same order as Enemy's arguments.
+    """
+    _check(isinstance(data, dict) and isinstance(data.get("biomes"), dict), file, "biomes", "expected an object")
+    biomes = {}
+    for biome, enemies in data["biomes"].items():
+        where = f"biomes.{biome}"
+        _check(isinstance(enemies, list), file, where, "expected a list")
+        compiled = []
+        for i, enemy in enumerate(enemies):
+            _check_fields(enemy, ENEMY_FIELDS, file, f"{where}[{i}]")
+            compiled.append(tuple(enemy[field] for field in ENEMY_FIELDS))
+        biomes[biome] = tuple(compiled)
+
+    return biomes
+
+
+# ------------------ Loading ------------------ #
+
+
+def _read_files(data_dir: str) -> dict[str, bytes]:
+    contents = {}
+    for file in CONTENT_FILES:
+        with open(os.path.join(data_dir, file), "rb") as opened:
+            contents[file] = opened.read()
+    return contents
+
+
+def content_hash(contents: dict[str, bytes]) -> str:
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    for file in sorted(contents):
+        digest.update(file.encode())
+        digest.update(len(contents[file]).to_bytes(8, "little"))
+        digest.update(contents[file])
+    return digest.hexdigest()
+
+
+def compile_content(contents: dict[str, bytes]) -> dict[str, Any]:
+    """Parses and checks the raw content files."""
+    compiled = {}
+    for file, compiler, key in (
+        ("zones.json", compile_zones, "zones"),
+        ("enemies.json", compile_enemies, "enemies"),
+    ):
+        try:
+            data = json.loads(contents[file])
+        except json.JSONDecodeError as error:
+            raise ContentError(f"{file}: {error}") from error
+        compiled[key] = compiler(data, file)
+
+    return compiled
+
+
+def load_content(data_dir: str = DATA_DIR, cache_dir: str | None = None, use_cache: bool = True) -> dict[str, Any]:
+    """Loads the game's content, from the cache if the files haven't changed since it was made.
+
+    Args:
+        data_dir (str, optional): The folder with the content files. Defaults to the Data folder.
+        cache_dir (str, optional): The folder for compiled caches. Defaults to .cache inside data_dir.
+        use_cache (bool, optional): Set to False to always parse the files, without reading or writing a cache.
+
+    Raises:
+        ContentError: If a content file isn't valid.
+
+    Returns:
+        dict[str, Any]: The compiled "zones" (see compile_zones) and "enemies" (see compile_enemies).
+    """
+    contents = _read_files(data_dir)
+    if not use_cache:
+        return compile_content(contents)
+
+    cache_dir = cache_dir or os.path.join(data_dir, ".cache")
+    cache_path = os.path.join(cache_dir, f"content-{content_hash(contents)}.pickle")
+    try:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # No cache yet for these files, or it's damaged, so it's rebuilt below.
+
+    compiled = compile_content(contents)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Caches for older versions of the files are no longer needed.
+        for old_cache in os.listdir(cache_dir):
+            if old_cache.startswith("content-") and old_cache.endswith(".pickle"):
+                os.remove(os.path.join(cache_dir, old_cache))
+        saves.atomic_write(cache_path, pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # A read-only install still works, it just parses the files every time.
+
+    return compiled
+
+
+_loaded: dict[str, Any] | None = None
+
+
+def get_content() -> dict[str, Any]:
+    """Gets the game's content, loading it the first time. map.py and main_file.py share the one copy."""
+    global _loaded
+    if _loaded is None:
+        _loaded = load_content()
+    return _loaded
@@ -0,0 +1,246 @@
+""" This module contains the game's instrumentation, which measures where the time goes while playing.
+It is off unless it's turned on, either before starting with TEXT_RPG_INSTRUMENT=1,
+or while playing in the console with the profiling option of the interact menu, and costs one check per call while it's off.
+
+Timed functions count their calls and their wall time, not counting time spent waiting:
+pauses, the typewriter's delay between characters and waiting for the player to answer are counted separately,
+so the timings show the time the game itself takes, which the sleeps usually hide.
+Profiling also runs cProfile, and saves what it captured for pstats or a viewer like snakeviz.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+from lazy import lazy_import
+
+# Only loaded when profiling starts, they take longer to import than the rest of the game's start up.
+cProfile = lazy_import("cProfile")
+pstats = lazy_import("pstats")
+
+# ------------------ Settings ------------------ #
+
+ENV_VAR = "TEXT_RPG_INSTRUMENT"
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Profiles")
+
+enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+# ------------------ Waiting ------------------ #
+# Each thread keeps its own total, so sessions on the server don't count each other's waits.
+
+_local = threading.local()
+
+
+def waited() -> float:
+    """Gets the seconds this thread has spent waiting while instrumentation was on."""
+    return getattr(_local, "waited", 0.0)
+
+
+@contextmanager
+def waiting() -> Iterator[None]:
+    """Counts the time spent in a with block as waiting, rather than as the game's own time."""
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.waited = waited() + time.perf_counter() - start
+
+
+def sleep(seconds: float) -> None:
+    """The same as time.sleep, but counted as waiting."""
+    if not enabled:
+        time.sleep(seconds)
+        return
+    with waiting():
+        time.sleep(seconds)
+
+
+# ------------------ Timers and Counters ------------------ #
+
+
+class Timer:
+    """The calls to one timed function."""
+
+    __slots__ = ("calls", "seconds", "max_seconds", "waited_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0  # Not counting waiting.
+        self.max_seconds = 0.0
+        self.waited_seconds = 0.0
+
+    def add(self, seconds: float, waited_seconds: float) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.waited_seconds += waited_seconds
+
+
+timers: dict[str, Timer] = {}
+counters: dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """Times every call to a function while instrumentation is on, e.g. @timed("battle").
+    Calls to timed functions inside it are counted in both, so the times of nested functions add up to more than the total.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not enabled:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            waited_before = waited()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                waited_seconds = waited() - waited_before
+                seconds = time.perf_counter() - start - waited_seconds
+                with _lock:
+                    timer = timers.get(name)
+                    if timer is None:
+                        timer = timers[name] = Timer()
+                    timer.add(seconds, waited_seconds)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Adds to a counter while instrumentation is on, e.g. count("encounters")."""
+    if enabled:
+        with _lock:
+            counters[name] = counters.get(name, 0) + amount
+
+
+def reset() -> None:
+    with _lock:
+        timers.clear()
+        counters.clear()
+    _local.waited = 0.0
+
+
+def report() -> dict[str, dict[str, float]]:
+    """Gets the timings so far.
+
+    Returns:
+        dict[str, dict[str, float]]: For each timed function, its calls and its total, mean and max time in milliseconds,
+            not counting waiting, and the milliseconds it spent waiting. Slowest in total first.
+    """
+    with _lock:
+        items = sorted(timers.items(), key=lambda item: item[1].seconds, reverse=True)
+        return {
+            name: {
+                "calls": timer.calls,
+                "total_ms": timer.seconds * 1000,
+                "mean_ms": timer.seconds / timer.calls * 1000,
+                "max_ms": timer.max_seconds * 1000,
+                "waited_ms": timer.waited_seconds * 1000,
+            }
+            for name, timer in items
+        }
+
+
+def format_report() -> list[str]:
+    """Gets the timings and counters as lines of text, to show to the player."""
+    lines = [f"{'':<18}{'calls':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}{'waited ms':>12}"]
+    for name, timing in report().items():
+        lines.append(
+            f"{name:<18}{timing['calls']:>8}{timing['total_ms']:>12.2f}{timing['mean_ms']:>10.3f}"
+            f"{timing['max_ms']:>10.3f}{timing['waited_ms']:>12.0f}"
+        )
+    for name, value in sorted(counters.items()):
+        lines.append(f"{name:<18}{value:>8}")
+    return lines
+
+
+# ------------------ Profiling ------------------ #
+
+_profiler: "cProfile.Profile | None" = None
+
+
+def is_profiling() -> bool:
+    return _profiler is not None
+
+
+def start_profiling() -> None:
+    """Turns instrumentation on and starts cProfile on this thread, with fresh timings."""
+    global _profiler
+    if _profiler is not None:
+        return
+    reset()
+    enable()
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+
+def _new_profile_path() -> str:
+    """Makes an empty file for a new profile in PROFILE_DIR, named after the time, and gets its path.
+    Profiles stopped in the same second, by this game or another, are numbered after the first, e.g. profile-...-2.prof.
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stem = os.path.join(PROFILE_DIR, f"profile-{time.strftime('%Y%m%d-%H%M%S')}")
+    number = 1
+    while True:
+        path = f"{stem}.prof" if number == 1 else f"{stem}-{number}.prof"
+        try:
+            # Creating the file claims the name, so two profiles can never be given the same one.
+            with open(path, "x"):
+                return path
+        except FileExistsError:
+            number += 1
+
+
+def stop_profiling(path: str | None = None) -> str:
+    """Stops cProfile and saves what it captured. Instrumentation stays on if it was turned on with ENV_VAR.
+
+    Args:
+        path (str, optional): Where to save the profile. Defaults to a new file in PROFILE_DIR named after the time.
+
+    Returns:
+        str: The path of the profile, which can be read with pstats or opened with snakeviz.
+    """
+    global _profiler
+    if _profiler is None:
+        raise RuntimeError("Profiling hasn't been started.")
+    _profiler.disable()
+    if path is None:
+        path = _new_profile_path()
+    _profiler.dump_stats(path)
+    _profiler = None
+    if os.environ.get(ENV_VAR, "") in ("", "0"):
+        disable()
+    return path
+
+
+def top_functions(path: str, limit: int = 10) -> list[str]:
+    """Gets the functions that took the most time in a saved profile, as lines of text."""
+    stats = pstats.Stats(path)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]  # item[1][3] is cumulative time.
+    return [
+        f"{cumulative * 1000:>10.1f} ms  {calls:>8} calls  {function}:{line} ({os.path.basename(file)})"
+        for (file, line, function), (_, calls, _, cumulative, _) in rows
+    ]
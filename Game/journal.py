@@ -0,0 +1,310 @@
+""" This module contains the replay journal, which records a game so it can be played again exactly, at full speed.
+Everything random in a game comes from its seed (see rng.py), so a game is decided by its seed, the state it started in,
+the player's answers and any saves it loaded. A journal records those, one line each, as the game goes:
+
+    TRPG-JOURNAL 1
+    seed 8302942810931
+    state main_menu
+    ask 1
+    ask Bob
+    load save1.txt VFJQ...  The save that was imported, so the replay doesn't depend on the save files still being the same.
+    end exit                How the game ended, if it did.
+
+Lines are only ever added to the end, and each one is written as soon as it happens, so a journal is kept even if the game crashes.
+replay() plays a journal through the game's own logic with a ScriptedPort, which never pauses,
+so a bug report or a slow session can be reproduced in milliseconds, and a save can be rebuilt from the final game data.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import base64
+import os
+from typing import Any, NamedTuple, TextIO
+
+import saves
+from ports import IOPort, ScriptedPort, ScriptFinished, get_port, using_port
+
+# ------------------ Format ------------------ #
+
+HEADER = "TRPG-JOURNAL 1"
+
+# The kinds of line in a journal.
+SEED = "seed"
+STATE = "state"
+ASK = "ask"
+LOAD = "load"
+LOAD_FAILED = "load_failed"
+END = "end"
+
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Journals")
+
+
+class JournalError(Exception):
+    """Raised when a journal can't be read, or its replay asks for something different from what was recorded."""
+
+
+class Journal:
+    """Writes a game's journal, one line at a time."""
+
+    def __init__(self, path: str, seed: int, state: str):
+        """Starts a new journal. The file mustn't already exist, so a journal is never written over.
+
+        Args:
+            path (str): Where to write the journal.
+            seed (int): The seed of the game's random streams.
+            state (str): The state the game starts in.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Line buffered, so every line is written as soon as it is recorded.
+        self._file: TextIO = open(path, "x", encoding="utf-8", buffering=1)
+        self._file.write(HEADER + "\n")
+        self.record(SEED, str(seed))
+        self.record(STATE, state)
+
+    def record(self, kind: str, text: str = "") -> None:
+        # Answers come from one line of input, so they never contain a new line. Anything else would end the line early.
+        self._file.write(f"{kind} {text.replace(chr(10), ' ')}\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JournalEntries(NamedTuple):
+    """A journal that has been read back."""
+
+    seed: int
+    state: str
+    events: list[tuple[str, str]]  # (kind, text) for every line after the header, in order.
+
+    @property
+    def end(self) -> str | None:
+        """The state the game ended in, or None if the journal stops before the game ended."""
+        kind, text = self.events[-1] if self.events else ("", "")
+        return text if kind == END else None
+
+
+def read_journal(path: str) -> JournalEntries:
+    """Reads a journal. A half written last line, from a game that crashed while writing it, is ignored.
+
+    Raises:
+        JournalError: If the file isn't a journal.
+    """
+    with open(path, encoding="utf-8") as file:
+        contents = file.read()
+
+    lines = contents.split("\n")
+    lines.pop()  # Either empty, after the last new line, or a half written line.
+    if len(lines) < 3 or lines[0] != HEADER:
+        raise JournalError(f"{path} isn't a journal.")
+
+    events = [tuple(line.split(" ", 1)) for line in lines[1:]]
+    (seed_kind, seed), (state_kind, state) = events[:2]
+    if seed_kind != SEED or state_kind != STATE:
+        raise JournalError(f"{path} doesn't start with its seed and state.")
+    return JournalEntries(int(seed), state, events[2:])
+
+
+# ------------------ Ports ------------------ #
+
+
+class RecordingPort(IOPort):
+    """Plays through another port, recording every answer in a journal."""
+
+    name = "recording"
+
+    def __init__(self, port: IOPort, journal: Journal):
+        self.port = port
+        self.journal = journal
+
+    @property
+    def local(self) -> bool:
+        return self.port.local
+
+    def ask(self, prompt: str = "") -> str:
+        answer = self.port.ask(prompt)
+        self.journal.record(ASK, answer)
+        return answer
+
+    def write(self, lines: list[str], delay: float = 0.0, sep: str = "", end: str = "\n") -> None:
+        self.port.write(lines, delay, sep, end)
+
+    def say(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        self.port.say(*values, sep=sep, end=end)
+
+    def pause(self, seconds: float) -> None:
+        self.port.pause(seconds)
+
+    def clear(self) -> None:
+        self.port.clear()
+
+
+class ReplayPort(ScriptedPort):
+    """Plays a journal back at full speed. Saves are read from the journal, and exported saves are kept in saved
+    instead of being written, so replaying never changes the save files.
+    """
+
+    name = "replay"
+
+    def __init__(self, entries: JournalEntries, record: bool = True):
+        self.events = iter(entries.events)
+        self.saved: dict[str, dict[str, Any]] = {}  # The data of each save the game exported, by path.
+        super().__init__(self._answers(), record=record)
+
+    def _answers(self):
+        for kind, text in self.events:
+            if kind == ASK:
+                yield text
+            elif kind == END:
+                return
+            else:
+                raise JournalError(f"The game asked for an answer, but the journal has {kind} next.")
+
+    def next_load(self) -> dict[str, Any]:
+        try:
+            kind, text = next(self.events)
+        except StopIteration:
+            raise ScriptFinished from None
+        if kind == LOAD:
+            return saves.decode(base64.b64decode(text.split(" ", 1)[1]))
+        if kind == LOAD_FAILED:
+            raise saves.SaveError(text.split(" ", 1)[1])
+        raise JournalError(f"The game loaded a save, but the journal has {kind} next.")
+
+
+# ------------------ Saves ------------------ #
+# The game loads and exports saves through these, so they can be recorded and replayed.
+
+
+def load_save(path: str) -> dict[str, Any]:
+    """Loads a save, the same as saves.load(), recording it if the game is being recorded.
+
+    Raises:
+        OSError: If the save can't be read.
+        saves.SaveError: If the file isn't a valid save.
+    """
+    port = get_port()
+    if isinstance(port, ReplayPort):
+        return port.next_load()
+
+    name = os.path.basename(path)
+    try:
+        data = saves.load(path)
+    except (OSError, saves.SaveError) as error:
+        if isinstance(port, RecordingPort):
+            port.journal.record(LOAD_FAILED, f"{name} {error}")
+        raise
+
+    if isinstance(port, RecordingPort):
+        # Recorded in the current format, so old saves replay the same as they loaded, after being migrated.
+        port.journal.record(LOAD, f"{name} {base64.b64encode(saves.encode(data)).decode('ascii')}")
+    return data
+
+
+def write_save(path: str, game_data: Any) -> None:
+    """Exports a save with GameData.save(), unless the game is being replayed."""
+    port = get_port()
+    if isinstance(port, ReplayPort):
+        port.saved[path] = game_data.to_save()
+        return
+    game_data.save(path)
+
+
+# ------------------ Recording & Replaying ------------------ #
+
+
+def journal_path(label: str) -> str:
+    """Gets the path of a journal in the journal folder, e.g. journal_path("session-12")."""
+    return os.path.join(JOURNAL_DIR, f"{label}.journal")
+
+
+class Replay(NamedTuple):
+    """What replaying a journal ended with."""
+
+    game_data: Any  # main_file.GameData, the game as it was at the end of the journal.
+    end: str | None  # The state the game ended in, or None if the journal stopped before it ended.
+    port: ReplayPort  # Holds everything the game showed, in output, and any saves it exported, in saved.
+
+
+def play(
+    path: str,
+    seed: int | None = None,
+    state: str | None = None,
+    port: IOPort | None = None,
+    save_dir: str = saves.SAVE_DIR,
+) -> str:
+    """Plays a new game, recording it in a journal.
+
+    Args:
+        path (str): Where to write the journal, e.g. journal_path("game-1").
+        seed (int, optional): The game's seed. Defaults to None, which picks a random one.
+        state (str, optional): The state to start in. Defaults to None, which starts at the main menu.
+        port (IOPort, optional): The port to play through. Defaults to None, which uses the current one.
+        save_dir (str, optional): The folder the game's save slots are in. Defaults to saves.SAVE_DIR.
+
+    Returns:
+        str: The state the game ended in.
+    """
+    # Imported here, as main_file loads and exports saves through this module.
+    import main_file
+    from rng import RandomStreams
+
+    state = state or main_file.MAIN_MENU
+    game_data = main_file.new_game_data(RandomStreams(seed), save_dir=save_dir)
+    journal = Journal(path, game_data.rng.seed, state)
+    try:
+        with using_port(RecordingPort(port or get_port(), journal)):
+            try:
+                end = main_file.run(game_data, state=state)
+            except SystemExit:
+                journal.record(END, main_file.EXIT)  # Some menus still call exit().
+                raise
+        journal.record(END, end)
+        return end
+    finally:
+        journal.close()
+
+
+def replay(path: str, record: bool = True) -> Replay:
+    """Replays a journal through the game's logic, at full speed.
+
+    Args:
+        path (str): The journal to replay.
+        record (bool, optional): Keeps everything the game showed in the port's output. Defaults to True.
+
+    Raises:
+        JournalError: If the game does something different from what was recorded, e.g. because the game has changed since.
+
+    Returns:
+        Replay: The game data at the end, how it ended, and the port it was replayed through.
+    """
+    import main_file
+    from rng import RandomStreams
+
+    entries = read_journal(path)
+    game_data = main_file.new_game_data(RandomStreams(entries.seed))
+    port = ReplayPort(entries, record=record)
+
+    end = None
+    with using_port(port):
+        try:
+            end = main_file.run(game_data, state=entries.state)
+        except ScriptFinished:
+            pass  # The journal stopped before the game did, e.g. the player disconnected or the game crashed.
+        except SystemExit:
+            end = main_file.EXIT  # Some menus still call exit().
+
+    if entries.end is not None and end != entries.end:
+        raise JournalError(f"The game ended in {end}, but the journal ended in {entries.end}.")
+    return Replay(game_data, end, port)
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    import sys
+
+    # python journal.py <journal> replays a journal and prints what the game showed.
+    result = replay(sys.argv[1])
+    print(result.port.text)
+    print(f"Ended in: {result.end}")
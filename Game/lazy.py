@@ -0,0 +1,47 @@
+""" This module contains a lazy importer, used to put off importing large libraries until they are actually needed.
+For example, matplotlib takes longer to import than the rest of the game put together, but is only used to draw the map.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+# ------------------ Lazy Module ------------------ #
+
+
+class LazyModule:
+    """Stands in for a module, importing it the first time one of its attributes is used."""
+
+    def __init__(self, name: str):
+        """Initialises the lazy module. Nothing is imported yet.
+
+        Args:
+            name (str): The full name of the module, e.g. "matplotlib.pyplot".
+        """
+        self._name = name
+        self._module: ModuleType | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None or self._name in sys.modules
+
+    def load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute: str) -> Any:
+        # Only called for attributes that aren't found normally, so _name and _module never end up here.
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Gets a stand-in for a module that is imported on first use, e.g. plt = lazy_import("matplotlib.pyplot")."""
+    return LazyModule(name)
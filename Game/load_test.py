@@ -0,0 +1,147 @@
+""" This module contains the load test for the game server (see server.py).
+It connects many simulated players at once, each answering the game's prompts the way a simple player would,
+and measures the latency of every command: the time from sending a line until the server asks for the next one.
+Run it directly to load test a server started in the same process: python load_test.py
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import asyncio
+import random
+import time
+
+from server import GameServer
+
+# ------------------ Simulated Player ------------------ #
+
+
+def choose_answer(output: list[str], prompt: str, rng: random.Random) -> str:
+    """Answers a prompt from the output that came before it, like a player who wanders about and fights what they meet.
+
+    Args:
+        output (list[str]): The lines the game wrote since the last answer.
+        prompt (str): The prompt the game is asking with.
+        rng (random.Random): Picks between the interact menu's options.
+
+    Returns:
+        str: The line to send.
+    """
+    text = "\n".join(output)
+    if "select a class" in text:
+        return "Warrior"  # The only class with attack moves so far, so the others can't finish a battle.
+    if "character's name" in text:
+        return f"Player{rng.randrange(1_000_000)}"
+    if "1. Move zone" in text:
+        return rng.choice(("1", "2", "4"))  # Move zone, move area or view stats.
+    # Everything else, from the main menu to choosing an attack, takes 1 as a sensible answer.
+    return "1"
+
+
+class PlayerResult:
+    """The latencies one simulated player saw, in seconds."""
+
+    __slots__ = ("latencies", "end")
+
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.end = ""
+
+
+async def play(address: str | tuple[str, int], commands: int, seed: int) -> PlayerResult:
+    """Connects one simulated player, and plays until it has sent a number of commands or the session ends."""
+    rng = random.Random(seed)
+    result = PlayerResult()
+    if isinstance(address, str):
+        reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        reader, writer = await asyncio.open_connection(*address)
+
+    output: list[str] = []
+    sent_at: float | None = None
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                result.end = "closed"
+                break
+            kind, _, text = line.decode("utf-8").rstrip("\n").partition(" ")
+            if kind == "OUT":
+                output.append(text)
+            elif kind == "ASK":
+                if sent_at is not None:
+                    result.latencies.append(time.perf_counter() - sent_at)
+                if len(result.latencies) >= commands:
+                    result.end = "done"
+                    break
+                answer = choose_answer(output, text, rng)
+                output.clear()
+                sent_at = time.perf_counter()
+                writer.write(f"{answer}\n".encode("utf-8"))
+            elif kind == "END":
+                result.end = text
+                break
+    finally:
+        writer.close()
+    return result
+
+
+# ------------------ Load Test ------------------ #
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(percent / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+async def load_test(
+    players: int = 1000,
+    commands: int = 50,
+    address: str | tuple[str, int] | None = None,
+    seed: int = 0,
+) -> dict[str, float]:
+    """Connects many simulated players at the same time and reports the command latency.
+
+    Args:
+        players (int, optional): How many players to connect at once. Defaults to 1000.
+        commands (int, optional): How many commands each player sends. Defaults to 50.
+        address (str | tuple[str, int], optional): The server to test, a Unix socket path or (host, port).
+            Defaults to None, which starts a server in this process on a free port.
+        seed (int, optional): Seeds the players' choices. Defaults to 0.
+
+    Returns:
+        dict[str, float]: The number of players and commands, the commands per second,
+            and the p50, p99 and max latency in milliseconds.
+    """
+    server = None
+    if address is None:
+        server = GameServer(port=0)
+        await server.start()
+        address = server.address
+
+    start = time.perf_counter()
+    try:
+        results = await asyncio.gather(*(play(address, commands, seed + player) for player in range(players)))
+    finally:
+        if server is not None:
+            await server.close()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for result in results for latency in result.latencies)
+    return {
+        "players": players,
+        "commands": len(latencies),
+        "commands_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+        "errors": sum(result.end.startswith("error") for result in results),
+    }
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    for name, value in asyncio.run(load_test()).items():
+        print(f"{name:<20} {value:>12.2f}" if isinstance(value, float) else f"{name:<20} {value:>12}")
@@ -6,19 +6,56 @@
 # rting Modules ------------------ #
 
 import random
-from time import sleep
 import os
-import copy
-import pickle
 import abc
+import autosave
+import instrument
+import journal
 import map
+import saves
+from content import get_content
 from map import sprint
+from ports import ask, clear, get_port, pause, say
+from rng import RandomStreams
+from spawn_tables import SpawnTables
+
+
+# ------------------ Stat Block ------------------ #
+
+
+class Slotted:
+    """A base for the classes created in large numbers. They use slots instead of a __dict__,
+    which makes every object smaller and reading its attributes quicker.
+    """
+
+    __slots__ = ()
+
+    def __setstate__(self, state) -> None:
+        # Pickles made before these classes used slots store their attributes in a dict,
+        # and pickles made since store (None, {slot: value}), so both are set one by one.
+        if isinstance(state, tuple):
+            dict_state, state = state
+            state = {**(dict_state or {}), **(state or {})}
+        for attribute, value in state.items():
+            # Attributes that were removed from a class are left behind, rather than stopping an old save from loading.
+            try:
+                setattr(self, attribute, value)
+            except AttributeError:
+                pass
+
+
+class StatBlock(Slotted):
+    """The stats shared by the player and enemies."""
+
+    __slots__ = ("name", "health", "attack", "defense", "magic")
 
 
 # ------------------ Attack Move Class ------------------ #
 
 
-class AttackMove:
+class AttackMove(Slotted):
+    __slots__ = ("name", "damage", "defensive", "defense_bonus")
+
     def __init__(
         self, name: str, damage: int, defensive: bool = False, defense_bonus: int = 0
     ):
@@ -27,13 +64,22 @@ class AttackMove:
         self.defensive = defensive
         self.defense_bonus = defense_bonus
 
+    def damage_against(self, enemy) -> int:
+        """Works out the damage this move deals to an enemy, which can't go below 0."""
+        damage_dealt = self.damage - enemy.defense
+        if damage_dealt < 0:
+            damage_dealt = 0
+
+        return damage_dealt
+
 
 # ------------------ Setting Character ------------------ #
 
 
-class Character(abc.ABC):
+class Character(StatBlock, abc.ABC):
     # Prevent this class from being instantiated
     __metaclass__ = abc.ABCMeta
+    __slots__ = ("level", "exp", "gold", "points", "attack_moves")
 
     @abc.abstractmethod
     def __init__(self, name, health, attack, defense, magic):
@@ -46,7 +92,8 @@ class Character(abc.ABC):
         self.exp = 0
         self.gold = 0
         self.points = 5
-        self.attack_moves = []
+        # Every class replaces these with its own moves. A plain strike means a class without any can still fight.
+        self.attack_moves = [AttackMove("Strike", attack)]
 
     def __str__(self):
         return f"Class: {self.__class__.__name__}, Name: {self.name}, Health: {self.health}, Attack: {self.attack}, Defense: {self.defense}, Magic: {self.magic}, Level: {self.level}"
@@ -65,26 +112,26 @@ class Character(abc.ABC):
         chosen_move = ""
         while True:
             try:
-                chosen_move = int(input("> "))
-                if chosen_move > len(self.attack_moves):
+                chosen_move = int(ask("> "))
+                if not 1 <= chosen_move <= len(self.attack_moves):
                     raise ValueError
                 break
             except ValueError:
                 sprint("Please enter a valid number.")
 
         sprint(f"You used {self.attack_moves[chosen_move - 1].name}!")
-        sleep(1)
-        damage_dealt = self.attack_moves[chosen_move - 1].damage - enemy.defense
-        if damage_dealt < 0:
-            damage_dealt = 0
+        pause(1)
+        damage_dealt = self.attack_moves[chosen_move - 1].damage_against(enemy)
 
         sprint(f"You dealt {damage_dealt} damage to the {enemy.name}!")
-        sleep(1)
+        pause(1)
 
         return damage_dealt, chosen_move
 
 
 class Warrior(Character):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name, 100, 15, 10, 5)
         self.attack_moves = [
@@ -96,24 +143,41 @@ class Warrior(Character):
 
 
 class Mage(Character):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name, 75, 5, 5, 15)
+        self.attack_moves = [
+            AttackMove("Staff Strike", 5),
+            AttackMove("Ice Shard", 15),
+            AttackMove("Fireball", 20),
+            AttackMove("Mana Shield", 0, True, 5),
+        ]
 
 
 class Rogue(Character):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name, 50, 15, 0, 5)
+        self.attack_moves = [
+            AttackMove("Quick Stab", 10),
+            AttackMove("Poisoned Dagger", 15),
+            AttackMove("Backstab", 20),
+            AttackMove("Dodge", 0, True, 5),
+        ]
 
 
-classes_list = ["Warrior", "Mage", "Rogue"]
+player_classes = {"Warrior": Warrior, "Mage": Mage, "Rogue": Rogue}
+classes_list = list(player_classes)
 
 # ------------------ Character Selection ------------------ #
 
 
 def character_selection() -> Character:
     sprint("What do you want your character's name to be?")
-    name = input("> ")
-    sleep(1)
+    name = ask("> ")
+    pause(1)
     sprint("Please select a class: ")
     sprint("Classes:")
     sprint(classes_list)
@@ -121,18 +185,19 @@ def character_selection() -> Character:
     chosen_class = ""
     while chosen_class not in classes_list:
         try:
-            chosen_class = input("> ").capitalize()
-            sleep(1)
+            chosen_class = ask("> ").capitalize()
+            pause(1)
             if chosen_class not in classes_list:
                 sprint(
                     "Sorry, that is not a valid class. Please try again.\n", delay=0.03
                 )
-                sleep(1)
+                pause(1)
                 raise ValueError
             break
         except ValueError:
             pass
-    player = eval(f"{chosen_class}('{name}')")
+    # The class is looked up by name, so the name the player typed is only ever used as their name.
+    player = player_classes[chosen_class](name)
 
     return player
 
@@ -140,7 +205,10 @@ def character_selection() -> Character:
 # ------------------ Enemy Class ------------------ #
 
 
-class Enemy:
+class Enemy(StatBlock):
+    # Enemies are created for every encounter, so slots keep them small and quick to create.
+    __slots__ = ("difficulty", "biome")
+
     def __init__(self, name, difficulty, health, attack, defense, magic, biome):
         self.name = name
         self.difficulty = difficulty
@@ -150,75 +218,98 @@ class Enemy:
         self.magic = magic
         self.biome = biome
 
+    def spawn(self) -> "Enemy":
+        """Creates a new enemy to fight from this one, which acts as the prototype in enemy_data.
+        Every stat is an int or str, so copying the values is enough and the prototype is never changed in battle.
+        """
+        return Enemy(
+            self.name,
+            self.difficulty,
+            self.health,
+            self.attack,
+            self.defense,
+            self.magic,
+            self.biome,
+        )
+
     def __str__(self):
         return f"Name: {self.name}, Health: {self.health}, Attack: {self.attack}, Defense: {self.defense}, Magic: {self.magic} Biome: {self.biome}"
 
+    def damage_against(self, player, move) -> tuple[int, bool]:
+        """Works out the damage this enemy deals to the player while they use a move.
+
+        Args:
+            player (Character): The player being attacked.
+            move (AttackMove): The move the player chose this turn.
+
+        Returns:
+            tuple[int, bool]: The damage dealt, and whether a defensive move parried the attack.
+        """
+        parried = False
+        if move.defensive:
+            parried = self.attack - (player.defense + move.defense_bonus) <= 0
+
+        damage = self.attack - player.defense
+        if damage < 0:
+            damage = 0
+
+        return damage, parried
+
     def attack_player(self, player, chosen_move):
         sprint(f"\nThe {self.name} is attacking you!")
         chosen_move = player.attack_moves[chosen_move - 1]
+        damage, parried = self.damage_against(player, chosen_move)
         if chosen_move.defensive:
             sprint("Attempting to parry...")
-            player.defense += chosen_move.defense_bonus
-            sleep(1)
-            damage = self.attack - player.defense
-            if damage < 0:
-                damage = 0
+            pause(1)
 
-            if damage == 0:
+            if parried:
                 sprint("You parried the attack!")
-                sleep(1)
+                pause(1)
             else:
                 sprint("You failed to parry the attack!")
-            player.defense -= chosen_move.defense_bonus
-            sleep(1)
-
-        damage = self.attack - player.defense
-        if damage < 0:
-            damage = 0
+            pause(1)
 
         player.health -= damage
         sprint(f"The {self.name} attacked you for {damage} damage!", delay=0.03)
-        sleep(1)
+        pause(1)
 
 
 # ------------------ Enemy Selection ------------------ #
 
+# The enemies are written in Data/enemies.json, see content.py.
 enemy_data = {
-    "House": {
-        "Goblin": Enemy("Goblin", 10, 50, 10, 5, 0, "Forest"),
-        "Orc": Enemy("Orc", 5, 100, 15, 10, 0, "Forest"),
-        "Skeleton": Enemy("Skeleton", 9, 50, 10, 5, 0, "Forest"),
-        "Troll": Enemy("Troll", 30, 150, 20, 15, 0, "Forest"),
-    }
+    biome: {stats[0]: Enemy(*stats) for stats in enemies}
+    for biome, enemies in get_content()["enemies"].items()
 }
 
 
-def enemy_selection(game_data):
-    # Each enemy has a biome and a minimum difficulty. The biome is the biome that the enemy is in. The minimum difficulty is the minimum difficulty that the enemy can spawn in. The difficulty is out of 100. The higher the difficulty, the more likely the enemy will spawn.
-    biome = game_data.area.biome
+# The weights for every biome and difficulty are worked out once here, rather than on every encounter.
+# If enemy_data is changed while the game is running, call register_enemy() or spawn_tables.invalidate(biome).
+spawn_tables = SpawnTables(enemy_data)
 
-    # enemy = random.choice(list(enemy_data[biome].values()))
 
-    # Loop through enemies in biome
-    valid_enemies = []
-    for enemy in enemy_data[biome].values():
-        # Check if enemy difficulty is less than or equal to the area difficulty
-        if enemy.difficulty <= game_data.area.difficulty:
-            valid_enemies.append(enemy)
+def register_enemy(enemy: Enemy, biome: str) -> None:
+    """Adds an enemy (or replaces one with the same name) in a biome and rebuilds that biome's spawn tables."""
+    enemy_data.setdefault(biome, {})[enemy.name] = enemy
+    spawn_tables.invalidate(biome)
 
-    enemy = random.choices(
-        valid_enemies, weights=[enemy.difficulty for enemy in valid_enemies], k=1
-    )
-    # The first enenmy in the list is likely to be the enemy with the lowest diffculty.
 
-    return enemy[0]
+@instrument.timed("enemy_selection")
+def enemy_selection(game_data):
+    # Each enemy has a biome and a minimum difficulty. The biome is the biome that the enemy is in. The minimum difficulty is the minimum difficulty that the enemy can spawn in. The difficulty is out of 100. The higher the difficulty, the more likely the enemy will spawn.
+    # Only enemies with a difficulty less than or equal to the area difficulty can spawn, weighted by their difficulty.
+    # The first enenmy in the list is likely to be the enemy with the lowest diffculty.
+    return spawn_tables.sample(game_data.area.biome, game_data.area.difficulty, rng=game_data.rng.spawns)
 
 
 # ------------------ Battle System ------------------ #
 
 
+@instrument.timed("roll_for_battle")
 def roll_for_battle(game_data):
     """This function rolls for a battle. The difficulty for every area is out of 100. The function will roll a number. If the number is less than or equal to the difficulty, then a battle will occur. If the number is greater than the difficulty, then it will return False.
+    There is never a battle in an area where no enemy can spawn, e.g. one whose biome doesn't have any enemies yet.
 
     Args:
         game_data (GameData): The current game data.
@@ -227,38 +318,46 @@ def roll_for_battle(game_data):
         bool: A boolean value that determines if a battle will occur.
     """
 
-    rolled_num = random.randint(1, 100)
-    if rolled_num <= game_data.area.difficulty:
+    # Rolled first either way, so the encounter rolls stay the same whether or not an enemy can spawn.
+    rolled_num = game_data.rng.encounters.randint(1, 100)
+    area = game_data.area
+    if rolled_num <= area.difficulty and spawn_tables.table(area.biome, area.difficulty) is not None:
+        instrument.count("battles")
         return True
     else:
         return False
 
 
-def battle(game_data):  # ! WIP
+def battle(game_data):
     if not roll_for_battle(game_data):
         return
 
-    # Create a copy of the enemy in the data
-    enemy = copy.deepcopy(enemy_selection(game_data))
+    fight(game_data)
 
-    os.system("cls")
-    print("-" * 50)
+
+@instrument.timed("battle")
+def fight(game_data):
+    # Create a new enemy from the one in the data
+    enemy = enemy_selection(game_data).spawn()
+
+    clear_screen()
+    say("-" * 50)
     sprint(f"You have encountered a {enemy.name}!", delay=0.03)
     sprint(f"It has {enemy.health} health!", delay=0.03)
     sprint(f"Your health is {game_data.player.health}", delay=0.03)
-    sleep(1)
+    pause(1)
 
     while True:
-        print("-" * 50)
+        say("-" * 50)
         sprint("| What do you want to do? |", delay=0.03)
-        print("-" * 50)
+        say("-" * 50)
         sprint("| 1. Attack               |", delay=0.03)
         sprint("| 2. Magic                |", delay=0.03)
         sprint("| 3. Run                  |", delay=0.03)
         sprint("| 4. Exit                 |", delay=0.03)
-        print("-" * 50)
+        say("-" * 50)
 
-        user_input = input("> ").lower()
+        user_input = ask("> ").lower()
 
         if user_input == "1" or user_input == "attack":
             damage_dealt, chosen_move = game_data.player.attack_enemy(enemy)
@@ -266,85 +365,98 @@ def battle(game_data):  # ! WIP
             if enemy.health <= 0:
                 sprint("You have defeated the enemy!")
                 sprint(f"Current Health: {game_data.player.health}")
-                sleep(1)
+                pause(1)
                 break
             else:
                 enemy.attack_player(game_data.player, chosen_move)
                 if game_data.player.health <= 0:
                     sprint("You have died!")
-                    sleep(1)
+                    pause(1)
                     break
-        elif user_input == "2" or user_input == "magic":
-            game_data.player.magic_attack(enemy)
-        elif user_input == "3" or user_input == "run":
-            game_data.player.run()
+        elif user_input in ("2", "magic", "3", "run"):
+            # Magic and running away aren't written yet, so the player is asked again.
+            sprint("Sorry, that isn't available yet. Please choose something else.", delay=0.03)
+            pause(1)
+            continue
         elif user_input == "4" or user_input == "exit":
             exit()
         else:
             sprint("Sorry, that is not a valid option. Please try again.", delay=0.03)
-            sleep(1)
+            pause(1)
             continue
 
-        print("-" * 50)
+        say("-" * 50)
         sprint(f"{game_data.player.name}'s Health: {game_data.player.health}")
         sprint(f"{enemy.name}'s Health: {enemy.health}")
-        sleep(1)
+        pause(1)
 
 
 # ------------------ Stats ------------------ #
 
 
 def upgrade_stats(player):
-    if player.points == 0:
-        sprint("You have no points left.")
-        sleep(1)
-        return player
-    sprint("Please select a stat to upgrade: ")
-    sprint("1. Health")
-    sprint("2. Attack")
-    sprint("3. Defense")
-    sprint("4. Magic")
-    sprint("5. Exit")
-
-    user_input = input("> ")
-    sleep(1)
-    if user_input == "1":
-        player.health += 10
-        player.points -= 1
-        sprint("You have upgraded your health by 10.", delay=0.03)
-        sprint(f"You have {player.points} points left.\n")
-        sleep(1)
-        upgrade_stats(player)
-    elif user_input == "2":
-        player.attack += 5
-        player.points -= 1
-        sprint("You have upgraded your attack by 5.", delay=0.03)
-        sprint(f"You have {player.points} points left.\n")
-        sleep(1)
-        upgrade_stats(player)
-    elif user_input == "3":
-        player.defense += 5
-        player.points -= 1
-        sprint("You have upgraded your defense by 5.", delay=0.03)
-        sprint(f"You have {player.points} points left.\n")
-        sleep(1)
-        upgrade_stats(player)
-    elif user_input == "4":
-        player.magic += 5
-        player.points -= 1
-        sprint("You have upgraded your magic by 5.", delay=0.03)
-        sprint(f"You have {player.points} points left.\n")
-        sleep(1)
-        upgrade_stats(player)
-    elif user_input == "5":
-        sprint("You have exited the upgrade menu.")
-        sleep(1)
-    else:
-        sprint("Sorry, that is not a valid option. Please try again.\n", delay=0.03)
-        sleep(1)
-        upgrade_stats(player)
+    # Each upgrade goes round the loop again, rather than calling upgrade_stats again, so the stack doesn't grow.
+    upgrades = {
+        "1": ("health", 10),
+        "2": ("attack", 5),
+        "3": ("defense", 5),
+        "4": ("magic", 5),
+    }
 
-    return player
+    while True:
+        if player.points == 0:
+            sprint("You have no points left.")
+            pause(1)
+            return player
+        sprint("Please select a stat to upgrade: ")
+        sprint("1. Health")
+        sprint("2. Attack")
+        sprint("3. Defense")
+        sprint("4. Magic")
+        sprint("5. Exit")
+
+        user_input = ask("> ")
+        pause(1)
+        if user_input in upgrades:
+            stat, amount = upgrades[user_input]
+            setattr(player, stat, getattr(player, stat) + amount)
+            player.points -= 1
+            sprint(f"You have upgraded your {stat} by {amount}.", delay=0.03)
+            sprint(f"You have {player.points} points left.\n")
+            pause(1)
+        elif user_input == "5":
+            sprint("You have exited the upgrade menu.")
+            pause(1)
+            return player
+        else:
+            sprint("Sorry, that is not a valid option. Please try again.\n", delay=0.03)
+            pause(1)
+
+
+# ------------------ Game States ------------------ #
+
+# The game is a state machine. Every menu is a state, which shows its options once, deals with the player's choice
+# and returns the name of the next state. run() calls the states one after another in a loop,
+# so menus never call each other and a long session doesn't build up a stack of old menus.
+
+MAIN_MENU = "main_menu"
+START_GAME = "start_game"
+CREDITS = "credits"
+INTERACT = "interact"
+MOVE_ZONE = "move_zone"
+MOVE_AREA = "move_area"
+TRAVEL = "travel"
+BATTLE = "battle"
+PROFILING = "profiling"
+UPGRADE = "upgrade"
+SAVE_MENU = "save_menu"
+EXPORT = "export"
+IMPORT = "import"
+EXIT = "exit"
+
+
+def clear_screen():
+    clear()
 
 
 # ------------------ Interact ------------------ #
@@ -354,91 +466,206 @@ def interact(game_data):
     sprint("\nWhat do you want to do?")
     sprint("1. Move zone")
     sprint("2. Move area")
-    sprint("3. View stats")
-    sprint("4. Upgrade stats")
-    sprint("5. Save game")
-    sprint("6. Exit game")
+    sprint("3. Travel to a zone")
+    sprint("4. View stats")
+    sprint("5. Upgrade stats")
+    sprint("6. Save game")
+    # Profiling is the same for every game in the process, so players on the server can't turn it on or off.
+    # The option keeps its number for them, so the menu is numbered the same everywhere.
+    can_profile = get_port().local
+    if can_profile:
+        sprint(f"7. {'Stop' if instrument.is_profiling() else 'Start'} profiling")
+    else:
+        sprint("7. Profiling (not available)")
+    sprint("8. Exit game")
 
-    user_input = input("> ")
-    sleep(1)
-    print()
+    user_input = ask("> ")
+    pause(1)
+    say()
 
     if user_input == "1":
-        game_data.zone, game_data.area = game_data.zone.move()
-        sleep(1)
-        # interact(game_data)
-    if user_input == "2":
-        game_data.area = game_data.area.move_area()
-        sleep(1)
-        interact(game_data)
+        return MOVE_ZONE
+    elif user_input == "2":
+        return MOVE_AREA
     elif user_input == "3":
-        print(game_data.player)
-        sleep(1)
-        interact(game_data)
+        return TRAVEL
     elif user_input == "4":
-        game_data.player = upgrade_stats(game_data.player)
-        interact(game_data)
+        say(game_data.player)
+        pause(1)
+        return INTERACT
     elif user_input == "5":
-        game_data.save_menu()
-        interact(game_data)
+        return UPGRADE
     elif user_input == "6":
+        return SAVE_MENU
+    elif user_input == "7":
+        if can_profile:
+            return PROFILING
+        sprint("Sorry, profiling is only available when playing at the console.", delay=0.03)
+        pause(1)
+        return INTERACT
+    elif user_input == "8":
         sprint("Do you want to save your game before exiting?(y/n)", delay=0.03)
-        user_input2 = input("> ").lower()
+        user_input2 = ask("> ").lower()
         if user_input2 == "y":
-            game_data.save_menu()
+            return SAVE_MENU
         elif user_input2 == "n":
             sprint("You have returned to main menu.", delay=0.03)
             game_data.game_is_running = False
-            sleep(1)
-            main_menu(game_data)
-        else:
-            sprint("Sorry, that is not a valid option. Please try again.\n")
-            sleep(1)
-            interact(game_data)
-    else:
-        sprint("Sorry, that is not a valid option. Please try again.\n")
-        sleep(1)
-        interact(game_data)
+            pause(1)
+            return MAIN_MENU
+
+    sprint("Sorry, that is not a valid option. Please try again.\n")
+    pause(1)
+    return INTERACT
+
+
+def move_zone(game_data):
+    game_data.zone, game_data.area = game_data.zone.move()
+    pause(1)
+    return BATTLE
+
+
+def move_area(game_data):
+    game_data.area = game_data.area.move_area()
+    pause(1)
+    return BATTLE
+
+
+def travel_to(game_data, zone_name):
+    """Walks the player along the shortest route to a zone, rolling for a battle in each zone on the way.
+    The rolls are made one after another without stopping, and the journey ends early in the zone where a battle starts.
+
+    Args:
+        game_data (GameData): The current game data.
+        zone_name (str): The name of the zone to travel to.
+
+    Raises:
+        KeyError: If there is no zone with that name.
+
+    Returns:
+        bool: True if the player got to the zone, False if a battle stopped them on the way.
+    """
+    world = map.get_world(game_data.zone.world)
+    for next_zone_name in game_data.zone.route_to(zone_name):
+        zone = world.get_zone(next_zone_name)
+        game_data.zone = zone
+        game_data.area = world.get_areas(zone.name)[zone.areas[0][0]]
+        if roll_for_battle(game_data):
+            return False
+    return True
+
+
+def travel(game_data):
+    sprint("Which zone would you like to travel to?")
+    zone_name = ask("> ").strip().upper()
+    pause(1)
+
+    try:
+        distance = len(game_data.zone.route_to(zone_name))
+    except KeyError:
+        sprint("There is no zone with that name.")
+        pause(1)
+        return INTERACT
+
+    if distance == 0:
+        sprint("You are already there.")
+        pause(1)
+        return INTERACT
+
+    sprint(f"It is {distance} zone{'s' if distance != 1 else ''} away. You set off.")
+    pause(1)
+    arrived = travel_to(game_data, zone_name)
+
+    if not arrived:
+        sprint(f"\nOn the way, you are stopped in {game_data.zone.name}!")
+        pause(1)
+        fight(game_data)
+        if game_data.player.health <= 0:
+            game_data.game_is_running = False
+            return MAIN_MENU
+        return INTERACT
+
+    sprint(f"\nYou have arrived at {game_data.zone.name}.")
+    sprint(game_data.zone.description)
+    pause(1)
+    sprint(f"\nYou have entered: {game_data.area.name}")
+    sprint(game_data.area.description)
+    pause(2)
+    return INTERACT
+
+
+def encounter(game_data):
+    # Entering a new zone or area might start a battle.
+    battle(game_data)
+    if game_data.player.health <= 0:
+        game_data.game_is_running = False
+        return MAIN_MENU
+    return INTERACT
+
+
+def profiling(game_data):
+    """Starts profiling, or stops it and shows where the time went since it started.
+    Timings don't count pauses, the delay while text is written or the time spent waiting for the player.
+    """
+    if not instrument.is_profiling():
+        instrument.start_profiling()
+        sprint("Profiling has started. Play as usual, then choose this option again to see the results.", delay=0.03)
+        pause(1)
+        return INTERACT
+
+    path = instrument.stop_profiling()
+    say("-" * 50)
+    for line in instrument.format_report():
+        say(line)
+    say("-" * 50)
+    for line in instrument.top_functions(path):
+        say(line)
+    say("-" * 50)
+    sprint(f"The full profile was saved to {path}", delay=0.03)
+    pause(1)
+    return INTERACT
+
+
+def upgrade(game_data):
+    game_data.player = upgrade_stats(game_data.player)
+    return INTERACT
 
 
 # ------------------ Start Game ------------------ #
 
 
-def start_game():
+def start_game(game_data):
     player = character_selection()
 
-    current_zone = map.zone_data["A1"]
-    current_area = map.area_data["A1"]["Home"]
+    # The new game replaces whatever was in game_data before.
+    game_data.player = player
+    game_data.zone = map.zone_data["A1"]
+    game_data.area = map.area_data["A1"]["Home"]
+    game_data.moveable_zones = ["A2", "B1"]
+    game_data.game_is_running = True
 
-    game_data = GameData(
-        player=player,
-        zone=current_zone,
-        area=current_area,
-        moveable_zones=["A2", "B1"],
-        game_is_running=True,
-    )
     sprint(
         "\nYou wake up. Where are you? You realise, this is your home. Last you remember, you were off on an adventure looking for treasure. How did you end up back here?"
     )
     sprint("You get up and look around. It's time to go out and explore once more.\n")
-    sleep(1)
+    pause(1)
 
-    interact(game_data)
+    return INTERACT
 
 
 # ------------------ View Credits ------------------ #
 
 
 def view_credits(game_data):
-    print("--------------------------------")
-    print("           Credits:")
-    print("    Created by: Melon Man")
-    print("    Designed by: Melon Man")
-    print("   Illustrated by: Melon Man")
-    print("   Hope you enjoyed the game!")
-    print("--------------------------------")
-    sleep(5)
-    main_menu(game_data)
+    say("--------------------------------")
+    say("           Credits:")
+    say("    Created by: Melon Man")
+    say("    Designed by: Melon Man")
+    say("   Illustrated by: Melon Man")
+    say("   Hope you enjoyed the game!")
+    say("--------------------------------")
+    pause(5)
+    return MAIN_MENU
 
 
 # ------------------ Save Data ------------------ #
@@ -452,12 +679,63 @@ class GameData:
         area: map.Area,
         moveable_zones: list[str],
         game_is_running: bool,
+        rng: RandomStreams | None = None,
+        save_dir: str = saves.SAVE_DIR,
     ):
+        # zone and area are where this player is. The zones themselves are shared by every game on the server,
+        # so nothing about the player is kept on them.
         self.player = player
         self.zone = zone
         self.area = area
         self.moveable_zones = moveable_zones
         self.game_is_running = game_is_running
+        # Everything random in this game is drawn from these streams, so it can be repeated from rng.seed.
+        self.rng = rng if rng is not None else RandomStreams()
+        self.save_dir = save_dir  # The folder this game's save slots are in. Every session on the server has its own.
+        self.save_logs: dict[str, saves.SaveLog] = {}  # The save files this game has saved to, by path.
+
+    def to_save(self) -> dict:
+        """Gets the data needed to recreate this game, see saves.py for how it's stored."""
+        data = {
+            "class": self.player.__class__.__name__,
+            "name": self.player.name,
+            "zone": self.zone.name,
+            "area": self.area.name,
+            "moveable_zones": list(self.moveable_zones),
+            "game_is_running": self.game_is_running,
+        }
+        for stat in saves.PLAYER_STATS:
+            data[stat] = getattr(self.player, stat)
+
+        return data
+
+    def save(self, path: str) -> None:
+        """Saves the game to a save log. Only the fields that changed since it last saved to the same file are written,
+        unless the file has been written by something else since, in which case the whole game is.
+        """
+        save_log = self.save_logs.get(path)
+        if save_log is None:
+            save_log = self.save_logs[path] = saves.SaveLog(path)
+        save_log.save(self.to_save())
+
+    @classmethod
+    def from_save(cls, data: dict) -> "GameData":
+        """Recreates a game from the data made by to_save()."""
+        player = player_classes[data["class"]](data["name"])
+        for stat in saves.PLAYER_STATS:
+            setattr(player, stat, data[stat])
+
+        zone = map.zone_data[data["zone"]]
+        # Saves from before areas were added don't have one, so the player starts in the first area of the zone.
+        area_name = data["area"] or zone.areas[0][0]
+
+        return cls(
+            player=player,
+            zone=zone,
+            area=map.area_data[zone.name][area_name],
+            moveable_zones=list(data["moveable_zones"]),
+            game_is_running=data["game_is_running"],
+        )
 
     def save_menu(self):
         sprint("Do you want to import or export save data?")
@@ -466,158 +744,187 @@ class GameData:
         sprint("3. Exit to Main Menu")
         sprint("4. Exit to Game")
 
-        user_input = input("> ")
-        sleep(1)
+        user_input = ask("> ")
+        pause(1)
 
         if user_input == "1":
-            self.import_data()
+            return IMPORT
         elif user_input == "2":
-            self.export_data()
+            return EXPORT
         elif user_input == "3":
             if self.game_is_running == True:
                 sprint(
                     "Do you not want to return back to the game? You may lose data. (y/n).",
                     delay=0.03,
                 )
-                user_input2 = input("> ").lower()
-                sleep(1)
+                user_input2 = ask("> ").lower()
+                pause(1)
 
                 if user_input2 == "y":
                     sprint("Returning back to save menu.")
-                    sleep(1)
+                    pause(1)
                     self.game_is_running = False
-                    self.save_menu()
+                    return SAVE_MENU
                 elif user_input2 == "n":
                     sprint("Returning back to game.")
-                    sleep(1)
-                    return self
+                    pause(1)
+                    return INTERACT
                 else:
                     sprint(
                         "Sorry, that is not a valid option. Please try again.\n",
                         delay=0.03,
                     )
-                    sleep(1)
-                    self.save_menu()
+                    pause(1)
+                    return SAVE_MENU
             else:
                 sprint("You have exited the save menu.")
-                sleep(1)
-                main_menu(self)
+                pause(1)
+                return MAIN_MENU
 
         elif user_input == "4":
             if self.game_is_running == True:
                 sprint("You have exited the save menu.", delay=0.03)
-                sleep(1)
-                return self
+                pause(1)
+                return INTERACT
             else:
                 sprint(
                     "You are not currently running a game. Exiting to main menu.",
                     delay=0.03,
                 )
-                sleep(1)
-                main_menu(self)
+                pause(1)
+                return MAIN_MENU
         else:
             sprint("Sorry, that is not a valid option. Please try again.\n", delay=0.03)
-            sleep(1)
-            self.save_menu()
+            pause(1)
+            return SAVE_MENU
 
     def export_data(self):
         sprint(
             "Please enter the name of the save file you want to export to.(1, 2 or 3) Or enter 4 to exit.",
             delay=0.03,
         )
-        user_input = input("> ")
-        sleep(1)
+        user_input = ask("> ")
+        pause(1)
 
-        if int(user_input) in range(1, 4):
+        if user_input in ("1", "2", "3"):
             sprint("Are you sure, this will overwrite the save file. (y/n)", delay=0.03)
-            user_input2 = input("> ").lower()
-            sleep(1)
+            user_input2 = ask("> ").lower()
+            pause(1)
 
             if user_input2 == "y":
-                with open(rf"Game\Save Files\save{user_input}.txt", "wb") as file:
-                    pickle.dump(self, file)
-                    sprint(
-                        f"You have exported your save data to save{user_input}.txt",
-                        delay=0.03,
-                    )
-                    sleep(1)
-                self.save_menu()
+                try:
+                    journal.write_save(saves.save_path(user_input, self.save_dir), self)
+                except (OSError, saves.SaveError) as error:
+                    sprint(f"Could not export to save{user_input}.txt: {error}", delay=0.03)
+                    pause(1)
+                    return SAVE_MENU
+                sprint(
+                    f"You have exported your save data to save{user_input}.txt",
+                    delay=0.03,
+                )
+                pause(1)
+                return SAVE_MENU
             elif user_input2 == "n":
                 sprint("You have exited the export menu.")
-                sleep(1)
-                self.save_menu()
+                pause(1)
+                return SAVE_MENU
             else:
                 sprint(
                     "Sorry, that is not a valid option. Please try again.\n", delay=0.03
                 )
-                sleep(1)
-                self.export_data()
+                pause(1)
+                return EXPORT
 
         elif user_input == "4":
-            print("You have exited the export menu.")
-            sleep(1)
-            self.save_menu()
+            say("You have exited the export menu.")
+            pause(1)
+            return SAVE_MENU
         else:
-            print("Sorry, that is not a valid option. Please try again.\n")
-            sleep(1)
-            self.export_data()
+            say("Sorry, that is not a valid option. Please try again.\n")
+            pause(1)
+            return EXPORT
 
     def import_data(self):
         sprint(
             "Please enter the name of the save file you want to import from.(1, 2 or 3) Or enter 4 to exit.",
             delay=0.03,
         )
-        user_input = input("> ")
-        sleep(1)
+        user_input = ask("> ")
+        pause(1)
 
-        if int(user_input) in range(1, 4):
+        if user_input in ("1", "2", "3"):
             sprint(
                 "Are you sure, this will overwrite your current save. (y/n)", delay=0.03
             )
-            user_input2 = input("> ").lower()
-            sleep(1)
+            user_input2 = ask("> ").lower()
+            pause(1)
 
             if user_input2 == "y":
-                with open(
-                    rf"Game\Projects\Text RPG\Save Files\save{user_input}.txt", "rb"
-                ) as file:
-                    self = pickle.load(file)
-                    sprint(f"You have imported save{user_input}.txt")
-                    sleep(1)
-                self.save_menu()
+                try:
+                    loaded = GameData.from_save(journal.load_save(saves.save_path(user_input, self.save_dir)))
+                except (OSError, saves.SaveError) as error:
+                    sprint(f"Could not import save{user_input}.txt: {error}", delay=0.03)
+                    pause(1)
+                    return IMPORT
+
+                # Assigning to self would only change the local name, so the loaded data is copied in instead.
+                # The game keeps its own random streams and save folder, so loading a save doesn't change its seed
+                # or where it saves to.
+                loaded.rng = self.rng
+                loaded.save_dir = self.save_dir
+                self.__dict__.update(loaded.__dict__)
+                sprint(f"You have imported save{user_input}.txt")
+                pause(1)
+                return SAVE_MENU
             elif user_input2 == "n":
                 sprint("You have exited the import menu.")
-                sleep(1)
-                self.save_menu()
+                pause(1)
+                return SAVE_MENU
             else:
                 sprint(
                     "Sorry, that is not a valid option. Please try again.\n", delay=0.03
                 )
-                sleep(1)
-                self.import_data()
+                pause(1)
+                return IMPORT
         elif user_input == "4":
             sprint("You have exited the import menu.")
-            sleep(1)
-            self.save_menu()
+            pause(1)
+            return SAVE_MENU
         else:
             sprint("Sorry, that is not a valid option. Please try again.\n", delay=0.03)
-            sleep(1)
-            self.import_data()
+            pause(1)
+            return IMPORT
 
     def __str__(self):
         return "Player: " + str(self.player) + ""
 
 
+def new_game_data(rng: RandomStreams | None = None, save_dir: str = saves.SAVE_DIR) -> GameData:
+    """Creates the game data a game starts with, before the player starts or loads a game."""
+    return GameData(
+        player=Warrior("Placeholder"),
+        zone=map.zone_data["A1"],
+        area=map.area_data["A1"]["Home"],
+        moveable_zones=["A2", "B1"],
+        game_is_running=False,
+        rng=rng,
+        save_dir=save_dir,
+    )
+
+
 # ------------------ Main Menu ------------------ #
 
 
 # This is the main menu that the game_data will see when they start the game.
+LOGO_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Art", "logo.txt")
+
+
 def main_menu(game_data):
-    os.system("cls")
-    with open(r"Game\Art\logo.txt", "r") as file:
+    clear_screen()
+    with open(LOGO_PATH, "r") as file:
         logo = file.read()
         sprint(logo, delay=0.001)
-    sleep(1)
+    pause(1)
 
     sprint("--------------------------------", delay=0.03)
     sprint("Welcome To Melon Man's Text RPG!", delay=0.03)
@@ -636,63 +943,88 @@ def main_menu(game_data):
     # print("10. View quests")
     # The above are placeholders currently
 
-    valid = False
-    while not valid:
-        try:
-            user_input = input("> ")
-            sleep(1)
-            if user_input == "1":
-                start_game()
-                pass
-            elif user_input == "2":
-                exit()
-            elif user_input == "3":
-                view_credits(game_data)
-            elif user_input == "4":
-                game_data.save_menu()
-            # elif user_input == "5":
-            #     view_help()
-            # elif user_input == "6":
-            #     view_high_scores()
-            # elif user_input == "7":
-            #     view_settings()
-            # elif user_input == "8":
-            #     view_achievements()
-            # elif user_input == "9":
-            #     view_stats()
-            # elif user_input == "10":
-            #     view_inventory()
-            # elif user_input == "11":
-            #     view_quests()
-            else:
-                sprint("Sorry, that is not a valid option. Please try again.\n")
-                sleep(1)
-                raise ValueError
-            valid = True
-        except ValueError:
-            pass
+    while True:
+        user_input = ask("> ")
+        pause(1)
+        if user_input == "1":
+            return START_GAME
+        elif user_input == "2":
+            return EXIT
+        elif user_input == "3":
+            return CREDITS
+        elif user_input == "4":
+            return SAVE_MENU
+        # elif user_input == "5":
+        #     view_help()
+        # elif user_input == "6":
+        #     view_high_scores()
+        # elif user_input == "7":
+        #     view_settings()
+        # elif user_input == "8":
+        #     view_achievements()
+        # elif user_input == "9":
+        #     view_stats()
+        # elif user_input == "10":
+        #     view_inventory()
+        # elif user_input == "11":
+        #     view_quests()
+        else:
+            sprint("Sorry, that is not a valid option. Please try again.\n")
+            pause(1)
+
+
+# ------------------ Game Loop ------------------ #
+
+states = {
+    MAIN_MENU: main_menu,
+    START_GAME: start_game,
+    CREDITS: view_credits,
+    INTERACT: interact,
+    MOVE_ZONE: move_zone,
+    MOVE_AREA: move_area,
+    TRAVEL: travel,
+    BATTLE: encounter,
+    PROFILING: profiling,
+    UPGRADE: upgrade,
+    SAVE_MENU: GameData.save_menu,
+    EXPORT: GameData.export_data,
+    IMPORT: GameData.import_data,
+}
+
+
+def run(game_data, state=MAIN_MENU, max_steps=None, autosaver=None):
+    """Runs the game from a state until the player exits.
+
+    Args:
+        game_data (GameData): The game data, which the states update as the game goes on.
+        state (str, optional): The state to start in. Defaults to MAIN_MENU.
+        max_steps (int, optional): Stops after this many states, mainly for testing. Defaults to None, which never stops.
+        autosaver (autosave.Autosaver, optional): If given, the game is autosaved after every state while it's running.
+            Defaults to None.
+
+    Returns:
+        str: The state the game stopped in.
+    """
+    steps = 0
+    while state != EXIT and (max_steps is None or steps < max_steps):
+        state = states[state](game_data)
+        steps += 1
+        if autosaver is not None and game_data.game_is_running:
+            autosaver.request(game_data)
+
+    if autosaver is not None:
+        autosaver.flush()
+
+    return state
 
 
 # ------------------ Start Game ------------------ #
 
 if __name__ == "__main__":
-    # main_menu(
-    #     game_data=GameData(
-    #         player=Warrior("Placeholder"),
-    #         zone=map.zone_data["A1"],
-    #         area=map.area_data["A1"]["Home"],
-    #         moveable_zones=["A2", "B1"],
-    #         game_is_running=False,
-    #     )
-    # )
-
-    for i in range(100):
-        enemy = battle(
-            game_data=GameData(
-                player=Warrior("Placeholder"),
-                zone=map.zone_data["A1"],
-                area=map.area_data["A1"]["Home"],
-                moveable_zones=["A2", "B1"],
-                game_is_running=False,
-            )
-        )
+    # The game is autosaved to the autosave slot after every step while it's running, on its own thread.
+    game_data = new_game_data()
+    autosaver = autosave.Autosaver(directory=game_data.save_dir)
+    try:
+        run(game_data, autosaver=autosaver)
+    finally:
+        autosaver.close()
@@ -0,0 +1,210 @@
+""" This module contains the vectorised Monte Carlo combat evaluator for the Text-RPG game.
+Instead of fighting one battle at a time like simulation.py, it holds N fights as numpy arrays
+and steps every one of them at once, which makes balancing sweeps over every class, enemy and area difficulty practical.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import numpy as np
+
+from main_file import Character, Enemy, Warrior, Mage, Rogue, enemy_data
+from rng import BATTLES, RandomStreams
+from simulation import get_attack_moves
+
+# ------------------ Damage Rules ------------------ #
+
+# These are the array versions of AttackMove.damage_against and Enemy.damage_against.
+# The enemy's damage doesn't depend on the move used, a parry only changes the message shown in battle().
+
+ONGOING = 0
+WIN = 1
+LOSS = 2
+
+
+def move_damage_against(move_damage: np.ndarray, enemy_defense: np.ndarray) -> np.ndarray:
+    return np.maximum(move_damage - enemy_defense, 0)
+
+
+def enemy_damage_against(enemy_attack: np.ndarray, player_defense: np.ndarray) -> np.ndarray:
+    return np.maximum(enemy_attack - player_defense, 0)
+
+
+# ------------------ Move Policies ------------------ #
+
+# A vectorised policy takes the batch and a numpy Generator, and returns the chosen move index for every fight.
+
+
+def random_policy(batch: "BattleBatch", rng: np.random.Generator) -> np.ndarray:
+    return (rng.random(batch.size) * batch.move_count).astype(np.intp)
+
+
+def aggressive_policy(batch: "BattleBatch", rng: np.random.Generator) -> np.ndarray:
+    # Unused move slots are padded with -1 damage so they are never picked.
+    return batch.move_damage.argmax(axis=1)
+
+
+# ------------------ Battle Batch ------------------ #
+
+
+class BattleBatch:
+    """N independent fights, stored as one numpy array per stat."""
+
+    def __init__(
+        self,
+        players: list[Character],
+        enemies: list[Enemy],
+        player_index: np.ndarray | None = None,
+        enemy_index: np.ndarray | None = None,
+    ):
+        """Initialises the batch. Without indexes there is one fight for every (player, enemy) pair.
+        With indexes, fight i is between players[player_index[i]] and enemies[enemy_index[i]],
+        so the stats of each distinct player and enemy are only read once.
+
+        Args:
+            players (list[Character]): The players taking part.
+            enemies (list[Enemy]): The enemies taking part.
+            player_index (np.ndarray, optional): The player of each fight. Defaults to None.
+            enemy_index (np.ndarray, optional): The enemy of each fight. Defaults to None.
+        """
+        if player_index is None and enemy_index is None:
+            if len(players) != len(enemies):
+                raise ValueError("players and enemies must be the same length.")
+            player_index = enemy_index = np.arange(len(players))
+        elif player_index is None or enemy_index is None or len(player_index) != len(enemy_index):
+            raise ValueError("player_index and enemy_index must be given together and be the same length.")
+
+        self.size = len(player_index)
+        moves = [get_attack_moves(player) for player in players]
+        max_moves = max((len(player_moves) for player_moves in moves), default=1)
+        move_damage = np.full((len(players), max_moves), -1, dtype=np.int64)
+        for i, player_moves in enumerate(moves):
+            move_damage[i, : len(player_moves)] = [move.damage for move in player_moves]
+
+        def stat(objects, name, index):
+            return np.array([getattr(obj, name) for obj in objects], dtype=np.int64)[index]
+
+        self.player_health = stat(players, "health", player_index)
+        self.player_attack = stat(players, "attack", player_index)
+        self.player_defense = stat(players, "defense", player_index)
+        self.move_count = np.array([len(player_moves) for player_moves in moves], dtype=np.int64)[player_index]
+        self.move_damage = move_damage[player_index]
+        self.enemy_health = stat(enemies, "health", enemy_index)
+        self.enemy_attack = stat(enemies, "attack", enemy_index)
+        self.enemy_defense = stat(enemies, "defense", enemy_index)
+
+        self.chosen_move = np.zeros(self.size, dtype=np.intp)
+        self.outcome = np.full(self.size, ONGOING, dtype=np.int8)
+        self.turns = np.zeros(self.size, dtype=np.int64)
+        self.damage_dealt = np.zeros(self.size, dtype=np.int64)
+        self.damage_taken = np.zeros(self.size, dtype=np.int64)
+
+    def step(self, policy, rng: np.random.Generator) -> int:
+        """Plays one turn of every fight that hasn't finished yet.
+
+        Returns:
+            int: The number of fights still going after this turn.
+        """
+        active = self.outcome == ONGOING
+        self.chosen_move = policy(self, rng)
+        self.turns += active
+
+        # The player attacks first, like in battle().
+        dealt = move_damage_against(
+            self.move_damage[np.arange(self.size), self.chosen_move], self.enemy_defense
+        ) * active
+        self.enemy_health -= dealt
+        self.damage_dealt += dealt
+        won = active & (self.enemy_health <= 0)
+        self.outcome[won] = WIN
+
+        # Then the enemy attacks back if it survived.
+        still_active = active & ~won
+        taken = enemy_damage_against(self.enemy_attack, self.player_defense) * still_active
+        self.player_health -= taken
+        self.damage_taken += taken
+        self.outcome[still_active & (self.player_health <= 0)] = LOSS
+
+        return int(np.count_nonzero(self.outcome == ONGOING))
+
+    def run(
+        self,
+        policy=aggressive_policy,
+        rng: np.random.Generator | None = None,
+        max_turns: int = 100,
+    ) -> "BattleBatch":
+        """Steps the batch until every fight has finished or max_turns is reached.
+        Fights still going after max_turns keep the ONGOING outcome and count as timeouts.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        for _ in range(max_turns):
+            if self.step(policy, rng) == 0:
+                break
+        return self
+
+    def summary(self) -> dict[str, float]:
+        won = self.outcome == WIN
+        return {
+            "fights": self.size,
+            "win_rate": float(won.mean()) if self.size else 0.0,
+            "timeout_rate": float((self.outcome == ONGOING).mean()) if self.size else 0.0,
+            "mean_turns_to_kill": float(self.turns[won].mean()) if won.any() else 0.0,
+            "mean_damage_dealt": float(self.damage_dealt.mean()) if self.size else 0.0,
+            "mean_damage_taken": float(self.damage_taken.mean()) if self.size else 0.0,
+        }
+
+
+# ------------------ Balancing Sweep ------------------ #
+
+
+def sweep(
+    classes: tuple[type[Character], ...] = (Warrior, Mage, Rogue),
+    enemies: dict[str, dict[str, Enemy]] = enemy_data,
+    difficulties: tuple[int, ...] = tuple(range(10, 101, 10)),
+    fights: int = 10_000,
+    policy=aggressive_policy,
+    seed: int | None = None,
+    max_turns: int = 100,
+    players: list[Character] | None = None,
+) -> dict[tuple[str, str, int], dict[str, float]]:
+    """Evaluates every class in every biome at every area difficulty.
+    The enemy of each fight is drawn the same way as enemy_selection(): only enemies with a difficulty at or below
+    the area's can spawn, weighted by their difficulty.
+
+    Args:
+        players (list[Character], optional): Players to evaluate instead of a new one of each class,
+            e.g. with changed stats (see sweep.py). Defaults to None.
+
+    Returns:
+        dict[tuple[str, str, int], dict[str, float]]: Summaries keyed by (class name, biome, area difficulty).
+            Difficulties where no enemy can spawn are left out.
+    """
+    # Like simulation.run_matchups(), each group draws from its own stream split off from the seed.
+    streams = RandomStreams(seed)
+    results = {}
+    if players is None:
+        players = [player_class("Simulation") for player_class in classes]
+    for player in players:
+        player_class = type(player)
+        for biome, biome_enemies in enemies.items():
+            for difficulty in difficulties:
+                valid_enemies = [enemy for enemy in biome_enemies.values() if enemy.difficulty <= difficulty]
+                weights = np.array([enemy.difficulty for enemy in valid_enemies], dtype=np.float64)
+                if weights.sum() <= 0:
+                    continue
+
+                rng = streams.child(player_class.__name__, biome, difficulty).numpy(BATTLES)
+                picks = rng.choice(len(valid_enemies), size=fights, p=weights / weights.sum())
+                batch = BattleBatch([player], valid_enemies, np.zeros(fights, dtype=np.intp), picks)
+                results[(player_class.__name__, biome, difficulty)] = batch.run(policy, rng, max_turns).summary()
+
+    return results
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    for (class_name, biome, difficulty), summary in sweep(seed=0).items():
+        print(
+            f"{class_name:<8} {biome:<8} difficulty {difficulty:>3}: "
+            f"win rate {summary['win_rate']:.1%}, turns to kill {summary['mean_turns_to_kill']:.2f}"
+        )
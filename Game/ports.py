@@ -0,0 +1,293 @@
+""" This module contains the I/O ports the game is played through.
+The game's rules never call input(), print() or sleep() themselves. They ask the current port for a line,
+tell it what to show and tell it when to pause, and the port decides what that means:
+    ConsolePort    Plays in the terminal, the way the game always has, with the renderer chosen for sprint.
+    ScriptedPort   Plays from a list of answers without pausing, for soak tests, benchmarks and scripts.
+Other modules add their own: the game server's NetworkPort in server.py, and the journal's RecordingPort and ReplayPort in journal.py.
+Each thread (and asyncio task) has its own current port, so many games can be played at once in one process.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import abc
+import contextvars
+import os
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, TextIO
+
+import instrument
+
+# ------------------ Renderers ------------------ #
+
+
+class Renderer(abc.ABC):
+    """Writes text for sprint. Subclasses decide how quickly the text appears."""
+
+    name = ""
+
+    def __init__(self, stream: TextIO | None = None):
+        """Initialises the renderer.
+
+        Args:
+            stream (TextIO, optional): Where to write the text. Defaults to None, which uses sys.stdout at the time of writing.
+        """
+        self.stream = stream
+
+    def get_stream(self) -> TextIO:
+        return self.stream if self.stream is not None else sys.stdout
+
+    @abc.abstractmethod
+    def write(self, lines: list[str], delay: float, sep: str, end: str) -> None:
+        """Writes each of the lines, followed by end.
+
+        Args:
+            lines (list[str]): The text to write, one entry for each item given to sprint.
+            delay (float): The delay between each character, if the renderer uses one.
+            sep (str): The separator written after each character.
+            end (str): Written after each line.
+        """
+
+
+class TypewriterRenderer(Renderer):
+    """Writes one character at a time with a delay between each, the way the game has always looked."""
+
+    name = "typewriter"
+
+    def write(self, lines: list[str], delay: float, sep: str, end: str) -> None:
+        stream = self.get_stream()
+        for line in lines:
+            for char in line:
+                stream.write(char + sep)
+                stream.flush()
+                instrument.sleep(delay)
+            stream.write(end)
+            stream.flush()
+
+
+class LineRenderer(Renderer):
+    """Writes each line of text in a single write, without any delay."""
+
+    name = "line"
+
+    def write(self, lines: list[str], delay: float, sep: str, end: str) -> None:
+        stream = self.get_stream()
+        for line in lines:
+            text = (sep.join(line) + sep if sep and line else line) + end
+            for part in text.splitlines(keepends=True):
+                stream.write(part)
+            stream.flush()
+
+
+class InstantRenderer(Renderer):
+    """Writes all of the text in a single write, without any delay."""
+
+    name = "instant"
+
+    def write(self, lines: list[str], delay: float, sep: str, end: str) -> None:
+        stream = self.get_stream()
+        stream.write("".join((sep.join(line) + sep if sep and line else line) + end for line in lines))
+        stream.flush()
+
+
+renderers: dict[str, type[Renderer]] = {
+    TypewriterRenderer.name: TypewriterRenderer,
+    LineRenderer.name: LineRenderer,
+    InstantRenderer.name: InstantRenderer,
+}
+
+# The renderer can be chosen before starting the game with e.g. TEXT_RPG_RENDERER=instant,
+# or while it is running with set_renderer().
+RENDERER_ENV_VAR = "TEXT_RPG_RENDERER"
+
+
+def set_renderer(renderer: str | Renderer) -> Renderer:
+    """Sets the renderer used by sprint.
+
+    Args:
+        renderer (str | Renderer): The name of a renderer ("typewriter", "line" or "instant"), or a renderer object.
+
+    Raises:
+        ValueError: If the name isn't a known renderer.
+
+    Returns:
+        Renderer: The renderer now in use.
+    """
+    global current_renderer
+
+    if isinstance(renderer, str):
+        try:
+            renderer = renderers[renderer.lower()]()
+        except KeyError:
+            raise ValueError(
+                f"Unknown renderer {renderer!r}, expected one of: {', '.join(renderers)}."
+            ) from None
+
+    current_renderer = renderer
+    return current_renderer
+
+
+def get_renderer() -> Renderer:
+    return current_renderer
+
+
+current_renderer: Renderer = TypewriterRenderer()
+set_renderer(os.environ.get(RENDERER_ENV_VAR, TypewriterRenderer.name))
+
+
+# ------------------ Ports ------------------ #
+
+
+class IOPort(abc.ABC):
+    """Reads the player's answers and shows them the game. Subclasses decide where those come from and go to."""
+
+    name = ""
+    # Whether the player is at this machine. Only they can use options that affect the whole process, like profiling.
+    local = False
+
+    @abc.abstractmethod
+    def ask(self, prompt: str = "") -> str:
+        """Shows a prompt and gets the player's answer."""
+
+    @abc.abstractmethod
+    def write(self, lines: list[str], delay: float = 0.0, sep: str = "", end: str = "\n") -> None:
+        """Shows text written with sprint, see Renderer.write() for the arguments."""
+
+    def say(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        """Shows text straight away, the same as print."""
+        self.write([sep.join(str(value) for value in values)], 0.0, "", end)
+
+    def pause(self, seconds: float) -> None:
+        """Waits so the player has time to read. Only the console actually waits."""
+
+    def clear(self) -> None:
+        """Clears the screen, if there is one."""
+
+
+class ConsolePort(IOPort):
+    """Plays the game in the terminal."""
+
+    name = "console"
+    local = True
+
+    def __init__(self, renderer: Renderer | None = None):
+        """Initialises the console port.
+
+        Args:
+            renderer (Renderer, optional): Writes sprint's text. Defaults to None, which uses the current renderer, see set_renderer().
+        """
+        self.renderer = renderer
+
+    def ask(self, prompt: str = "") -> str:
+        return input(prompt)
+
+    def write(self, lines: list[str], delay: float = 0.0, sep: str = "", end: str = "\n") -> None:
+        (self.renderer or current_renderer).write(lines, delay, sep, end)
+
+    def say(self, *values: Any, sep: str = " ", end: str = "\n") -> None:
+        print(*values, sep=sep, end=end)
+
+    def pause(self, seconds: float) -> None:
+        instrument.sleep(seconds)
+
+    def clear(self) -> None:
+        os.system("cls" if os.name == "nt" else "clear")
+
+
+class ScriptFinished(Exception):
+    """Raised when a ScriptedPort is asked for an answer after its script has run out."""
+
+
+class ScriptedPort(IOPort):
+    """Plays the game from a script of answers, at full speed."""
+
+    name = "scripted"
+
+    def __init__(self, answers: Iterable[str], record: bool = True, echo: TextIO | None = None):
+        """Initialises the scripted port.
+
+        Args:
+            answers (Iterable[str]): The answers to give, in order. Generators work too, so answers can be worked out as the game goes.
+            record (bool, optional): Keeps everything the game showed in output. Defaults to True,
+                set it to False for long runs so the output doesn't keep growing.
+            echo (TextIO, optional): Also writes the game's text and the answers here, e.g. sys.stdout to watch. Defaults to None.
+        """
+        self.answers = iter(answers)
+        self.record = record
+        self.echo = echo
+        self.output: list[str] = []
+        self.asked = 0
+
+    def ask(self, prompt: str = "") -> str:
+        try:
+            answer = next(self.answers)
+        except StopIteration:
+            raise ScriptFinished from None
+        self.asked += 1
+        self._show(f"{prompt}{answer}\n")
+        return answer
+
+    def write(self, lines: list[str], delay: float = 0.0, sep: str = "", end: str = "\n") -> None:
+        self._show("".join((sep.join(line) + sep if sep and line else line) + end for line in lines))
+
+    def _show(self, text: str) -> None:
+        if self.record:
+            self.output.append(text)
+        if self.echo is not None:
+            self.echo.write(text)
+
+    @property
+    def text(self) -> str:
+        """Everything the game showed, and the answers it was given, as one string."""
+        return "".join(self.output)
+
+
+# ------------------ Current Port ------------------ #
+
+_port: contextvars.ContextVar[IOPort] = contextvars.ContextVar("port")
+console = ConsolePort()
+
+
+def get_port() -> IOPort:
+    """Gets the port the game is being played through on this thread. Defaults to the console."""
+    return _port.get(console)
+
+
+def set_port(port: IOPort) -> contextvars.Token:
+    """Sets the port for this thread. Returns a token that can be given to reset_port() to put the old one back."""
+    return _port.set(port)
+
+
+def reset_port(token: contextvars.Token) -> None:
+    _port.reset(token)
+
+
+@contextmanager
+def using_port(port: IOPort) -> Iterator[IOPort]:
+    """Plays through a port for the length of a with block, e.g. with using_port(ScriptedPort(["1", "2"])): ..."""
+    token = set_port(port)
+    try:
+        yield port
+    finally:
+        reset_port(token)
+
+
+# These are what the game calls instead of input, print, sleep and clearing the screen.
+# Waiting for an answer is counted as waiting by instrument.py, so it isn't timed as part of the game.
+
+
+def ask(prompt: str = "") -> str:
+    with instrument.waiting():
+        return get_port().ask(prompt)
+
+
+def say(*values: Any, sep: str = " ", end: str = "\n") -> None:
+    get_port().say(*values, sep=sep, end=end)
+
+
+def pause(seconds: float) -> None:
+    get_port().pause(seconds)
+
+
+def clear() -> None:
+    get_port().clear()
@@ -0,0 +1,98 @@
+""" This module contains the random number streams for the Text-RPG game.
+Everything random in a game comes from one seed. Each subsystem (encounters, spawns, loot) draws from its own stream,
+so one subsystem drawing more or fewer numbers never changes what another one gets, and a game can be replayed exactly.
+Streams can be split into children, e.g. one for each session on the server or each worker process in a sweep,
+and every child gets its own seed worked out from the parent's seed and the child's labels, without sharing any state.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import hashlib
+import random
+import secrets
+from typing import Hashable
+
+from lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# ------------------ Subsystems ------------------ #
+
+ENCOUNTERS = "encounters"  # Whether a battle starts, see roll_for_battle().
+SPAWNS = "spawns"  # Which enemy is fought, see enemy_selection().
+LOOT = "loot"  # What is found or dropped.
+BATTLES = "battles"  # The choices made during simulated battles, see simulation.py.
+
+# ------------------ Seeds ------------------ #
+
+
+def derive_seed(seed: int, *labels: Hashable) -> int:
+    """Works out a 64 bit seed from a parent seed and some labels. The same inputs always give the same seed,
+    in any process on any machine, and changing any of them gives an unrelated one.
+
+    Args:
+        seed (int): The parent seed.
+        *labels (Hashable): Ints or strings naming the child, e.g. ("session", 12) or ("worker", 3).
+
+    Returns:
+        int: The child's seed.
+    """
+    digest = hashlib.blake2b(repr(seed).encode(), digest_size=8, person=b"text-rpg-rng")
+    for label in labels:
+        # The type is included so 1 and "1" aren't the same label.
+        digest.update(b"\x00" + type(label).__name__.encode() + b":" + repr(label).encode())
+    return int.from_bytes(digest.digest(), "little")
+
+
+# ------------------ Random Streams ------------------ #
+
+
+class RandomStreams:
+    """The random generators for one game, session or worker, one for each subsystem, all from one seed."""
+
+    def __init__(self, seed: int | None = None):
+        """Initialises the streams. Each one is only created the first time it's used.
+
+        Args:
+            seed (int, optional): The seed everything is worked out from. Defaults to None, which picks a random one
+                (it is kept in seed, so the run can still be repeated).
+        """
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self._streams: dict[str, random.Random] = {}
+
+    def __repr__(self) -> str:
+        return f"RandomStreams(seed={self.seed})"
+
+    def stream(self, name: str) -> random.Random:
+        """Gets the generator for a subsystem, e.g. streams.stream(ENCOUNTERS)."""
+        try:
+            return self._streams[name]
+        except KeyError:
+            generator = self._streams[name] = random.Random(derive_seed(self.seed, name))
+            return generator
+
+    @property
+    def encounters(self) -> random.Random:
+        return self.stream(ENCOUNTERS)
+
+    @property
+    def spawns(self) -> random.Random:
+        return self.stream(SPAWNS)
+
+    @property
+    def loot(self) -> random.Random:
+        return self.stream(LOOT)
+
+    def numpy(self, name: str) -> "np.random.Generator":
+        """Gets a new numpy generator for a subsystem, for vectorised simulations. numpy is only imported when this is called."""
+        return np.random.default_rng(derive_seed(self.seed, "numpy", name))
+
+    def child(self, *labels: Hashable) -> "RandomStreams":
+        """Splits off the streams for a part of the run, e.g. streams.child("session", 12).
+        The child's numbers don't depend on how much the parent or any other child has drawn.
+        """
+        return RandomStreams(derive_seed(self.seed, "child", *labels))
+
+    def split(self, count: int, label: str = "worker") -> list["RandomStreams"]:
+        """Splits off a child for each of a number of workers. A child pickles small, so it can be sent to another process."""
+        return [self.child(label, index) for index in range(count)]
@@ -0,0 +1,436 @@
+""" This module contains the save file format for the Text-RPG game.
+Instead of pickling the whole GameData (and with it every Zone, Area and the map), a save only stores the player's stats,
+the names of the current zone and area and the moveable zones, packed with struct into a small versioned binary file.
+Turning a GameData into save data and back is done by GameData.to_save() and GameData.from_save() in main_file.py.
+
+Saves made by the game are save logs: a snapshot in that format, followed by only the fields that changed at each save after it.
+Once a log has COMPACT_AFTER changes, it is compacted back into a single snapshot. Loading replays the changes over the snapshot.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import io
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from typing import Any, Callable
+
+import instrument
+
+# ------------------ Format ------------------ #
+
+MAGIC = b"TRPG"
+VERSION = 1
+
+# Every save starts with the magic bytes and the version, the rest of the layout depends on the version.
+HEADER = struct.Struct("<4sB")
+STATS = struct.Struct("<8i?")  # health, attack, defense, magic, level, exp, gold, points, game_is_running
+LENGTH = struct.Struct("<H")
+
+PLAYER_STATS = ("health", "attack", "defense", "magic", "level", "exp", "gold", "points")
+
+SAVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Save Files")
+
+
+def save_path(slot: int | str, directory: str = SAVE_DIR) -> str:
+    """Gets the path of a save slot, e.g. save_path(1) is "Save Files/save1.txt" next to this file.
+    Each game on the server saves to a folder of its own, which is given as directory.
+    """
+    return os.path.join(directory, f"save{slot}.txt")
+
+
+class SaveError(Exception):
+    """Raised when a save file can't be read."""
+
+
+# ------------------ Migrations ------------------ #
+
+# A migration upgrades the save data of one version to the next version, e.g. migrations[0] turns version 0 into version 1.
+# When the format changes, bump VERSION, add a decoder for the new layout and a migration from the old version,
+# and old saves will keep loading.
+migrations: dict[int, Callable[[dict[str, Any]], dict[str, Any]]] = {}
+
+
+def migration(version: int) -> Callable:
+    """Registers a function as the migration from a version to the next one."""
+
+    def register(function: Callable[[dict[str, Any]], dict[str, Any]]) -> Callable:
+        migrations[version] = function
+        return function
+
+    return register
+
+
+def migrate(data: dict[str, Any], version: int) -> dict[str, Any]:
+    """Applies migrations to save data until it is the current version."""
+    while version < VERSION:
+        if version not in migrations:
+            raise SaveError(f"No migration from save version {version}.")
+        data = migrations[version](data)
+        version += 1
+    return data
+
+
+@migration(0)
+def migrate_pickle(data: dict[str, Any]) -> dict[str, Any]:
+    # Version 0 is the old pickled GameData. Saves from before areas existed have no area,
+    # so they are given an empty name and GameData.from_save() puts the player in the first area of the zone.
+    player = data["player"]
+    return {
+        "class": type(player).__name__,
+        "name": player.name,
+        **{stat: getattr(player, stat, 0) for stat in PLAYER_STATS},
+        "zone": data["zone"].name,
+        "area": data["area"].name if "area" in data else "",
+        "moveable_zones": list(data.get("moveable_zones", [])),
+        "game_is_running": bool(data.get("game_is_running", False)),
+    }
+
+
+# ------------------ Encoding ------------------ #
+
+
+def _write_str(buffer: io.BytesIO, text: str) -> None:
+    encoded = text.encode("utf-8")
+    buffer.write(LENGTH.pack(len(encoded)))
+    buffer.write(encoded)
+
+
+def _read_str(buffer: io.BytesIO) -> str:
+    (length,) = LENGTH.unpack(buffer.read(LENGTH.size))
+    encoded = buffer.read(length)
+    if len(encoded) != length:
+        raise struct.error("string runs past the end of the save")
+    return encoded.decode("utf-8")
+
+
+def encode(data: dict[str, Any]) -> bytes:
+    """Packs save data into the current version of the format.
+
+    Args:
+        data (dict[str, Any]): The save data, as made by GameData.to_save().
+
+    Returns:
+        bytes: The save file contents.
+    """
+    buffer = io.BytesIO()
+    buffer.write(HEADER.pack(MAGIC, VERSION))
+    _write_str(buffer, data["class"])
+    _write_str(buffer, data["name"])
+    buffer.write(STATS.pack(*(data[stat] for stat in PLAYER_STATS), data["game_is_running"]))
+    _write_str(buffer, data["zone"])
+    _write_str(buffer, data["area"])
+    buffer.write(LENGTH.pack(len(data["moveable_zones"])))
+    for zone in data["moveable_zones"]:
+        _write_str(buffer, zone)
+
+    return buffer.getvalue()
+
+
+def _decode_v1(buffer: io.BytesIO) -> dict[str, Any]:
+    data: dict[str, Any] = {"class": _read_str(buffer), "name": _read_str(buffer)}
+    *stats, game_is_running = STATS.unpack(buffer.read(STATS.size))
+    data.update(zip(PLAYER_STATS, stats))
+    data["game_is_running"] = game_is_running
+    data["zone"] = _read_str(buffer)
+    data["area"] = _read_str(buffer)
+    (count,) = LENGTH.unpack(buffer.read(LENGTH.size))
+    data["moveable_zones"] = [_read_str(buffer) for _ in range(count)]
+    return data
+
+
+decoders: dict[int, Callable[[io.BytesIO], dict[str, Any]]] = {1: _decode_v1}
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    # The old saves were pickled while running main_file.py or map.py, so their classes are stored as __main__.
+    def find_class(self, module: str, name: str) -> Any:
+        if module != "__main__":
+            return super().find_class(module, name)
+        try:
+            return super().find_class("main_file", name)
+        except AttributeError:
+            return super().find_class("map", name)
+
+
+def decode(contents: bytes) -> dict[str, Any]:
+    """Unpacks a save file of any version into the current version of the save data.
+
+    Args:
+        contents (bytes): The save file contents.
+
+    Raises:
+        SaveError: If the contents aren't a save file, or are from an unknown version.
+
+    Returns:
+        dict[str, Any]: The save data, ready for GameData.from_save().
+    """
+    if contents.startswith(b"\x80"):  # Every pickle starts with the PROTO opcode.
+        try:
+            game_data = _LegacyUnpickler(io.BytesIO(contents)).load()
+        except Exception as error:
+            raise SaveError(f"Could not read old save: {error}") from error
+        return migrate(vars(game_data), 0)
+
+    buffer = io.BytesIO(contents)
+    try:
+        magic, version = HEADER.unpack(buffer.read(HEADER.size))
+    except struct.error:
+        raise SaveError("Save file is empty or too short.") from None
+    if magic != MAGIC:
+        raise SaveError("Not a save file.")
+    if version not in decoders:
+        raise SaveError(f"Unknown save version {version}.")
+
+    try:
+        data = decoders[version](buffer)
+    except (struct.error, UnicodeDecodeError) as error:
+        raise SaveError(f"Save file is corrupted: {error}") from error
+    return migrate(data, version)
+
+
+# ------------------ Changes ------------------ #
+
+# Every field of the save data, in the order their numbers are given in a change record. Only ever add to the end.
+FIELDS = ("class", "name", *PLAYER_STATS, "game_is_running", "zone", "area", "moveable_zones")
+FIELD_NUMBERS = {field: number for number, field in enumerate(FIELDS)}
+
+INT = struct.Struct("<i")
+BOOL = struct.Struct("<?")
+
+
+def encode_changes(changes: dict[str, Any]) -> bytes:
+    """Packs the fields of the save data that changed, e.g. {"health": 80, "zone": "B2"}."""
+    buffer = io.BytesIO()
+    buffer.write(LENGTH.pack(len(changes)))
+    for field, value in changes.items():
+        buffer.write(bytes((FIELD_NUMBERS[field],)))
+        if field == "moveable_zones":
+            buffer.write(LENGTH.pack(len(value)))
+            for zone in value:
+                _write_str(buffer, zone)
+        elif field == "game_is_running":
+            buffer.write(BOOL.pack(value))
+        elif field in PLAYER_STATS:
+            buffer.write(INT.pack(value))
+        else:
+            _write_str(buffer, value)
+    return buffer.getvalue()
+
+
+def diff(saved: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Gets the fields of the save data that are different from the save data before, e.g. diff(last_save, game_data.to_save())."""
+    return {field: value for field, value in data.items() if saved.get(field) != value}
+
+
+def decode_changes(contents: bytes) -> dict[str, Any]:
+    buffer = io.BytesIO(contents)
+    changes: dict[str, Any] = {}
+    (count,) = LENGTH.unpack(buffer.read(LENGTH.size))
+    for _ in range(count):
+        field = FIELDS[buffer.read(1)[0]]
+        if field == "moveable_zones":
+            (zones,) = LENGTH.unpack(buffer.read(LENGTH.size))
+            changes[field] = [_read_str(buffer) for _ in range(zones)]
+        elif field == "game_is_running":
+            (changes[field],) = BOOL.unpack(buffer.read(BOOL.size))
+        elif field in PLAYER_STATS:
+            (changes[field],) = INT.unpack(buffer.read(INT.size))
+        else:
+            changes[field] = _read_str(buffer)
+    return changes
+
+
+# ------------------ Save Logs ------------------ #
+
+LOG_MAGIC = b"TRPL"
+LOG_VERSION = 1
+
+# Each record is its kind and length, the contents, then a checksum of the contents,
+# so a record that was only part written when the game crashed is spotted and ignored.
+RECORD = struct.Struct("<BI")
+CHECKSUM = struct.Struct("<I")
+SNAPSHOT = 0  # The whole save data, encoded with encode().
+CHANGES = 1  # The fields that changed since the record before, encoded with encode_changes().
+
+# After this many changes, the log is compacted into a new snapshot, so it never grows much bigger than a snapshot.
+COMPACT_AFTER = 100
+
+
+def _record(kind: int, contents: bytes) -> bytes:
+    return RECORD.pack(kind, len(contents)) + contents + CHECKSUM.pack(zlib.crc32(contents))
+
+
+def read_log(contents: bytes) -> tuple[dict[str, Any], int, int]:
+    """Replays a save log's changes over its snapshot.
+
+    Args:
+        contents (bytes): The save log's contents.
+
+    Raises:
+        SaveError: If the log is from an unknown version, or doesn't start with a whole snapshot.
+
+    Returns:
+        tuple[dict[str, Any], int, int]: The save data, the length of the log up to the end of its last whole record,
+            and the number of change records.
+    """
+    if len(contents) < HEADER.size:
+        raise SaveError("Save file is empty or too short.")
+    magic, version = HEADER.unpack_from(contents)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise SaveError(f"Unknown save log version {version}.")
+
+    data: dict[str, Any] | None = None
+    changes = 0
+    offset = HEADER.size
+    while offset + RECORD.size <= len(contents):
+        kind, length = RECORD.unpack_from(contents, offset)
+        start = offset + RECORD.size
+        end = start + length
+        if end + CHECKSUM.size > len(contents):
+            break  # Part written, the game stopped while saving.
+        record = contents[start:end]
+        if CHECKSUM.unpack_from(contents, end)[0] != zlib.crc32(record):
+            break
+
+        if kind == SNAPSHOT:
+            data = decode(record)
+            changes = 0
+        elif kind == CHANGES and data is not None:
+            try:
+                data.update(decode_changes(record))
+            except (struct.error, IndexError, UnicodeDecodeError) as error:
+                raise SaveError(f"Save file is corrupted: {error}") from error
+            changes += 1
+        else:
+            raise SaveError(f"Save file is corrupted: unexpected record {kind}.")
+        offset = end + CHECKSUM.size
+
+    if data is None:
+        raise SaveError("Save file is corrupted: it has no snapshot.")
+    return data, offset, changes
+
+
+class SaveLog:
+    """Writes a save file as a log. The first save writes a snapshot, and the saves after it only add the fields that changed."""
+
+    def __init__(self, path: str, compact_after: int = COMPACT_AFTER):
+        """Initialises the save log. Nothing is written until a snapshot is.
+
+        Args:
+            path (str): The save file.
+            compact_after (int, optional): How many changes the log holds before it is compacted. Defaults to COMPACT_AFTER.
+        """
+        self.path = path
+        self.compact_after = compact_after
+        self.stat: tuple[int, int, int] | None = None  # The file as this last wrote it, see _stat(). None if it hasn't yet.
+        self.changes = 0
+        self.saved: dict[str, Any] | None = None  # The save data as it is in the file, None if this hasn't written it.
+
+    @staticmethod
+    def _stat(stat: os.stat_result) -> tuple[int, int, int]:
+        # A file replaced by another save has a new inode, and one added to or rewritten has a new size or modification time.
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def is_current(self) -> bool:
+        """Checks the file is as this log left it, so changes can be added to it.
+        If anything else has written to it since, or it was never written by this log, it needs a snapshot first.
+        """
+        try:
+            return self.stat is not None and self._stat(os.stat(self.path)) == self.stat
+        except OSError:
+            return False
+
+    @instrument.timed("save")
+    def write_snapshot(self, data: dict[str, Any]) -> None:
+        """Replaces the file with a snapshot of the whole save data."""
+        contents = HEADER.pack(LOG_MAGIC, LOG_VERSION) + _record(SNAPSHOT, encode(data))
+        atomic_write(self.path, contents)
+        self.stat = self._stat(os.stat(self.path))
+        self.changes = 0
+        self.saved = dict(data)
+
+    @instrument.timed("save_changes")
+    def append(self, changes: dict[str, Any]) -> None:
+        """Adds the fields that changed to the end of the file, compacting it if it has enough changes.
+
+        Raises:
+            SaveError: If the file isn't as this log left it, see is_current().
+        """
+        if not self.is_current():
+            raise SaveError(f"{self.path} has changed since it was saved, so it needs a snapshot.")
+
+        record = _record(CHANGES, encode_changes(changes))
+        with open(self.path, "ab") as file:
+            file.write(record)
+            file.flush()
+            os.fsync(file.fileno())
+            self.stat = self._stat(os.fstat(file.fileno()))
+        self.changes += 1
+        self.saved.update(changes)
+
+        if self.changes >= self.compact_after:
+            self.compact()
+
+    def compact(self) -> None:
+        """Replays the log and writes it again as a single snapshot."""
+        self.write_snapshot(load(self.path))
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Saves the save data. Only the fields that are different from the last save through this log are added,
+        unless the file has been written by something else since, in which case the whole save data is.
+        """
+        if self.saved is None or not self.is_current():
+            self.write_snapshot(data)
+            return
+        changes = diff(self.saved, data)
+        if changes:
+            self.append(changes)
+
+
+# ------------------ Files ------------------ #
+
+
+def atomic_write(path: str, contents: bytes) -> None:
+    """Writes a file so that it either has the old contents or the new ones, even if the game crashes part way through.
+    The contents are written to a temporary file next to it, synced to disk and then renamed over the original.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)  # A session's save folder isn't made until it first saves.
+    # Each write gets its own uniquely named temporary file, so threads saving at the same time never share one.
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(contents)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # Sync the folder as well, so the rename itself survives a crash. Windows can't open folders, so it's skipped there.
+    if os.name != "nt":
+        folder = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(folder)
+        finally:
+            os.close(folder)
+
+
+@instrument.timed("save")
+def save(path: str, data: dict[str, Any]) -> None:
+    atomic_write(path, encode(data))
+
+
+@instrument.timed("load")
+def load(path: str) -> dict[str, Any]:
+    """Loads a save file, either a snapshot or a save log."""
+    with open(path, "rb") as file:
+        contents = file.read()
+    if contents.startswith(LOG_MAGIC):
+        return read_log(contents)[0]
+    return decode(contents)
@@ -0,0 +1,348 @@
+""" This module contains the game server, which hosts many players at once in a single process.
+Players connect over TCP (or a Unix socket) and each gets their own session, with its own GameData and save folder,
+while every session shares the same zone_data, area_data and enemy_data.
+
+The server is thread-per-session, not asyncio-native. The game's rules are ordinary blocking code that waits for
+each answer, so each session plays on its own thread through a NetworkPort, and the asyncio event loop only passes
+lines between the sockets and the sessions. Sessions never pause.
+A session's output goes through a small queue that the event loop writes to its socket as fast as the player reads it,
+so a player who stops reading holds up their own session once the queue is full, rather than filling up the server's memory.
+
+The protocol is one line at a time, in UTF-8. The client sends one line for each answer, and the server sends:
+    OUT <text>     A line of the game's output.
+    ASK <prompt>   The game is waiting for the next line from the client.
+    END <state>    The session is over, e.g. END exit when the player leaves from the main menu.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import asyncio
+import itertools
+import os
+import queue
+import threading
+
+import autosave
+import journal
+import main_file
+import saves
+from ports import IOPort, set_port
+from rng import RandomStreams
+
+# ------------------ Settings ------------------ #
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+# How many connections can wait to be accepted. Load tests connect thousands of players at once,
+# and the default of 100 leaves the rest waiting on the operating system to retry.
+BACKLOG = 4096
+
+# Each session's save slots are kept in a folder of its own in here, so players never load or overwrite each other's saves.
+SESSION_SAVE_DIR = os.path.join(saves.SAVE_DIR, "Sessions")
+
+# Session threads only run the game's shallow state machine, so they get a small stack,
+# which lets a server run thousands of them.
+SESSION_STACK_SIZE = 256 * 1024
+
+# How many batches of output a session can have waiting to be written before it waits for its player to read them.
+# A batch is everything up to and including the next ASK, so the game is never held up by a player who is keeping up.
+OUTPUT_QUEUE_SIZE = 8
+
+# ------------------ Sessions ------------------ #
+
+
+class SessionClosed(Exception):
+    """Raised on a session's thread when its player disconnects, to stop the game it is running."""
+
+
+class NetworkPort(IOPort):
+    """Plays a game over a connection, using the protocol at the top of this module. It never pauses.
+    ask() and write() are called on the session's thread, and the lines are written by the event loop in pump().
+    """
+
+    name = "network"
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, writer: asyncio.StreamWriter):
+        self.loop = loop
+        self.writer = writer
+        self.inputs: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self.outputs: asyncio.Queue[bytes | None] = asyncio.Queue(OUTPUT_QUEUE_SIZE)
+        self.answers = 0
+
+        self._output: list[str] = []  # Lines waiting to be sent with the next ASK.
+        self._partial = ""  # Text written since the last new line.
+
+    def write(self, lines: list[str], delay: float = 0.0, sep: str = "", end: str = "\n") -> None:
+        # Output is sent in one go when the game next asks for input, or when it ends.
+        text = "".join((sep.join(line) + sep if sep and line else line) + end for line in lines)
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        self._output.extend(f"OUT {line}\n" for line in lines)
+
+    def ask(self, prompt: str = "") -> str:
+        """Sends the output so far and the prompt, then waits for the player's answer."""
+        if self._partial:
+            prompt, self._partial = self._partial + prompt, ""
+        self._send(f"ASK {prompt}\n")
+
+        line = self.inputs.get()
+        if line is None:
+            raise SessionClosed
+        self.answers += 1
+        return line
+
+    def end(self, reason: str) -> None:
+        """Sends the rest of the output and the reason the session is over. Nothing can be sent after it."""
+        if self._partial:
+            self.write([""])
+        self._send(f"END {reason}\n")
+        self._put(None)
+
+    def _send(self, last_line: str) -> None:
+        self._output.append(last_line)
+        data = "".join(self._output).encode("utf-8")
+        self._output.clear()
+        self._put(data)
+
+    def _put(self, data: bytes | None) -> None:
+        # Waits here, on the session's thread, while the queue is full.
+        asyncio.run_coroutine_threadsafe(self.outputs.put(data), self.loop).result()
+
+    async def pump(self) -> None:
+        """Writes the session's output to the connection until it ends, waiting for the player to read each batch.
+        Called on the event loop. If the connection is lost, the rest of the output is thrown away.
+        """
+        while (data := await self.outputs.get()) is not None:
+            if self.writer.is_closing():
+                continue
+            self.writer.write(data)
+            try:
+                await self.writer.drain()
+            except ConnectionError:
+                pass
+
+
+class Session:
+    """One player's game, played on its own thread."""
+
+    def __init__(
+        self,
+        session_id: int,
+        loop: asyncio.AbstractEventLoop,
+        writer: asyncio.StreamWriter,
+        state: str = main_file.MAIN_MENU,
+        rng: RandomStreams | None = None,
+        journal_path: str | None = None,
+        save_dir: str | None = None,
+    ):
+        """Initialises the session. The game doesn't start until start() is called.
+
+        Args:
+            session_id (int): A number identifying the session on this server.
+            loop (asyncio.AbstractEventLoop): The server's event loop, which owns the writer.
+            writer (asyncio.StreamWriter): The connection to the player.
+            state (str, optional): The state the game starts in. Defaults to main_file.MAIN_MENU.
+            rng (RandomStreams, optional): The session's random streams. Defaults to None, which picks a random seed.
+            journal_path (str, optional): Records the session in a journal here, see journal.py. Defaults to None.
+            save_dir (str, optional): The folder the session's save slots are in. Defaults to None,
+                which uses a folder named after the session in SESSION_SAVE_DIR.
+        """
+        self.session_id = session_id
+        self.loop = loop
+        self.writer = writer
+        self.state = state
+        self.save_dir = save_dir or os.path.join(SESSION_SAVE_DIR, f"session-{session_id}")
+        self.game_data = main_file.new_game_data(rng, save_dir=self.save_dir)
+        self.port = NetworkPort(loop, writer)
+        self.journal_path = journal_path
+        self.finished: asyncio.Future = loop.create_future()
+        self._thread = threading.Thread(target=self._play, name=f"session-{session_id}", daemon=True)
+        self._pump: asyncio.Task | None = None
+
+    @property
+    def commands(self) -> int:
+        return self.port.answers
+
+    def start(self) -> None:
+        """Starts the session's thread, with a small stack, and writing its output. Called on the event loop."""
+        self._pump = self.loop.create_task(self.port.pump())
+        # The stack size applies to every thread started after it's set, so it's put back straight away.
+        stack_size = threading.stack_size(SESSION_STACK_SIZE)
+        try:
+            self._thread.start()
+        finally:
+            threading.stack_size(stack_size)
+
+    def _play(self) -> None:
+        # The port only applies to this thread, so every session plays through its own.
+        session_journal = None
+        if self.journal_path is not None:
+            session_journal = journal.Journal(self.journal_path, self.game_data.rng.seed, self.state)
+            set_port(journal.RecordingPort(self.port, session_journal))
+        else:
+            set_port(self.port)
+        # Each session autosaves to the autosave slot in its own save folder.
+        autosaver = autosave.Autosaver(directory=self.save_dir, flush_on_exit=False)
+        end = main_file.EXIT
+        try:
+            end = main_file.run(self.game_data, state=self.state, autosaver=autosaver)
+        except SessionClosed:
+            end = "disconnected"
+        except SystemExit:
+            end = main_file.EXIT  # Some menus still call exit(), which only ends this session here.
+        except Exception as error:  # A bug in one session shouldn't take the others down with it.
+            end = f"error {type(error).__name__}: {error}"
+        finally:
+            autosaver.close()  # Writes anything the session asked to save before it ended.
+            if session_journal is not None:
+                if not end.startswith(("disconnected", "error")):
+                    session_journal.record(journal.END, end)
+                session_journal.close()
+            self.port.end(end)
+            asyncio.run_coroutine_threadsafe(self._finish(end), self.loop)
+
+    async def _finish(self, end: str) -> None:
+        await self._pump  # Everything the session sent is written before the connection is closed.
+        if not self.finished.done():
+            self.finished.set_result(end)
+        self.writer.close()
+
+    # These are called on the event loop.
+
+    def receive(self, line: str) -> None:
+        self.port.inputs.put(line)
+
+    def disconnect(self) -> None:
+        self.port.inputs.put(None)
+
+    def abort(self) -> None:
+        """Ends the session without waiting for the player to read the rest of its output."""
+        self.disconnect()
+        self.writer.transport.abort()
+
+
+# ------------------ Server ------------------ #
+
+
+class GameServer:
+    """Accepts players and runs a session for each of them."""
+
+    def __init__(
+        self,
+        host: str = HOST,
+        port: int = PORT,
+        path: str | None = None,
+        state: str = main_file.MAIN_MENU,
+        seed: int | None = None,
+        journal_dir: str | None = None,
+        save_dir: str = SESSION_SAVE_DIR,
+    ):
+        """Initialises the server. It doesn't listen until start() is called.
+
+        Args:
+            host (str, optional): The address to listen on. Defaults to HOST, which only accepts local connections.
+            port (int, optional): The port to listen on, or 0 to pick a free one. Defaults to PORT.
+            path (str, optional): Listens on a Unix socket at this path instead of TCP. Defaults to None.
+            state (str, optional): The state new sessions start in. Defaults to main_file.MAIN_MENU.
+            seed (int, optional): Every session's random streams are split off from this seed, by session ID,
+                so a session can be replayed from the two. Defaults to None, which picks a random seed.
+            journal_dir (str, optional): Records every session in a journal in this folder, named after the session
+                and the server's seed, see journal.py. Defaults to None, which doesn't record them.
+            save_dir (str, optional): Every session saves to a folder of its own in here, named after the session
+                and the server's seed, the same as its journal. Defaults to SESSION_SAVE_DIR.
+        """
+        self.host = host
+        self.port = port
+        self.path = path
+        self.state = state
+        self.rng = RandomStreams(seed)
+        self.journal_dir = journal_dir
+        self.save_dir = save_dir
+        self.sessions: dict[int, Session] = {}
+        self._ids = itertools.count(1)
+        self._server: asyncio.AbstractServer | None = None
+
+        # Metrics
+        self.sessions_started = 0
+        self.sessions_finished = 0
+        self.commands = 0  # From finished sessions, see metrics() for the total.
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        """The path or (host, port) the server is listening on, with the real port if 0 was asked for."""
+        if self.path is not None:
+            return self.path
+        if self._server is not None:
+            return self._server.sockets[0].getsockname()[:2]
+        return self.host, self.port
+
+    async def start(self) -> None:
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path, backlog=BACKLOG)
+        else:
+            self._server = await asyncio.start_server(self._handle, host=self.host, port=self.port, backlog=BACKLOG)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stops accepting players and ends every session."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in list(self.sessions.values()):
+            session.abort()  # A player who has stopped reading would otherwise keep their session waiting forever.
+        if self.sessions:
+            await asyncio.gather(*(session.finished for session in self.sessions.values()))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session_id = next(self._ids)
+        session = Session(
+            session_id,
+            asyncio.get_running_loop(),
+            writer,
+            state=self.state,
+            rng=self.rng.child("session", session_id),
+            journal_path=(
+                os.path.join(self.journal_dir, f"{self.rng.seed}-session-{session_id}.journal")
+                if self.journal_dir is not None
+                else None
+            ),
+            save_dir=os.path.join(self.save_dir, f"{self.rng.seed}-session-{session_id}"),
+        )
+        self.sessions[session.session_id] = session
+        self.sessions_started += 1
+        session.start()
+        try:
+            while not session.finished.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                session.receive(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            session.disconnect()
+            await session.finished
+            del self.sessions[session.session_id]
+            self.sessions_finished += 1
+            self.commands += session.commands
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "sessions": len(self.sessions),
+            "sessions_started": self.sessions_started,
+            "sessions_finished": self.sessions_finished,
+            "commands": self.commands + sum(session.commands for session in self.sessions.values()),
+        }
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    server = GameServer()
+    print(f"Serving the game on {server.host}:{server.port}")
+    asyncio.run(server.serve_forever())
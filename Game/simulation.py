@@ -0,0 +1,259 @@
+""" This module contains the headless battle engine for the Text-RPG game.
+It fights the player classes against the enemies in enemy_data without any input, printing or delays,
+using the same damage rules as battle() in main_file.py, so that thousands of fights can be run to balance the game.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import random
+from collections import Counter
+from typing import Callable, NamedTuple
+
+from main_file import AttackMove, Character, Enemy, Warrior, Mage, Rogue, enemy_data
+from rng import RandomStreams
+
+# ------------------ Battle Results ------------------ #
+
+WIN = "win"
+LOSS = "loss"
+TIMEOUT = "timeout"
+
+
+class BattleResult(NamedTuple):
+    """The outcome of a single headless fight."""
+
+    outcome: str
+    turns: int
+    damage_dealt: int
+    damage_taken: int
+
+
+class BattleStats:
+    """Aggregates the results of many fights between one class and one enemy."""
+
+    def __init__(self):
+        self.fights = 0
+        self.outcomes: Counter[str] = Counter()
+        self.turns_to_kill: Counter[int] = Counter()  # Only counts fights the player won.
+        self.damage_dealt: Counter[int] = Counter()
+        self.damage_taken: Counter[int] = Counter()
+
+    def add(self, result: BattleResult) -> None:
+        self.fights += 1
+        self.outcomes[result.outcome] += 1
+        if result.outcome == WIN:
+            self.turns_to_kill[result.turns] += 1
+        self.damage_dealt[result.damage_dealt] += 1
+        self.damage_taken[result.damage_taken] += 1
+
+    def merge(self, other: "BattleStats") -> "BattleStats":
+        """Adds the results of another BattleStats into this one, e.g. from another batch of fights."""
+        self.fights += other.fights
+        self.outcomes.update(other.outcomes)
+        self.turns_to_kill.update(other.turns_to_kill)
+        self.damage_dealt.update(other.damage_dealt)
+        self.damage_taken.update(other.damage_taken)
+        return self
+
+    @property
+    def win_rate(self) -> float:
+        return self.outcomes[WIN] / self.fights if self.fights else 0.0
+
+    @staticmethod
+    def mean(distribution: Counter[int]) -> float:
+        """Gets the mean of one of the distributions, e.g. BattleStats.mean(stats.turns_to_kill)."""
+        total = sum(distribution.values())
+        if total == 0:
+            return 0.0
+        return sum(value * count for value, count in distribution.items()) / total
+
+    def __str__(self) -> str:
+        return (
+            f"Fights: {self.fights}, Win rate: {self.win_rate:.1%}, "
+            f"Turns to kill: {self.mean(self.turns_to_kill):.2f}, "
+            f"Damage dealt: {self.mean(self.damage_dealt):.2f}, "
+            f"Damage taken: {self.mean(self.damage_taken):.2f}"
+        )
+
+
+# ------------------ Move Policies ------------------ #
+
+# A policy picks the index of the move to use this turn. It is given the damage each move deals to the enemy,
+# the damage the player takes when using each move, the player's health, the enemy's health and a random generator.
+Policy = Callable[[list[int], list[int], int, int, random.Random], int]
+
+
+def random_policy(damage_dealt, damage_taken, player_health, enemy_health, rng) -> int:
+    """Picks any move, like a player mashing numbers."""
+    return rng.randrange(len(damage_dealt))
+
+
+def aggressive_policy(damage_dealt, damage_taken, player_health, enemy_health, rng) -> int:
+    """Always picks the move that deals the most damage."""
+    return damage_dealt.index(max(damage_dealt))
+
+
+def fixed_policy(index: int) -> Policy:
+    """Creates a policy that always picks the same move."""
+
+    def policy(damage_dealt, damage_taken, player_health, enemy_health, rng) -> int:
+        return index
+
+    return policy
+
+
+# ------------------ Battle Engine ------------------ #
+
+
+def get_attack_moves(player: Character) -> list[AttackMove]:
+    """Gets the moves a player can use in a headless fight, the same ones they have in the game."""
+    return player.attack_moves
+
+
+def damage_tables(player: Character, enemy: Enemy) -> tuple[list[int], list[int]]:
+    """Works out the damage of every move in both directions, using the game's damage rules.
+    Neither side's stats change during a fight, so this only needs to be done once per matchup.
+
+    Returns:
+        tuple[list[int], list[int]]: The damage each move deals, and the damage taken while using each move.
+    """
+    moves = get_attack_moves(player)
+    damage_dealt = [move.damage_against(enemy) for move in moves]
+    damage_taken = [enemy.damage_against(player, move)[0] for move in moves]
+    return damage_dealt, damage_taken
+
+
+def _fight(
+    player_health: int,
+    enemy_health: int,
+    damage_dealt: list[int],
+    damage_taken: list[int],
+    policy: Policy,
+    rng: random.Random,
+    max_turns: int,
+) -> BattleResult:
+    # The same turn order as battle(): the player attacks, then the enemy attacks back if it survived.
+    dealt = 0
+    taken = 0
+    for turn in range(1, max_turns + 1):
+        choice = policy(damage_dealt, damage_taken, player_health, enemy_health, rng)
+
+        enemy_health -= damage_dealt[choice]
+        dealt += damage_dealt[choice]
+        if enemy_health <= 0:
+            return BattleResult(WIN, turn, dealt, taken)
+
+        player_health -= damage_taken[choice]
+        taken += damage_taken[choice]
+        if player_health <= 0:
+            return BattleResult(LOSS, turn, dealt, taken)
+
+    return BattleResult(TIMEOUT, max_turns, dealt, taken)
+
+
+def simulate_battle(
+    player: Character,
+    enemy: Enemy,
+    policy: Policy = aggressive_policy,
+    rng: random.Random | None = None,
+    max_turns: int = 100,
+) -> BattleResult:
+    """Runs a single fight without changing the player or the enemy.
+
+    Args:
+        player (Character): The player fighting.
+        enemy (Enemy): The enemy being fought.
+        policy (Policy, optional): Picks the player's move every turn. Defaults to aggressive_policy.
+        rng (random.Random, optional): Random generator passed to the policy. Defaults to a new unseeded one.
+        max_turns (int, optional): Stops fights where neither side can hurt the other. Defaults to 100.
+
+    Returns:
+        BattleResult: The outcome of the fight.
+    """
+    damage_dealt, damage_taken = damage_tables(player, enemy)
+    return _fight(
+        player.health,
+        enemy.health,
+        damage_dealt,
+        damage_taken,
+        policy,
+        rng or random.Random(),
+        max_turns,
+    )
+
+
+def run_battles(
+    player: Character,
+    enemy: Enemy,
+    fights: int,
+    policy: Policy = aggressive_policy,
+    seed: int | None = None,
+    max_turns: int = 100,
+) -> BattleStats:
+    """Runs many fights between a player and an enemy, each starting from full health.
+
+    Args:
+        player (Character): The player fighting.
+        enemy (Enemy): The enemy being fought.
+        fights (int): The number of fights to run.
+        policy (Policy, optional): Picks the player's move every turn. Defaults to aggressive_policy.
+        seed (int, optional): Seed for the random generator, so runs can be repeated. Defaults to None.
+        max_turns (int, optional): Stops fights where neither side can hurt the other. Defaults to 100.
+
+    Returns:
+        BattleStats: The aggregated results of the fights.
+    """
+    rng = random.Random(seed)
+    damage_dealt, damage_taken = damage_tables(player, enemy)
+    player_health = player.health
+    enemy_health = enemy.health
+
+    stats = BattleStats()
+    add = stats.add
+    for _ in range(fights):
+        add(
+            _fight(
+                player_health,
+                enemy_health,
+                damage_dealt,
+                damage_taken,
+                policy,
+                rng,
+                max_turns,
+            )
+        )
+
+    return stats
+
+
+def run_matchups(
+    classes: tuple[type[Character], ...] = (Warrior, Mage, Rogue),
+    enemies: dict[str, dict[str, Enemy]] = enemy_data,
+    fights: int = 10_000,
+    policy: Policy = aggressive_policy,
+    seed: int | None = None,
+) -> dict[tuple[str, str, str], BattleStats]:
+    """Fights every class against every enemy.
+
+    Returns:
+        dict[tuple[str, str, str], BattleStats]: The results, keyed by (class name, biome, enemy name).
+    """
+    # Each matchup gets its own seed split off from the one given, so adding or removing a matchup
+    # doesn't change the results of the others, and they could be run in any order or in parallel.
+    streams = RandomStreams(seed)
+    results = {}
+    for player_class in classes:
+        player = player_class("Simulation")
+        for biome, biome_enemies in enemies.items():
+            for enemy_name, enemy in biome_enemies.items():
+                key = (player_class.__name__, biome, enemy_name)
+                results[key] = run_battles(player, enemy, fights, policy=policy, seed=streams.child(*key).seed)
+
+    return results
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    for (class_name, biome, enemy_name), stats in run_matchups(seed=0).items():
+        print(f"{class_name:<8} vs {enemy_name:<10} ({biome}): {stats}")
@@ -0,0 +1,146 @@
+""" This module contains the spawn tables used to pick which enemy the player encounters.
+Each biome gets one alias table per enemy difficulty, built once when the enemy data is loaded,
+so that picking an enemy only takes a single random number instead of rebuilding the weights every encounter.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import random
+from bisect import bisect_right
+from typing import Any
+
+# ------------------ Alias Table ------------------ #
+
+
+class AliasTable:
+    """Samples from a weighted list in O(1) using Vose's alias method."""
+
+    def __init__(self, items: list[Any], weights: list[float]):
+        """Initialises the alias table.
+
+        Args:
+            items (list[Any]): The items to sample from.
+            weights (list[float]): The weight of each item. They don't need to add up to 1.
+
+        Raises:
+            ValueError: If there are no items, or all the weights are 0, the same as random.choices().
+        """
+        total = sum(weights)
+        if not items or total <= 0:
+            raise ValueError("Total of weights must be greater than zero")
+
+        size = len(items)
+        scaled = [weight * size / total for weight in weights]
+        self.items = items
+        self.probability = [1.0] * size
+        self.alias = list(range(size))
+
+        small = [i for i, weight in enumerate(scaled) if weight < 1]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Anything left over is 1 apart from floating point error, so keeps the defaults.
+
+    def sample(self, rng: random.Random | Any = random) -> Any:
+        # A single random number picks both the column and whether to use its alias.
+        position = rng.random() * len(self.items)
+        column = int(position)
+        if position - column < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+
+# ------------------ Spawn Tables ------------------ #
+
+
+class SpawnTables:
+    """Precomputed spawn tables for every biome and difficulty.
+    An enemy can spawn in an area if its difficulty is at or below the area's difficulty, and is weighted by its difficulty.
+    """
+
+    def __init__(self, enemy_data: dict[str, dict[str, Any]]):
+        """Initialises the spawn tables and builds them from the enemy data.
+
+        Args:
+            enemy_data (dict[str, dict[str, Enemy]]): The enemies in each biome. Kept as a reference,
+                so if it is changed afterwards, invalidate() has to be called for the changes to be picked up.
+        """
+        self.enemy_data = enemy_data
+        # biome -> (sorted enemy difficulties, one table per difficulty or None if every weight is 0)
+        self._thresholds: dict[str, tuple[list[int], list[AliasTable | None]]] = {}
+        # (biome, area difficulty) -> table, filled in as areas are visited.
+        self._lookup: dict[tuple[str, int], AliasTable | None] = {}
+        self.build()
+
+    def build(self, biome: str | None = None) -> None:
+        """Builds the tables for one biome, or for every biome if none is given."""
+        biomes = [biome] if biome is not None else list(self.enemy_data)
+        for name in biomes:
+            if name not in self.enemy_data:
+                self._thresholds.pop(name, None)
+                continue
+
+            enemies = sorted(self.enemy_data[name].values(), key=lambda enemy: enemy.difficulty)
+            difficulties: list[int] = []
+            tables: list[AliasTable | None] = []
+            for i, enemy in enumerate(enemies):
+                # Enemies sharing a difficulty share a table, the last of them includes them all.
+                if i + 1 < len(enemies) and enemies[i + 1].difficulty == enemy.difficulty:
+                    continue
+                valid_enemies = enemies[: i + 1]
+                weights = [valid_enemy.difficulty for valid_enemy in valid_enemies]
+                difficulties.append(enemy.difficulty)
+                tables.append(AliasTable(valid_enemies, weights) if sum(weights) > 0 else None)
+
+            self._thresholds[name] = (difficulties, tables)
+
+    def invalidate(self, biome: str | None = None) -> None:
+        """Rebuilds the tables after the enemy data has changed.
+
+        Args:
+            biome (str, optional): The biome that changed. Defaults to None, which rebuilds every biome.
+        """
+        if biome is None:
+            self._thresholds.clear()
+            self._lookup.clear()
+        else:
+            self._lookup = {key: table for key, table in self._lookup.items() if key[0] != biome}
+        self.build(biome)
+
+    def table(self, biome: str, difficulty: int) -> AliasTable | None:
+        """Gets the table for an area, or None if nothing can spawn there, including biomes without any enemies."""
+        key = (biome, difficulty)
+        try:
+            return self._lookup[key]
+        except KeyError:
+            pass
+
+        # Most biomes don't have any enemies yet, so nothing spawns in them.
+        difficulties, tables = self._thresholds.get(biome, ((), ()))
+        index = bisect_right(difficulties, difficulty) - 1
+        table = tables[index] if index >= 0 else None
+        self._lookup[key] = table
+        return table
+
+    def sample(self, biome: str, difficulty: int, rng: random.Random | Any = random) -> Any:
+        """Picks an enemy for an area.
+
+        Args:
+            biome (str): The biome of the area.
+            difficulty (int): The difficulty of the area.
+            rng (random.Random, optional): The random generator to use. Defaults to the random module.
+
+        Raises:
+            ValueError: If no enemy can spawn in the area.
+
+        Returns:
+            Enemy: The enemy from the enemy data. It is shared, so should be copied before being changed.
+        """
+        table = self.table(biome, difficulty)
+        if table is None:
+            raise ValueError(f"No enemies can spawn in {biome} at difficulty {difficulty}.")
+        return table.sample(rng)
@@ -0,0 +1,172 @@
+""" This module contains the chunk manager, which streams a generated world in and out of memory as the player moves.
+Zones and areas are only created for the chunks around the player, and a limited number of chunks are kept,
+with the least recently used ones dropped first, so memory stays the same however big the world is.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+from collections import OrderedDict
+from time import perf_counter
+
+import map
+from worldgen import WorldGenerator
+
+# ------------------ Chunk Manager ------------------ #
+
+
+class LoadedChunk:
+    """The game objects for one chunk of the world."""
+
+    __slots__ = ("zones", "areas")
+
+    def __init__(self, zones: dict[str, map.Zone], areas: dict[str, dict[str, map.Area]]):
+        self.zones = zones
+        self.areas = areas
+
+
+class ChunkManager:
+    """Loads chunks of a generated world on demand and keeps the most recently used ones."""
+
+    def __init__(
+        self,
+        generator: WorldGenerator,
+        world_id: str,
+        radius: int = 1,
+        capacity: int | None = None,
+    ):
+        """Initialises the chunk manager. Nothing is loaded until a zone is asked for.
+
+        Args:
+            generator (WorldGenerator): Generates the chunks.
+            world_id (str): The ID the world is registered under, given to every zone that is loaded.
+            radius (int, optional): How many chunks around the player's chunk to load ahead of time. Defaults to 1.
+            capacity (int, optional): The most chunks kept loaded. Defaults to twice the chunks within the radius.
+        """
+        self.generator = generator
+        self.world_id = world_id
+        self.radius = radius
+        self.capacity = capacity if capacity is not None else 2 * (2 * radius + 1) ** 2
+        self._chunks: OrderedDict[tuple[int, int], LoadedChunk] = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+        self.max_load_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def mean_load_seconds(self) -> float:
+        return self.load_seconds / self.misses if self.misses else 0.0
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "loaded_chunks": len(self._chunks),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "mean_load_ms": self.mean_load_seconds * 1000,
+            "max_load_ms": self.max_load_seconds * 1000,
+        }
+
+    def is_loaded(self, chunk: tuple[int, int]) -> bool:
+        return chunk in self._chunks
+
+    def chunk(self, chunk: tuple[int, int]) -> LoadedChunk:
+        """Gets a chunk, loading it if it isn't already. Either way it becomes the most recently used."""
+        try:
+            loaded = self._chunks[chunk]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._chunks.move_to_end(chunk)
+            return loaded
+
+        self.misses += 1
+        start = perf_counter()
+        zones, areas = {}, {}
+        for generated in self.generator.chunk(*chunk).zones:
+            zone, zone_areas = self.generator.build_zone(generated, self.world_id)
+            zones[zone.name] = zone
+            areas[zone.name] = zone_areas
+        loaded = self._chunks[chunk] = LoadedChunk(zones, areas)
+        elapsed = perf_counter() - start
+        self.load_seconds += elapsed
+        self.max_load_seconds = max(self.max_load_seconds, elapsed)
+
+        self._evict()
+        return loaded
+
+    def focus(self, zone_name: str) -> None:
+        """Loads the chunks around a zone, normally the one the player is in."""
+        centre_x, centre_y = self.generator.chunk_of(zone_name)
+        # The player's own chunk is touched last, so it is the most recently used and the last to be evicted.
+        for chunk_y in range(centre_y - self.radius, centre_y + self.radius + 1):
+            for chunk_x in range(centre_x - self.radius, centre_x + self.radius + 1):
+                if (chunk_x, chunk_y) == (centre_x, centre_y):
+                    continue
+                if 0 <= chunk_x < self.generator.chunks_wide and 0 <= chunk_y < self.generator.chunks_high:
+                    self.chunk((chunk_x, chunk_y))
+        self.chunk((centre_x, centre_y))
+
+    def zone(self, name: str) -> map.Zone:
+        return self.chunk(self.generator.chunk_of(name)).zones[name]
+
+    def areas(self, zone_name: str) -> dict[str, map.Area]:
+        return self.chunk(self.generator.chunk_of(zone_name)).areas[zone_name]
+
+    def _evict(self) -> None:
+        while len(self._chunks) > self.capacity:
+            self._chunks.popitem(last=False)
+            self.evictions += 1
+
+
+# ------------------ Streamed World ------------------ #
+
+
+class StreamedWorld(map.World):
+    """A generated world whose zones and areas are loaded by a ChunkManager, instead of living in zone_data and area_data."""
+
+    def __init__(self, generator: WorldGenerator, world_id: str, radius: int = 1, capacity: int | None = None):
+        super().__init__(width=generator.width, height=generator.height, zone_names=None)
+        self.chunks = ChunkManager(generator, world_id, radius=radius, capacity=capacity)
+
+    def get_zone(self, name: str) -> map.Zone:
+        # Zones are only asked for when the player moves into them, so the chunks around it are loaded too.
+        self.chunks.focus(name)
+        return self.chunks.zone(name)
+
+    def get_areas(self, zone_name: str) -> dict[str, map.Area]:
+        return self.chunks.areas(zone_name)
+
+
+def stream_world(
+    generator: WorldGenerator,
+    world_id: str,
+    radius: int = 1,
+    capacity: int | None = None,
+) -> StreamedWorld:
+    """Creates a streamed world from a generator and registers it, see map.register_world()."""
+    world = StreamedWorld(generator, world_id, radius=radius, capacity=capacity)
+    map.register_world(world_id, world)
+    return world
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    world = stream_world(WorldGenerator(1000, 1000, seed=0, chunk_size=16), "generated")
+    zone = world.get_zone("A1")
+    for _ in range(200):  # Walk diagonally across part of the world.
+        zone = world.get_zone(zone.moveable_zones[-1])
+    print(f"Walked to {zone.name}: {world.chunks.metrics()}")
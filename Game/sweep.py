@@ -0,0 +1,233 @@
+""" This module contains the balance sweep runner for the Text-RPG game.
+It takes a grid of changes to the classes' and enemies' stats, e.g. {"Warrior.health": [80, 100, 120], "Troll.attack": [15, 20]},
+and evaluates every combination with the vectorised combat rules in monte_carlo.py, fanned out over a pool of processes.
+Every combination (a point) is evaluated on its own with its own seed, so the results are the same however many
+workers there are, and they're written to a CSV file as each point finishes.
+Points already in the file are skipped, so a sweep that was stopped part way can be started again to finish it.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import csv
+import io
+import itertools
+import multiprocessing
+import os
+import time
+from typing import Any, Iterator, NamedTuple
+
+from main_file import Enemy, Mage, Rogue, StatBlock, Warrior, enemy_data
+from rng import RandomStreams
+
+# ------------------ Grid ------------------ #
+
+PLAYER_CLASSES = {player_class.__name__: player_class for player_class in (Warrior, Mage, Rogue)}
+PLAYER_STATS = StatBlock.__slots__[1:]  # Everything but the name.
+ENEMY_STATS = (*PLAYER_STATS, "difficulty")
+
+# The results of monte_carlo.BattleBatch.summary(), which are the rest of the columns after the parameters.
+RESULT_COLUMNS = (
+    "class",
+    "biome",
+    "difficulty",
+    "fights",
+    "win_rate",
+    "timeout_rate",
+    "mean_turns_to_kill",
+    "mean_damage_dealt",
+    "mean_damage_taken",
+)
+
+
+class SweepPoint(NamedTuple):
+    """One combination of the grid's values."""
+
+    key: str  # Names the point in the results, e.g. "Warrior.health=80;Troll.attack=15".
+    values: tuple[tuple[str, int], ...]  # (parameter, value) for each parameter in the grid.
+    seed: int
+
+
+def check_parameter(parameter: str) -> None:
+    """Checks a grid parameter is "<class or enemy name>.<stat>", e.g. "Warrior.health" or "Troll.difficulty".
+
+    Raises:
+        ValueError: If the name isn't a class or enemy, or the stat isn't one it has.
+    """
+    name, _, stat = parameter.partition(".")
+    if name in PLAYER_CLASSES:
+        if stat not in PLAYER_STATS:
+            raise ValueError(f"{parameter}: a class's stat must be one of {', '.join(PLAYER_STATS)}.")
+    elif any(name in enemies for enemies in enemy_data.values()):
+        if stat not in ENEMY_STATS:
+            raise ValueError(f"{parameter}: an enemy's stat must be one of {', '.join(ENEMY_STATS)}.")
+    else:
+        raise ValueError(f"{parameter}: {name!r} isn't a class or an enemy.")
+
+
+def grid_points(grid: dict[str, list[int]], seed: int) -> Iterator[SweepPoint]:
+    """Gets every combination of the grid's values, each with its own seed split off from the sweep's seed."""
+    for parameter in grid:
+        check_parameter(parameter)
+
+    streams = RandomStreams(seed)
+    parameters = list(grid)
+    for combination in itertools.product(*(grid[parameter] for parameter in parameters)):
+        values = tuple(zip(parameters, combination))
+        key = ";".join(f"{parameter}={value}" for parameter, value in values)
+        # The seed comes from the point's key, not its position, so changing the grid doesn't change other points' results.
+        yield SweepPoint(key, values, streams.child("point", key).seed)
+
+
+# ------------------ Worker ------------------ #
+
+
+def apply_values(values: tuple[tuple[str, int], ...]) -> tuple[list, dict[str, dict[str, Enemy]]]:
+    """Creates the players and enemies for a point, with its values in place of the usual stats.
+    enemy_data itself is never changed, the enemies are spawned copies.
+    """
+    players = {name: player_class("Sweep") for name, player_class in PLAYER_CLASSES.items()}
+    enemies = {biome: {name: enemy.spawn() for name, enemy in biome_enemies.items()} for biome, biome_enemies in enemy_data.items()}
+
+    for parameter, value in values:
+        name, _, stat = parameter.partition(".")
+        if name in players:
+            setattr(players[name], stat, value)
+        for biome_enemies in enemies.values():
+            if name in biome_enemies:
+                setattr(biome_enemies[name], stat, value)
+
+    return list(players.values()), enemies
+
+
+def evaluate_point(
+    point: SweepPoint,
+    difficulties: tuple[int, ...],
+    fights: int,
+    max_turns: int,
+) -> tuple[SweepPoint, list[dict[str, Any]]]:
+    """Runs the fights for one point. This is what the worker processes run.
+
+    Returns:
+        tuple[SweepPoint, list[dict[str, Any]]]: The point, and a row of results for each class, biome and difficulty.
+    """
+    # Imported here, so numpy is only loaded by the processes that run fights.
+    from monte_carlo import sweep
+
+    players, enemies = apply_values(point.values)
+    results = sweep(
+        enemies=enemies,
+        difficulties=difficulties,
+        fights=fights,
+        seed=point.seed,
+        max_turns=max_turns,
+        players=players,
+    )
+
+    rows = []
+    for (class_name, biome, difficulty), summary in results.items():
+        row = {"point": point.key, **dict(point.values), "class": class_name, "biome": biome, "difficulty": difficulty}
+        row.update(summary)
+        rows.append(row)
+    return point, rows
+
+
+def _evaluate(task: tuple) -> tuple[SweepPoint, list[dict[str, Any]]]:
+    return evaluate_point(*task)
+
+
+# ------------------ Results File ------------------ #
+
+
+def finished_points(path: str) -> set[str]:
+    """Gets the keys of the points already in a results file, and removes a half written last line if there is one.
+    Each point's rows are written in one go, so a point is either all there or missing from the end.
+    """
+    if not os.path.exists(path):
+        return set()
+
+    with open(path, "rb+") as file:
+        contents = file.read()
+        if contents and not contents.endswith(b"\n"):
+            # The sweep was stopped while writing, so the incomplete point is thrown away and run again.
+            file.truncate(contents.rfind(b"\n") + 1)
+
+    with open(path, newline="") as file:
+        return {row["point"] for row in csv.DictReader(file)}
+
+
+# ------------------ Runner ------------------ #
+
+
+def run_sweep(
+    grid: dict[str, list[int]],
+    path: str,
+    difficulties: tuple[int, ...] = tuple(range(10, 101, 10)),
+    fights: int = 10_000,
+    seed: int = 0,
+    workers: int | None = None,
+    max_turns: int = 100,
+) -> dict[str, float]:
+    """Evaluates every point of a grid across a pool of processes, adding the results to a CSV file as they finish.
+
+    Args:
+        grid (dict[str, list[int]]): The values to try for each parameter, see check_parameter().
+        path (str): The CSV file. If it already has results for this grid, only the missing points are run.
+        difficulties (tuple[int, ...], optional): The area difficulties to evaluate. Defaults to 10 to 100 in steps of 10.
+        fights (int, optional): The fights for each class, biome and difficulty. Defaults to 10_000.
+        seed (int, optional): The sweep's seed, the same seed always gives the same results. Defaults to 0.
+        workers (int, optional): How many processes to use. Defaults to None, which uses one for each core.
+        max_turns (int, optional): Fights still going after this many turns count as timeouts. Defaults to 100.
+
+    Raises:
+        ValueError: If a parameter isn't valid, or the file has results for a different grid.
+
+    Returns:
+        dict[str, float]: The number of points in the grid, how many were skipped as already done,
+            how many were run, and how long it took.
+    """
+    points = list(grid_points(grid, seed))
+    done = finished_points(path)
+    todo = [point for point in points if point.key not in done]
+    fieldnames = ["point", *grid, *RESULT_COLUMNS]
+
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, newline="") as file:
+            header = next(csv.reader(file), [])
+        if header != fieldnames:
+            raise ValueError(f"{path} has results for a different grid: {', '.join(header)}.")
+
+    start = time.perf_counter()
+    tasks = [(point, difficulties, fights, max_turns) for point in todo]
+    with open(path, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        if file.tell() == 0:
+            writer.writeheader()
+            file.flush()
+
+        if tasks:
+            workers = min(workers or os.cpu_count() or 1, len(tasks))
+            with multiprocessing.Pool(workers) as pool:
+                # Points finish in any order, and each one is written as soon as it does.
+                for point, rows in pool.imap_unordered(_evaluate, tasks):
+                    buffer = io.StringIO()
+                    csv.DictWriter(buffer, fieldnames=fieldnames).writerows(rows)
+                    file.write(buffer.getvalue())
+                    file.flush()
+
+    return {
+        "points": len(points),
+        "skipped": len(points) - len(todo),
+        "run": len(todo),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    result = run_sweep(
+        {"Warrior.health": [80, 100, 120], "Rogue.attack": [15, 20], "Troll.difficulty": [40, 60]},
+        path="sweep_results.csv",
+        fights=2_000,
+    )
+    print(result)
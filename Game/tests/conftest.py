@@ -0,0 +1,13 @@
+""" This module contains the set up for the game's tests. Run them from the Game folder with: python -m pytest tests """
+
+# ------------------ Importing Modules ------------------ #
+
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = os.path.dirname(TESTS_DIR)
+
+# The game's modules import each other by name, the same as when the game is run from the Game folder.
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
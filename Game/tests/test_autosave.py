@@ -0,0 +1,95 @@
+""" This module contains the tests for the autosaver, which writes saves on a background thread. """
+
+# ------------------ Importing Modules ------------------ #
+
+import pytest
+
+import main_file
+import saves
+from autosave import AUTOSAVE_SLOT, Autosaver
+
+# ------------------ Tests ------------------ #
+
+
+@pytest.fixture
+def game_data(tmp_path):
+    return main_file.new_game_data(save_dir=str(tmp_path))
+
+
+@pytest.fixture
+def autosaver(game_data):
+    autosaver = Autosaver(directory=game_data.save_dir, flush_on_exit=False)
+    yield autosaver
+    autosaver.close()
+
+
+def test_saves_to_the_autosave_slot(game_data, autosaver):
+    autosaver.request(game_data)
+    assert autosaver.flush(timeout=5)
+
+    assert autosaver.path == saves.save_path(AUTOSAVE_SLOT, game_data.save_dir)
+    assert saves.load(autosaver.path) == game_data.to_save()
+
+
+def test_unchanged_game_is_not_saved_again(game_data, autosaver):
+    autosaver.request(game_data)
+    autosaver.request(game_data)
+    assert autosaver.flush(timeout=5)
+
+    assert autosaver.saves_requested == 1
+    assert autosaver.saves_written == 1
+
+
+def test_pending_saves_are_coalesced(game_data, autosaver):
+    autosaver.request(game_data)
+    assert autosaver.flush(timeout=5)
+
+    # Holding the lock keeps the thread from taking any of these, so only the newest is left to write.
+    with autosaver._condition:
+        for gold in range(1, 6):
+            game_data.player.gold = gold
+            autosaver.request(game_data)
+    assert autosaver.flush(timeout=5)
+
+    assert autosaver.saves_requested == 6
+    assert autosaver.saves_written == 2
+    assert saves.load(autosaver.path)["gold"] == 5
+
+
+def test_close_writes_the_pending_save(game_data, autosaver):
+    with autosaver._condition:
+        autosaver.request(game_data)
+    autosaver.close(timeout=5)
+
+    assert not autosaver._thread.is_alive()
+    assert autosaver.saves_written == 1
+    assert saves.load(autosaver.path) == game_data.to_save()
+    with pytest.raises(RuntimeError):
+        autosaver.request(game_data)
+
+
+def test_close_without_saving(autosaver):
+    autosaver.close(timeout=5)
+    assert not autosaver._thread.is_alive()
+    assert autosaver.saves_written == 0
+
+
+def test_recovers_after_a_failed_write(game_data, tmp_path):
+    # The save folder is a file to start with, so the first write fails.
+    blocked = tmp_path / "blocked"
+    blocked.write_text("")
+    autosaver = Autosaver(path=str(blocked / "auto.txt"), flush_on_exit=False)
+    try:
+        autosaver.request(game_data)
+        assert autosaver.flush(timeout=5)
+        assert isinstance(autosaver.last_error, OSError)
+        assert autosaver.saves_written == 0
+
+        # The same game is written once the folder can be made, even though nothing changed.
+        blocked.unlink()
+        autosaver.request(game_data)
+        assert autosaver.flush(timeout=5)
+        assert autosaver.saves_written == 1
+        assert saves.load(autosaver.path) == game_data.to_save()
+    finally:
+        autosaver.close()
@@ -0,0 +1,39 @@
+""" This module contains the tests for the game's instrumentation and the profiling option. """
+
+# ------------------ Importing Modules ------------------ #
+
+import os
+
+import instrument
+import main_file
+from ports import ScriptedPort, using_port
+
+# ------------------ Tests ------------------ #
+
+
+def test_profiles_stopped_in_the_same_second_are_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(instrument, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(instrument.time, "strftime", lambda _: "20260101-120000")
+
+    paths = []
+    for _ in range(3):
+        instrument.start_profiling()
+        paths.append(instrument.stop_profiling())
+
+    assert [path.rsplit("profile-", 1)[1] for path in paths] == [
+        "20260101-120000.prof",
+        "20260101-120000-2.prof",
+        "20260101-120000-3.prof",
+    ]
+    assert all(os.path.getsize(path) > 0 for path in paths)
+
+
+def test_profiling_is_not_available_away_from_the_console():
+    # Scripted ports, like the server's, aren't at the console, so the option is shown with its number but refused.
+    port = ScriptedPort(["7"])
+    with using_port(port):
+        assert main_file.interact(main_file.new_game_data()) == main_file.INTERACT
+
+    assert "7. Profiling (not available)\n8. Exit game" in port.text
+    assert "profiling is only available when playing at the console" in port.text
+    assert not instrument.is_profiling()
@@ -0,0 +1,122 @@
+""" This module contains the tests for recording games in journals and replaying them. """
+
+# ------------------ Importing Modules ------------------ #
+
+import os
+import shutil
+
+import pytest
+
+import journal
+import main_file
+import saves
+from ports import ScriptedPort
+
+# ------------------ Settings ------------------ #
+
+SEED = 3
+
+# From the main menu: a failed import from an empty slot, an import of the old save in slot 1 and an export to slot 3,
+# then a new game with a move, and back to the main menu to exit.
+SAVE_MENU_ANSWERS = ("4", "1", "2", "y", "1", "y", "2", "3", "y", "4")
+GAME_ANSWERS = ("1", "Tester", "warrior", "1", "1", "8", "n")
+ANSWERS = (*SAVE_MENU_ANSWERS, *GAME_ANSWERS, "2")
+
+# ------------------ Fixtures ------------------ #
+
+
+@pytest.fixture
+def save_dir(tmp_path):
+    save_dir = tmp_path / "saves"
+    save_dir.mkdir()
+    shutil.copyfile(saves.save_path(1), save_dir / "save1.txt")
+    return str(save_dir)
+
+
+@pytest.fixture
+def played(tmp_path, save_dir):
+    """Plays the game with ANSWERS, and returns the journal and the port it was played through."""
+    path = str(tmp_path / "game.journal")
+    port = ScriptedPort(ANSWERS)
+    assert journal.play(path, seed=SEED, port=port, save_dir=save_dir) == main_file.EXIT
+    return path, port
+
+
+def journal_lines(path):
+    with open(path, encoding="utf-8") as file:
+        return file.read().splitlines(keepends=True)
+
+
+def write_lines(path, lines):
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(lines)
+
+
+# ------------------ Recording ------------------ #
+
+
+def test_loads_are_recorded(played):
+    path, _ = played
+    entries = journal.read_journal(path)
+    assert (entries.seed, entries.state, entries.end) == (SEED, main_file.MAIN_MENU, main_file.EXIT)
+
+    loads = [(kind, text.split(" ", 1)[0]) for kind, text in entries.events if kind != journal.ASK]
+    assert loads == [(journal.LOAD_FAILED, "save2.txt"), (journal.LOAD, "save1.txt"), (journal.END, main_file.EXIT)]
+    assert [text for kind, text in entries.events if kind == journal.ASK] == list(ANSWERS)
+
+
+def test_not_a_journal(tmp_path):
+    path = tmp_path / "game.journal"
+    path.write_text("ask 1\n")
+    with pytest.raises(journal.JournalError):
+        journal.read_journal(str(path))
+
+
+# ------------------ Replaying ------------------ #
+
+
+def test_replay_matches_the_game(played, save_dir):
+    path, port = played
+    exported = saves.load(saves.save_path(3, save_dir))
+    # The replay reads the saves from the journal, so it doesn't need the save files any more.
+    shutil.rmtree(save_dir)
+
+    replayed = journal.replay(path)
+    assert replayed.port.text == port.text
+    assert replayed.end == main_file.EXIT
+
+    # The game ends the same as it was played: a new character, one zone from home.
+    data = replayed.game_data.to_save()
+    assert (data["class"], data["name"], data["zone"]) == ("Warrior", "Tester", "B1")
+    assert journal.replay(path).game_data.to_save() == data
+
+    # The export is kept on the port instead of being written.
+    assert replayed.port.saved == {saves.save_path(3): exported}
+    assert not os.path.exists(save_dir)
+
+
+def test_half_written_last_line_is_ignored(played):
+    path, port = played
+    lines = journal_lines(path)
+    # The game crashed while writing its end, after the last answer.
+    write_lines(path, lines[:-1] + [lines[-1][:3]])
+
+    entries = journal.read_journal(path)
+    assert entries.end is None
+    assert entries.events[-1] == (journal.ASK, ANSWERS[-1])
+
+    replayed = journal.replay(path)
+    assert replayed.port.text == port.text
+
+
+def test_tampered_journal_is_refused(played):
+    path, _ = played
+    lines = journal_lines(path)
+    # Turns down the import of save1.txt, so the game asks for an answer where the journal has the load.
+    load = next(number for number, line in enumerate(lines) if line.startswith(journal.LOAD + " "))
+    assert lines[load - 1] == "ask y\n"
+    lines[load - 1] = "ask n\n"
+    write_lines(path, lines)
+
+    with pytest.raises(journal.JournalError):
+        journal.replay(path)
@@ -0,0 +1,135 @@
+""" This module contains the tests for save files and save logs. """
+
+# ------------------ Importing Modules ------------------ #
+
+import shutil
+
+import pytest
+
+import main_file
+import saves
+
+# ------------------ Fixtures ------------------ #
+
+
+@pytest.fixture
+def data():
+    return main_file.new_game_data().to_save()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "save.txt")
+
+
+def read_log(path):
+    with open(path, "rb") as file:
+        return saves.read_log(file.read())
+
+
+# ------------------ Save Logs ------------------ #
+
+
+def test_changes_are_appended(path, data):
+    save_log = saves.SaveLog(path)
+    save_log.save(data)
+    with open(path, "rb") as file:
+        snapshot = file.read()
+
+    changed = {**data, "gold": 50, "zone": "B1"}
+    save_log.save(changed)
+    with open(path, "rb") as file:
+        contents = file.read()
+
+    # The snapshot is left as it was, with only the two fields that changed added after it.
+    assert contents.startswith(snapshot)
+    assert len(contents) - len(snapshot) < len(snapshot) // 2
+    assert read_log(path) == (changed, len(contents), 1)
+    assert saves.load(path) == changed
+
+
+def test_unchanged_save_adds_nothing(path, data):
+    save_log = saves.SaveLog(path)
+    save_log.save(data)
+    save_log.save(dict(data))
+    assert read_log(path)[2] == 0
+
+
+def test_compacts_after_enough_changes(path, data):
+    save_log = saves.SaveLog(path, compact_after=3)
+    save_log.save(data)
+    for gold in range(1, 3):
+        save_log.save({**data, "gold": gold})
+    assert read_log(path)[2] == 2
+
+    save_log.save({**data, "gold": 3})
+    assert read_log(path)[2] == 0
+    assert save_log.changes == 0
+    assert saves.load(path) == {**data, "gold": 3}
+
+
+@pytest.mark.parametrize("damage", ["torn", "checksum"])
+def test_damaged_last_record_is_ignored(path, data, damage):
+    save_log = saves.SaveLog(path)
+    save_log.save(data)
+    save_log.save({**data, "gold": 50})
+
+    with open(path, "r+b") as file:
+        contents = file.read()
+        if damage == "torn":  # The game stopped part way through writing the record.
+            file.truncate(len(contents) - 3)
+        else:  # The record was written in full, but one of its bytes is wrong.
+            file.seek(-saves.CHECKSUM.size - 1, 2)
+            file.write(bytes([contents[-saves.CHECKSUM.size - 1] ^ 0xFF]))
+
+    assert saves.load(path) == data
+    # The file isn't as the log left it any more, so the next save starts again with a snapshot.
+    assert not save_log.is_current()
+    save_log.save({**data, "gold": 60})
+    assert read_log(path)[0::2] == ({**data, "gold": 60}, 0)
+
+
+def test_file_replaced_by_another_save(path, data):
+    save_log = saves.SaveLog(path)
+    save_log.save(data)
+
+    # Another game saves the same game to the same file, so the file is the same size but not the one this log wrote.
+    saves.SaveLog(path).save(data)
+    assert not save_log.is_current()
+
+    save_log.save({**data, "gold": 50})
+    assert read_log(path)[0::2] == ({**data, "gold": 50}, 0)
+
+
+def test_not_a_log(path):
+    with open(path, "wb") as file:
+        file.write(saves.HEADER.pack(saves.LOG_MAGIC, saves.LOG_VERSION))
+    with pytest.raises(saves.SaveError):
+        saves.load(path)
+
+
+# ------------------ Older Saves ------------------ #
+
+
+def test_plain_snapshot_is_loaded_and_replaced(path, data):
+    saves.save(path, data)
+    assert saves.load(path) == data
+
+    # A plain snapshot wasn't written by the log, so the log starts again with a snapshot of its own.
+    save_log = saves.SaveLog(path)
+    save_log.save({**data, "gold": 50})
+    assert read_log(path)[0::2] == ({**data, "gold": 50}, 0)
+
+
+def test_legacy_pickle_is_loaded_and_replaced(path):
+    # save1.txt is an old save, from when the game pickled its whole GameData.
+    shutil.copyfile(saves.save_path(1), path)
+    data = saves.load(path)
+    assert data["class"] == "Warrior"
+    assert data["zone"] == "A1"
+    assert main_file.GameData.from_save(data).player.name == data["name"]
+
+    save_log = saves.SaveLog(path)
+    save_log.save({**data, "gold": 50})
+    assert saves.load(path) == {**data, "gold": 50}
+    assert read_log(path)[2] == 0
@@ -0,0 +1,84 @@
+""" This module contains the tests for the game server. """
+
+# ------------------ Importing Modules ------------------ #
+
+import asyncio
+import threading
+
+import server
+
+# ------------------ Tests ------------------ #
+
+
+class SlowWriter:
+    """Stands in for a connection whose player only reads when the test lets them."""
+
+    def __init__(self):
+        self.data: list[bytes] = []
+        self.reading = asyncio.Event()
+
+    def write(self, data: bytes) -> None:
+        self.data.append(data)
+
+    async def drain(self) -> None:
+        await self.reading.wait()
+
+    def is_closing(self) -> bool:
+        return False
+
+
+async def wait_until(condition, timeout: float = 5.0) -> None:
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Timed out waiting for the session.")
+
+
+def test_session_waits_for_a_slow_player():
+    async def play():
+        writer = SlowWriter()
+        port = server.NetworkPort(asyncio.get_running_loop(), writer)
+        pump = asyncio.create_task(port.pump())
+        asks = server.OUTPUT_QUEUE_SIZE * 3
+        for answer in range(asks):
+            port.inputs.put(str(answer))
+
+        def session():
+            for _ in range(asks):
+                port.write(["Some output"])
+                port.ask("> ")
+            port.end("exit")
+
+        thread = threading.Thread(target=session, daemon=True)
+        thread.start()
+
+        # One batch is being written and the queue is full, so the session waits on the next.
+        await wait_until(lambda: port.outputs.full())
+        await asyncio.sleep(0.05)
+        assert port.answers == server.OUTPUT_QUEUE_SIZE + 1
+        assert thread.is_alive()
+
+        writer.reading.set()
+        await asyncio.wait_for(pump, 5)
+        thread.join(5)
+        assert port.answers == asks
+        assert len(writer.data) == asks + 1
+        assert writer.data[-1] == b"END exit\n"
+
+    asyncio.run(play())
+
+
+def test_session_threads_leave_the_stack_size_alone(tmp_path):
+    async def play():
+        game_server = server.GameServer(port=0, save_dir=str(tmp_path))
+        await game_server.start()
+        try:
+            reader, writer = await asyncio.open_connection(*game_server.address)
+            await reader.readuntil(b"ASK ")
+            assert threading.stack_size() == 0
+            writer.close()
+        finally:
+            await game_server.close()
+
+    asyncio.run(play())
@@ -0,0 +1,140 @@
+""" This module contains the soak test, which plays the game for a long session to check it can be played indefinitely.
+Every state hands the next one back to main_file.run() instead of calling it, so the stack mustn't grow however long
+the game is played, and nothing the game keeps between states should grow either.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import itertools
+import sys
+import tracemalloc
+
+import main_file
+from ports import ScriptedPort, ScriptFinished, using_port
+from rng import RandomStreams
+
+# ------------------ Settings ------------------ #
+
+# A long session of 100,000 answers. It takes around 20 seconds.
+ACTIONS = 100_000
+
+SEED = 6
+
+# The most frames the game can have on the stack above the test while it waits for an answer. The deepest is run(),
+# a state, a timed move or battle inside it, and the ports and script answering, so anything deeper means states have
+# started calling each other.
+MAX_STACK_DEPTH = 10
+
+# How much the memory in use can grow between the halfway point and the end, in bytes.
+# Some caches fill up as new areas are visited, but they stop growing once the game has been everywhere.
+MAX_MEMORY_GROWTH = 64 * 1024
+
+# Every answer is picked by what the game is asking, so the script never gets out of step with the game,
+# e.g. when there are no stat points left to upgrade. Each prompt cycles through its own answers.
+# At the interact menu: moving zone and area, viewing and upgrading stats, travelling and the save menu.
+# The save menu exports the game to a save, imports it again and goes back to the game.
+PROMPTS = (
+    ("What do you want to do?\n1. Move zone", ("1", "2", "4", "5", "3", "6", "2", "3")),
+    ("Welcome To Melon Man's Text RPG!", ("1",)),
+    ("What do you want your character's name to be?", ("Soak",)),
+    ("Please select a class", ("warrior", "mage", "rogue")),
+    ("not a valid class", ("warrior",)),
+    ("Which zone would you like to travel to?", ("E5", "A1", "Z99")),
+    ("Enter the corresponding number of the", ("1", "2", "9")),
+    ("That is not a valid option.", ("1",)),
+    ("Please select a stat to upgrade", ("2", "5")),
+    ("Do you want to import or export save data?", ("2", "1", "4")),
+    ("Or enter 4 to exit.", ("1",)),
+    ("Are you sure", ("y",)),
+)
+
+# Every option of the battle menu is chosen in turn, including the ones that aren't available yet and one that isn't an option.
+# Exit leaves the game altogether, so it's only chosen at the start of every EXIT_EVERY battles.
+BATTLE_MENU = "| What do you want to do? |"
+BATTLE_CHOICES = ("2", "3", "flee", "1", "1", "1", "1")
+EXIT_EVERY = 10
+
+# Moves that aren't on the list are chosen too, which asks again.
+MOVE_MENU = ("Choose an attack move", "Please enter a valid number.")
+MOVE_CHOICES = ("0", "5", "x", "1", "2", "3", "4")
+
+# ------------------ Soak ------------------ #
+
+
+class SoakPort(ScriptedPort):
+    """A scripted port that only keeps what the game showed since the last answer, so the answers can depend on it."""
+
+    def __init__(self, answers):
+        super().__init__(answers, record=False)
+        self.screen: list[str] = []
+
+    def ask(self, prompt: str = "") -> str:
+        answer = super().ask(prompt)
+        self.screen.clear()
+        return answer
+
+    def _show(self, text: str) -> None:
+        self.screen.append(text)
+
+
+def stack_depth() -> int:
+    depth, frame = 0, sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def test_soak(tmp_path):
+    answers_for = {prompt: itertools.cycle(answers) for prompt, answers in PROMPTS}
+    answers_for[BATTLE_MENU] = itertools.cycle(BATTLE_CHOICES)
+    for prompt in MOVE_MENU:
+        answers_for[prompt] = itertools.cycle(MOVE_CHOICES)
+    base_depth = stack_depth()
+    deepest = 0
+    memory = {}
+    counts = {"battles": 0, "exits": 0, "new_games": 0, "saves": 0}
+
+    def answers():
+        nonlocal deepest
+        for answered in range(ACTIONS):
+            deepest = max(deepest, stack_depth() - base_depth)
+            if answered == ACTIONS // 2:
+                memory["halfway"] = tracemalloc.get_traced_memory()[0]
+
+            # The prompt the game is asking is the last one it showed.
+            screen = "".join(port.screen)
+            prompt = max(answers_for, key=screen.rfind)
+            assert prompt in screen, f"The soak doesn't know how to answer: {screen!r}"
+
+            if "You have encountered" in screen:
+                counts["battles"] += 1
+                if counts["battles"] % EXIT_EVERY == 0:
+                    counts["exits"] += 1
+                    yield "4"
+                    continue
+            counts["new_games"] += prompt == "What do you want your character's name to be?"
+            counts["saves"] += "You have exported" in screen
+            yield next(answers_for[prompt])
+
+    # Saves go to the test's own folder, so the game's save files are never touched.
+    game_data = main_file.new_game_data(RandomStreams(SEED), save_dir=str(tmp_path))
+    port = SoakPort(answers())
+    tracemalloc.start()
+    try:
+        with using_port(port):
+            while True:
+                try:
+                    main_file.run(game_data)
+                except SystemExit:
+                    continue  # Exit in a battle leaves the game, so the player starts it again.
+                except ScriptFinished:
+                    break
+        memory["end"] = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert port.asked == ACTIONS
+    assert counts["battles"] > 0 and counts["exits"] > 0 and counts["saves"] > 0
+    assert deepest <= MAX_STACK_DEPTH
+    assert memory["end"] - memory["halfway"] <= MAX_MEMORY_GROWTH
@@ -0,0 +1,15 @@
+""" This module contains the tests for the grid topology the map is built on. """
+
+# ------------------ Importing Modules ------------------ #
+
+import map
+
+# ------------------ Tests ------------------ #
+
+
+def test_neighbours_keep_the_networkx_order():
+    # The Move zone menu is numbered in this order, which is the order the map listed them in when it was a networkx graph.
+    assert map.zone_data["A1"].get_moveable_zones() == ["B1", "A2"]
+    assert map.zone_data["A2"].get_moveable_zones() == ["A1", "B2", "A3"]
+    assert map.zone_data["C3"].get_moveable_zones() == ["B3", "C2", "D3", "C4"]
+    assert map.zone_data["E5"].get_moveable_zones() == ["D5", "E4"]
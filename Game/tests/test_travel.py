@@ -0,0 +1,28 @@
+""" This module contains the tests for the travel planner. """
+
+# ------------------ Importing Modules ------------------ #
+
+import itertools
+
+import pytest
+
+from topology import GridTopology
+from travel import TravelPlanner
+
+# ------------------ Tests ------------------ #
+
+
+@pytest.mark.parametrize("width, height", [(5, 5), (7, 3), (1, 6)])
+def test_straight_routes_are_shortest(width, height):
+    # Small maps use the table, which is built with a breadth first search, so every straight route must be as short.
+    topology = GridTopology(width, height)
+    table = TravelPlanner(topology)
+    straight = TravelPlanner(topology, table_limit=0)
+    assert table.use_table and not straight.use_table
+
+    for start, goal in itertools.product(range(len(topology)), repeat=2):
+        route = straight.route_ids(start, goal)
+        assert len(route) == len(table.route_ids(start, goal))
+        for here, there in zip([start, *route], route):
+            assert there in topology.neighbor_ids(here)
+        assert route[-1:] == ([goal] if start != goal else [])
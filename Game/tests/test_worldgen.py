@@ -0,0 +1,65 @@
+""" This module contains the tests for playing in generated worlds. """
+
+# ------------------ Importing Modules ------------------ #
+
+import itertools
+
+import pytest
+
+import main_file
+import map
+from ports import ScriptedPort, using_port
+from streaming import stream_world
+from worldgen import BIOMES, WorldGenerator
+
+# ------------------ Settings ------------------ #
+
+WORLD_ID = "test-worldgen"
+SEED = 42
+
+# Enough rolls in a hard area that a biome with enemies is all but certain to start a battle.
+ROLLS = 30
+
+
+@pytest.fixture(scope="module")
+def world():
+    world = stream_world(WorldGenerator(200, 200, seed=SEED), WORLD_ID)
+    yield world
+    del map.worlds[WORLD_ID]
+
+
+def find_entrance(world, biome: str) -> tuple[str, str]:
+    """Finds a hard zone whose first area is of a biome, which is the area the player walks into when they move there,
+    and a zone next to it to walk in from.
+    """
+    generator = world.chunks.generator
+    for zone_id in range(len(generator.topology)):
+        zone = generator.zone(zone_id)
+        first_area = zone.areas[0]
+        if first_area.biome == biome and first_area.difficulty >= 50:
+            return world.get_zone(zone.name).moveable_zones[0], zone.name
+    raise LookupError(f"No zone starts with a hard {biome} area.")
+
+
+# ------------------ Biomes ------------------ #
+
+
+@pytest.mark.parametrize("biome", BIOMES)
+def test_walk_into_every_biome(world, biome):
+    start_name, zone_name = find_entrance(world, biome)
+    start = world.get_zone(start_name)
+    game_data = main_file.new_game_data()
+    game_data.zone = start
+    game_data.area = world.get_areas(start.name)[start.areas[0][0]]
+
+    # Pick the zone to move to, then attack in every battle until it's over.
+    answers = itertools.chain([str(start.moveable_zones.index(zone_name) + 1)], itertools.repeat("1"))
+    with using_port(ScriptedPort(answers)) as port:
+        game_data.zone, game_data.area = start.move()
+        assert game_data.area.biome == biome
+        for _ in range(ROLLS):
+            main_file.battle(game_data)
+            game_data.player.health = 100
+
+    fought = "You have encountered" in port.text
+    assert fought == bool(main_file.enemy_data.get(biome))
@@ -0,0 +1,151 @@
+""" This module contains the grid topology used for the map of the Text-RPG game.
+Zones are laid out in a grid and given integer IDs, row by row, so finding a zone's neighbours is just arithmetic
+and no per-zone objects are needed. That lets the map grow far past 5 x 5 without the memory networkx needs for every node.
+It has the parts of the networkx.Graph interface the game uses, and can still be exported to networkx to be drawn.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+from __future__ import annotations
+from typing import Iterator
+
+from lazy import lazy_import
+
+nx = lazy_import("networkx")
+
+# ------------------ Zone Names ------------------ #
+
+
+def row_label(row: int) -> str:
+    """Gets the letters for a row, like spreadsheet columns: 0 is A, 25 is Z, 26 is AA and so on."""
+    label = ""
+    row += 1
+    while row > 0:
+        row, remainder = divmod(row - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
+def zone_name(row: int, column: int) -> str:
+    """Gets the name of the zone at a row and column, e.g. zone_name(2, 2) is "C3"."""
+    return f"{row_label(row)}{column + 1}"
+
+
+def parse_zone_name(name: str) -> tuple[int, int]:
+    """Gets the (row, column) of a zone from its name, the opposite of zone_name()."""
+    split = 0
+    while split < len(name) and name[split].isalpha():
+        split += 1
+    if split == 0 or split == len(name) or not name[split:].isdigit():
+        raise KeyError(name)
+
+    row = 0
+    for letter in name[:split].upper():
+        row = row * 26 + ord(letter) - 64
+    return row - 1, int(name[split:]) - 1
+
+
+# ------------------ Grid Topology ------------------ #
+
+
+class GridTopology:
+    """A width x height grid of zones, where each zone is connected to the zones above, below, left and right of it."""
+
+    def __init__(self, width: int, height: int, names: tuple[str, ...] | None = None):
+        """Initialises the grid.
+
+        Args:
+            width (int): The number of columns.
+            height (int): The number of rows.
+            names (tuple[str], optional): A name for each zone, row by row. Defaults to None, which names zones
+                like the original map (A1, A2, ...) without storing the names.
+        """
+        if width < 1 or height < 1:
+            raise ValueError("A grid needs at least one row and one column.")
+        if names is not None and len(names) != width * height:
+            raise ValueError(f"Expected {width * height} zone names, got {len(names)}.")
+
+        self.width = width
+        self.height = height
+        self.names = tuple(names) if names is not None else None
+        self._ids = {name: zone_id for zone_id, name in enumerate(self.names)} if self.names else None
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    # ------------------ IDs ------------------ #
+
+    def zone_id(self, name: str) -> int:
+        """Gets the ID of a zone from its name. Raises a KeyError for zones not on the grid."""
+        if self._ids is not None:
+            return self._ids[name]
+        row, column = parse_zone_name(name)
+        if not (0 <= row < self.height and 0 <= column < self.width):
+            raise KeyError(name)
+        return row * self.width + column
+
+    def name(self, zone_id: int) -> str:
+        if self.names is not None:
+            return self.names[zone_id]
+        return zone_name(*divmod(zone_id, self.width))
+
+    def position(self, zone_id: int) -> tuple[int, int]:
+        """Gets the (row, column) of a zone."""
+        return divmod(zone_id, self.width)
+
+    # ------------------ Neighbours ------------------ #
+
+    def neighbor_ids(self, zone_id: int) -> list[int]:
+        """Gets the IDs of the zones next to a zone: above, left, below, then right.
+        This is the order the networkx map listed them in, so the Move zone menu numbers them the same as it always has.
+        """
+        row, column = divmod(zone_id, self.width)
+        neighbors = []
+        if row > 0:
+            neighbors.append(zone_id - self.width)
+        if column > 0:
+            neighbors.append(zone_id - 1)
+        if row < self.height - 1:
+            neighbors.append(zone_id + self.width)
+        if column < self.width - 1:
+            neighbors.append(zone_id + 1)
+        return neighbors
+
+    def neighbors(self, name: str) -> Iterator[str]:
+        """Gets the names of the zones next to a zone, the same as networkx.Graph.neighbors."""
+        return (self.name(neighbor) for neighbor in self.neighbor_ids(self.zone_id(name)))
+
+    # ------------------ networkx Interface ------------------ #
+
+    @property
+    def nodes(self) -> list[str]:
+        return [self.name(zone_id) for zone_id in range(len(self))]
+
+    def has_node(self, name: str) -> bool:
+        try:
+            self.zone_id(name)
+        except KeyError:
+            return False
+        return True
+
+    def __contains__(self, name: str) -> bool:
+        return self.has_node(name)
+
+    def number_of_nodes(self) -> int:
+        return len(self)
+
+    def number_of_edges(self) -> int:
+        return (self.width - 1) * self.height + (self.height - 1) * self.width
+
+    def edges(self) -> Iterator[tuple[str, str]]:
+        for zone_id in range(len(self)):
+            for neighbor in self.neighbor_ids(zone_id):
+                if neighbor > zone_id:
+                    yield self.name(zone_id), self.name(neighbor)
+
+    def to_networkx(self) -> "nx.Graph":
+        """Exports the grid as a networkx graph, e.g. to draw it. networkx is only imported when this is called."""
+        graph = nx.Graph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_edges_from(self.edges())
+        return graph
@@ -0,0 +1,270 @@
+""" This module contains the procedural world generator for the Text-RPG game.
+Given a seed, it creates the zones and areas of a world of any size, with biomes that form regions
+and a difficulty that rises the further you go from the starting zone.
+Every zone is generated from the seed and its own ID alone, so any zone or chunk of zones can be generated on its own,
+in any order, and a world with millions of zones never has to be held in memory all at once.
+"""
+
+# ------------------ Importing Modules ------------------ #
+
+import math
+import random
+from typing import Iterator, NamedTuple
+
+import map
+from topology import GridTopology
+
+# ------------------ Generated Data ------------------ #
+
+
+class GeneratedArea(NamedTuple):
+    name: str
+    description: str
+    biome: str
+    difficulty: int
+
+
+class GeneratedZone(NamedTuple):
+    zone_id: int
+    name: str
+    description: str
+    biome: str
+    difficulty: int
+    areas: tuple[GeneratedArea, ...]
+
+
+class Chunk(NamedTuple):
+    """A square block of zones, chunk_size x chunk_size, or smaller at the edges of the world."""
+
+    chunk_x: int
+    chunk_y: int
+    zones: tuple[GeneratedZone, ...]
+
+
+# ------------------ Content ------------------ #
+
+# The biomes are the same ones used by the hand-made areas in map.py.
+BIOMES: tuple[str, ...] = (
+    "Aquatic", "Cave", "Dwarven", "Elven", "Farm", "Forest", "Fungal", "Goblin", "Grassland",
+    "House", "Ice", "Insectoid", "Mountain", "Mystery", "Mystical", "Orcish", "Undead", "Village",
+)
+
+AREA_NAMES: dict[str, tuple[str, ...]] = {
+    "Aquatic": ("Lake", "River", "Pond", "Spring", "Sunken Harbour", "Marsh"),
+    "Cave": ("Small Cave", "Large Cave", "Grotto", "Cavern", "Sinkhole"),
+    "Dwarven": ("Dwarven Forge", "Dwarven Guard Post", "Quarry", "Mine Shaft", "Dwarven Hall"),
+    "Elven": ("Elven Outpost", "Elven Idol", "Elven Arch", "Moonlit Glade"),
+    "Farm": ("Farm", "Pasture", "Orchard", "Barn", "Windmill"),
+    "Forest": ("Forest", "Grove", "Clearing", "Fallen Tree", "Thicket"),
+    "Fungal": ("Mushroom Grove", "Fungal Forest", "Spore Field"),
+    "Goblin": ("Goblin Camp", "Goblin Lair", "Crypt", "Raiders' Den"),
+    "Grassland": ("Grassy Field", "Shrubbery", "Meadow", "Rolling Hills"),
+    "House": ("Abandoned House", "Shack", "Cottage", "Hut"),
+    "Ice": ("Ice Cavern", "Igloo", "Frozen Lake", "Glacier"),
+    "Insectoid": ("Spider Den", "Spider Nest", "Hive", "Silk Vein"),
+    "Mountain": ("Large Mountain", "Mountain Pass", "Hill", "Cliff Face"),
+    "Mystery": ("Ruins", "Monolith", "Mysterious Vault", "Sealed Tomb", "Strange Circle"),
+    "Mystical": ("Sorcerer's Tower", "Laboratory", "Engravings", "Enchanted Well"),
+    "Orcish": ("Orc Encampment", "Orcish Hunting Party", "Troll's Keep", "War Camp"),
+    "Undead": ("Necropolis", "Zombie Horde", "Skeletal Altar", "Graveyard"),
+    "Village": ("Village Square", "Village Inn", "Village Shop", "Village Well", "Village Church"),
+}
+
+ZONE_OPENINGS: tuple[str, ...] = (
+    "The land here is {mood}.",
+    "You arrive somewhere {mood}.",
+    "This part of the world feels {mood}.",
+)
+AREA_TEMPLATES: tuple[str, ...] = (
+    "{Name_article} {name} in {biome_article} {biome} region. It seems {mood}.",
+    "You find {name_article} {name}. Everything about it is {mood}.",
+    "Before you lies {name_article} {name}, {mood} like the rest of the {biome} land around it.",
+)
+MOODS: tuple[str, ...] = (
+    "peaceful", "quiet", "unsettling", "dangerous", "eerie", "deadly",
+)  # Ordered from the safest to the most dangerous.
+
+
+# ------------------ Hashing ------------------ #
+
+
+def mix(*values: int) -> int:
+    """Combines integers into a well spread 64 bit hash (splitmix64), so nearby IDs give unrelated results."""
+    state = 0x9E3779B97F4A7C15
+    for value in values:
+        state = (state + (value & 0xFFFFFFFFFFFFFFFF) + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        state = ((state ^ (state >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        state = ((state ^ (state >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        state ^= state >> 31
+    return state
+
+
+def article(word: str) -> str:
+    return "an" if word[0].upper() in "AEIOU" else "a"
+
+
+# ------------------ World Generator ------------------ #
+
+
+class WorldGenerator:
+    """Generates the zones and areas of a width x height world from a seed."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        seed: int = 0,
+        chunk_size: int = 32,
+        region_size: int = 8,
+        max_areas: int = 5,
+    ):
+        """Initialises the generator. Nothing is generated until it's asked for.
+
+        Args:
+            width (int): The number of columns of zones.
+            height (int): The number of rows of zones.
+            seed (int, optional): The same seed always gives the same world. Defaults to 0.
+            chunk_size (int, optional): The width and height of a chunk, in zones. Defaults to 32.
+            region_size (int, optional): Roughly how many zones across each biome region is. Defaults to 8.
+            max_areas (int, optional): The most areas a zone can have. Defaults to 5.
+        """
+        self.topology = GridTopology(width, height)
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.region_size = region_size
+        self.max_areas = max_areas
+        self._max_distance = math.hypot(width - 1, height - 1) or 1.0
+
+    # ------------------ Zones ------------------ #
+
+    def biome(self, row: int, column: int) -> str:
+        # Each zone is nudged by a small random offset before finding its region, so regions have ragged edges.
+        jitter = mix(self.seed, 1, row, column)
+        row += (jitter & 3) - 1
+        column += ((jitter >> 2) & 3) - 1
+        region = mix(self.seed, 2, row // self.region_size, column // self.region_size)
+        return BIOMES[region % len(BIOMES)]
+
+    def difficulty(self, row: int, column: int) -> int:
+        # Rises from 0 at the starting zone (the top left) to 100 at the far corner, give or take 5.
+        distance = math.hypot(row, column) / self._max_distance
+        noise = mix(self.seed, 3, row, column) % 11 - 5
+        return max(0, min(100, round(distance * 100) + noise))
+
+    def zone(self, zone: int | str) -> GeneratedZone:
+        """Generates a single zone and its areas.
+
+        Args:
+            zone (int | str): The ID or the name of the zone.
+
+        Returns:
+            GeneratedZone: The zone, which is the same every time for the same seed.
+        """
+        zone_id = zone if isinstance(zone, int) else self.topology.zone_id(zone)
+        if not 0 <= zone_id < len(self.topology):
+            raise KeyError(zone)
+
+        row, column = self.topology.position(zone_id)
+        biome = self.biome(row, column)
+        difficulty = self.difficulty(row, column)
+        rng = random.Random(mix(self.seed, 4, zone_id))
+        mood = MOODS[min(len(MOODS) - 1, difficulty * len(MOODS) // 101)]
+
+        areas = []
+        names = list(AREA_NAMES[biome])
+        rng.shuffle(names)
+        for name in names[: rng.randint(1, min(self.max_areas, len(names)))]:
+            # Most areas share the zone's biome, but now and then something else turns up.
+            area_biome = biome if rng.random() < 0.8 else rng.choice(BIOMES)
+            area_difficulty = max(0, min(100, difficulty + rng.randint(-10, 10)))
+            description = rng.choice(AREA_TEMPLATES).format(
+                name=name.lower(),
+                biome=area_biome.lower(),
+                name_article=article(name),
+                Name_article=article(name).capitalize(),
+                biome_article=article(area_biome),
+                mood=mood,
+            )
+            areas.append(GeneratedArea(name, description, area_biome, area_difficulty))
+
+        description = (
+            f"{rng.choice(ZONE_OPENINGS).format(mood=mood)} "
+            f"Most of it is {biome.lower()} land, with {len(areas)} place{'s' if len(areas) != 1 else ''} to explore."
+        )
+        return GeneratedZone(zone_id, self.topology.name(zone_id), description, biome, difficulty, tuple(areas))
+
+    # ------------------ Chunks ------------------ #
+
+    @property
+    def chunks_wide(self) -> int:
+        return -(-self.width // self.chunk_size)
+
+    @property
+    def chunks_high(self) -> int:
+        return -(-self.height // self.chunk_size)
+
+    def chunk_of(self, zone: int | str) -> tuple[int, int]:
+        """Gets the (chunk_x, chunk_y) of the chunk a zone is in."""
+        zone_id = zone if isinstance(zone, int) else self.topology.zone_id(zone)
+        row, column = self.topology.position(zone_id)
+        return column // self.chunk_size, row // self.chunk_size
+
+    def chunk(self, chunk_x: int, chunk_y: int) -> Chunk:
+        """Generates every zone in a chunk."""
+        if not (0 <= chunk_x < self.chunks_wide and 0 <= chunk_y < self.chunks_high):
+            raise KeyError((chunk_x, chunk_y))
+
+        zones = []
+        for row in range(chunk_y * self.chunk_size, min((chunk_y + 1) * self.chunk_size, self.height)):
+            for column in range(chunk_x * self.chunk_size, min((chunk_x + 1) * self.chunk_size, self.width)):
+                zones.append(self.zone(row * self.width + column))
+        return Chunk(chunk_x, chunk_y, tuple(zones))
+
+    def iter_chunks(self) -> Iterator[Chunk]:
+        """Generates the whole world one chunk at a time, so only one chunk is held at once."""
+        for chunk_y in range(self.chunks_high):
+            for chunk_x in range(self.chunks_wide):
+                yield self.chunk(chunk_x, chunk_y)
+
+    # ------------------ Game Objects ------------------ #
+
+    def create_world(self) -> map.World:
+        """Creates the World for this generator. Zone names aren't stored, they're worked out from the IDs."""
+        return map.World(width=self.width, height=self.height, zone_names=None)
+
+    def build_zone(self, zone: GeneratedZone, world: str) -> tuple[map.Zone, dict[str, map.Area]]:
+        """Turns a generated zone into the Zone and Area objects the game uses.
+
+        Args:
+            zone (GeneratedZone): The generated zone.
+            world (str): The ID the generator's world is registered under, see map.register_world().
+
+        Returns:
+            tuple[Zone, dict[str, Area]]: The zone, and its areas by name.
+        """
+        descriptions = [(area.name, area.description) for area in zone.areas]
+        game_zone = map.Zone(zone.name, zone.description, world=world, areas=descriptions)
+        areas = {
+            area.name: map.Area(
+                game_zone,
+                area.name,
+                area.description,
+                biome=area.biome,
+                difficulty=area.difficulty,
+            )
+            for area in zone.areas
+        }
+        return game_zone, areas
+
+
+# ------------------ __main__ ------------------ #
+
+if __name__ == "__main__":
+    generator = WorldGenerator(1000, 1000, seed=42)
+    for name in ("A1", "B2", "ALL1000"):
+        zone = generator.zone(name)
+        print(f"{zone.name} ({zone.biome}, difficulty {zone.difficulty}): {zone.description}")
+        for area in zone.areas:
+            print(f"    {area.name} ({area.biome}, difficulty {area.difficulty}): {area.description}")